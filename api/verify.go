@@ -12,6 +12,7 @@ import (
 
 	"license-bot-go/api/websocket"
 	"license-bot-go/db"
+	"license-bot-go/scrapers"
 )
 
 // handleVerifyAgent triggers license verification from the dashboard.
@@ -79,26 +80,8 @@ func (s *Server) handleVerifyAgent(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	// 2-pass match: prefer life-licensed active, then any active
-	var matchIdx = -1
-	for idx := range results {
-		if results[idx].Found && results[idx].Active && results[idx].IsLifeLicensed() {
-			matchIdx = idx
-			break
-		}
-	}
-	if matchIdx < 0 {
-		for idx := range results {
-			if results[idx].Found && results[idx].Active {
-				matchIdx = idx
-				break
-			}
-		}
-	}
-
-	if matchIdx >= 0 {
-		match := &results[matchIdx]
-
+	// Prefer life-licensed active, then any active
+	if match := scrapers.BestMatch(results); match != nil {
 		// Update agent
 		verified := true
 		stage := db.StageVerified
@@ -37,16 +37,10 @@ func (b *Bot) activateAgent(s *discordgo.Session, discordID, guildID int64, memb
 	guildIDStr := strconv.FormatInt(guildID, 10)
 
 	// Swap roles: remove Student + Licensed-Agent, add Active-Agent
-	if b.cfg.ActiveAgentRoleID != "" {
-		if err := s.GuildMemberRoleAdd(guildIDStr, userID, b.cfg.ActiveAgentRoleID); err != nil {
-			log.Printf("Activation: failed to add Active-Agent role: %v", err)
-		}
-	}
-	if b.cfg.StudentRoleID != "" {
-		s.GuildMemberRoleRemove(guildIDStr, userID, b.cfg.StudentRoleID)
-	}
-	if b.cfg.LicensedAgentRoleID != "" {
-		s.GuildMemberRoleRemove(guildIDStr, userID, b.cfg.LicensedAgentRoleID)
+	err := b.editMemberRoles(s, guildIDStr, userID,
+		[]string{b.cfg.ActiveAgentRoleID}, []string{b.cfg.StudentRoleID, b.cfg.LicensedAgentRoleID})
+	if err != nil {
+		log.Printf("Activation: failed to swap to Active-Agent role: %v", err)
 	}
 
 	// Post activation announcement
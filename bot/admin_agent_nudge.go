@@ -40,7 +40,7 @@ func (b *Bot) handleAgentNudge(s *discordgo.Session, i *discordgo.InteractionCre
 	embed := buildCheckinEmbed(name, weeksIn)
 	weekStartStr := time.Now().Truncate(24 * time.Hour).Format("2006-01-02")
 
-	channel, err := s.UserChannelCreate(targetUser.ID)
+	channelID, err := b.dmChannelID(s, targetUser.ID)
 	if err != nil {
 		s.InteractionRespond(i.Interaction, &discordgo.InteractionResponse{
 			Type: discordgo.InteractionResponseChannelMessageWithSource,
@@ -52,7 +52,7 @@ func (b *Bot) handleAgentNudge(s *discordgo.Session, i *discordgo.InteractionCre
 		return
 	}
 
-	_, sendErr := s.ChannelMessageSendComplex(channel.ID, &discordgo.MessageSend{
+	_, sendErr := s.ChannelMessageSendComplex(channelID, &discordgo.MessageSend{
 		Embeds: []*discordgo.MessageEmbed{embed},
 		Components: []discordgo.MessageComponent{
 			discordgo.ActionsRow{
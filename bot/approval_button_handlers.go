@@ -29,11 +29,8 @@ func (b *Bot) handleApprovalApprove(s *discordgo.Session, i *discordgo.Interacti
 		licenseStatus = agent.LicenseStatus
 	}
 
-	// Remove pending role, run sort
-	if b.cfg.PendingRoleID != "" {
-		s.GuildMemberRoleRemove(guildID, agentUserID, b.cfg.PendingRoleID)
-	}
-	go b.sortAndAssignRoles(s, agentUserID, guildID, req.Agency, licenseStatus)
+	// Run sort, removing the pending role in the same edit
+	go b.sortAndAssignRoles(s, agentUserID, guildID, req.Agency, licenseStatus, b.cfg.PendingRoleID)
 
 	// DM the agent
 	b.dmUser(s, agentUserID, fmt.Sprintf(
@@ -23,14 +23,14 @@ func (b *Bot) sendApprovalDM(s *discordgo.Session, ownerID, userID, fullName, ag
 		Timestamp: time.Now().Format(time.RFC3339),
 	}
 
-	channel, err := s.UserChannelCreate(ownerID)
+	channelID, err := b.dmChannelID(s, ownerID)
 	if err != nil {
 		log.Printf("Approval: failed to DM owner %s: %v", ownerID, err)
 		b.postApprovalToChannel(s, embed, reqID)
 		return
 	}
 
-	msg, err := s.ChannelMessageSendComplex(channel.ID, &discordgo.MessageSend{
+	msg, err := s.ChannelMessageSendComplex(channelID, &discordgo.MessageSend{
 		Embeds: []*discordgo.MessageEmbed{embed},
 		Components: []discordgo.MessageComponent{
 			discordgo.ActionsRow{
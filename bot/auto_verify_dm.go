@@ -11,19 +11,19 @@ import (
 )
 
 func (b *Bot) dmUser(s *discordgo.Session, userID, content string) {
-	channel, err := s.UserChannelCreate(userID)
+	channelID, err := b.dmChannelID(s, userID)
 	if err != nil {
 		log.Printf("Cannot create DM channel for %s: %v", userID, err)
 		return
 	}
-	_, err = s.ChannelMessageSend(channel.ID, content)
+	_, err = s.ChannelMessageSend(channelID, content)
 	if err != nil {
 		log.Printf("Cannot send DM to %s: %v", userID, err)
 	}
 }
 
 func (b *Bot) dmVerificationSuccess(s *discordgo.Session, e *discordgo.GuildMemberUpdate, match *scrapers.LicenseResult, state string) {
-	channel, err := s.UserChannelCreate(e.User.ID)
+	channelID, err := b.dmChannelID(s, e.User.ID)
 	if err != nil {
 		log.Printf("Cannot create DM channel for auto-verify: %v", err)
 		return
@@ -69,5 +69,5 @@ func (b *Bot) dmVerificationSuccess(s *discordgo.Session, e *discordgo.GuildMemb
 		Footer:      &discordgo.MessageEmbedFooter{Text: "VIPA License Verification"},
 	}
 
-	s.ChannelMessageSendEmbed(channel.ID, embed)
+	s.ChannelMessageSendEmbed(channelID, embed)
 }
@@ -29,15 +29,17 @@ type ModalTempData struct {
 }
 
 type Bot struct {
-	cfg              *config.Config
-	db               *db.DB
-	session          *discordgo.Session
-	registry         *scrapers.Registry
-	mailer           *email.Client
-	ghlClient        *ghl.Client
-	hub              interface{} // websocket.Hub
-	modalState       sync.Map // userID (string) -> *ModalTempData
-	welcomeMessages  sync.Map // userID (string) -> welcomeMsgRef{channelID, messageID}
+	cfg             *config.Config
+	db              *db.DB
+	session         *discordgo.Session
+	registry        *scrapers.Registry
+	mailer          *email.Client
+	ghlClient       *ghl.Client
+	hub             interface{} // websocket.Hub
+	modalState      sync.Map    // userID (string) -> *ModalTempData
+	welcomeMessages sync.Map    // userID (string) -> welcomeMsgRef{channelID, messageID}
+	lookupCache     sync.Map    // "STATE|first|last" -> cachedLookup
+	dmChannels      sync.Map    // userID (string) -> DM channel ID
 }
 
 // welcomeMsgRef stores the channel and message ID for a user's welcome message in #start-here.
@@ -56,7 +58,7 @@ func New(cfg *config.Config, database *db.DB, tlsClient *tlsclient.Client, hub i
 
 	var cs *captcha.CapSolver
 	if cfg.CapSolverAPIKey != "" {
-		cs = captcha.NewCapSolver(cfg.CapSolverAPIKey)
+		cs = captcha.NewCapSolver(cfg.CapSolverAPIKey, tlsClient.SharedSession)
 	}
 
 	registry := scrapers.NewRegistry(tlsClient, cs)
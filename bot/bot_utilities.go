@@ -3,9 +3,13 @@ package bot
 import (
 	"context"
 	"fmt"
+	"log"
 	"strconv"
+	"sync"
 	"time"
 
+	"github.com/bwmarrin/discordgo"
+
 	"license-bot-go/api/websocket"
 )
 
@@ -44,3 +48,37 @@ func (b *Bot) publishEvent(eventType string, data interface{}) {
 		h.Publish(websocket.NewEvent(eventType, data))
 	}
 }
+
+// runParallel runs independent side effects (DMs, emails, channel posts) concurrently and
+// waits for all of them, so the caller pays the slowest call rather than the sum.
+// A panic in one is logged under label and does not stop the others.
+func runParallel(label string, fns ...func()) {
+	var wg sync.WaitGroup
+	for _, fn := range fns {
+		wg.Add(1)
+		go func(fn func()) {
+			defer wg.Done()
+			defer func() {
+				if r := recover(); r != nil {
+					log.Printf("%s: panic: %v", label, r)
+				}
+			}()
+			fn()
+		}(fn)
+	}
+	wg.Wait()
+}
+
+// dmChannelID returns the DM channel for a user. A user's DM channel never changes, so
+// it is resolved once per process; UserChannelCreate is a REST call every time.
+func (b *Bot) dmChannelID(s *discordgo.Session, userID string) (string, error) {
+	if id, ok := b.dmChannels.Load(userID); ok {
+		return id.(string), nil
+	}
+	channel, err := s.UserChannelCreate(userID)
+	if err != nil {
+		return "", err
+	}
+	b.dmChannels.Store(userID, channel.ID)
+	return channel.ID, nil
+}
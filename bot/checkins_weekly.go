@@ -5,9 +5,12 @@ import (
 	"fmt"
 	"log"
 	"strconv"
+	"sync"
 	"time"
 
 	"github.com/bwmarrin/discordgo"
+
+	"license-bot-go/db"
 )
 
 // sendWeeklyCheckins sends check-in DMs to students in stages 1-4.
@@ -26,74 +29,104 @@ func (b *Bot) sendWeeklyCheckins(ctx context.Context) {
 	}
 	weekStart := now.AddDate(0, 0, -(weekday - 1)).Truncate(24 * time.Hour)
 
-	students, err := b.db.GetStudentsForCheckin(ctx, weekStart)
+	weekStartStr := weekStart.Format("2006-01-02")
+	components := []discordgo.MessageComponent{
+		discordgo.ActionsRow{
+			Components: []discordgo.MessageComponent{
+				discordgo.Button{
+					Label:    "\u2705 On Track",
+					Style:    discordgo.SuccessButton,
+					CustomID: fmt.Sprintf("vipa:checkin:on_track:%s", weekStartStr),
+				},
+				discordgo.Button{
+					Label:    "\u23f8\ufe0f Need Help",
+					Style:    discordgo.SecondaryButton,
+					CustomID: fmt.Sprintf("vipa:checkin:need_help:%s", weekStartStr),
+				},
+				discordgo.Button{
+					Label:    "\U0001f393 Got Licensed!",
+					Style:    discordgo.PrimaryButton,
+					CustomID: fmt.Sprintf("vipa:checkin:got_licensed:%s", weekStartStr),
+				},
+			},
+		},
+	}
+
+	// Students are streamed: DMs start as soon as each row is scanned, a few at a time.
+	sem := make(chan struct{}, 5)
+	var wg sync.WaitGroup
+	var mu sync.Mutex
+	count, sent := 0, 0
+	err := b.db.EachStudentForCheckin(ctx, weekStart, func(student db.Agent) error {
+		count++
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			defer func() {
+				if r := recover(); r != nil {
+					log.Printf("Checkins: send panic for %d: %v", student.DiscordID, r)
+				}
+			}()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			if b.sendCheckin(ctx, student, now, weekStart, components) {
+				mu.Lock()
+				sent++
+				mu.Unlock()
+			}
+		}()
+		return nil
+	})
 	if err != nil {
+		// Check-ins already started still finish below
 		log.Printf("Checkins: failed to get students: %v", err)
-		return
 	}
+	wg.Wait()
 
-	if len(students) == 0 {
-		log.Println("Checkins: no students need check-in this week")
+	if count == 0 {
+		if err == nil {
+			log.Println("Checkins: no students need check-in this week")
+		}
 		return
 	}
+	log.Printf("Checkins: sent check-ins to %d of %d students for week %s", sent, count, weekStartStr)
+}
 
-	weekStartStr := weekStart.Format("2006-01-02")
-	log.Printf("Checkins: sending check-ins to %d students for week %s", len(students), weekStartStr)
-
-	for _, student := range students {
-		userID := strconv.FormatInt(student.DiscordID, 10)
-
-		// Calculate weeks since join
-		weeksIn := int(now.Sub(student.CreatedAt).Hours() / (24 * 7))
-		if weeksIn < 1 {
-			weeksIn = 1
-		}
+// sendCheckin DMs one student their weekly check-in and records it as sent.
+// It reports whether the DM was delivered.
+func (b *Bot) sendCheckin(ctx context.Context, student db.Agent, now, weekStart time.Time, components []discordgo.MessageComponent) bool {
+	userID := strconv.FormatInt(student.DiscordID, 10)
 
-		name := student.FirstName
-		if name == "" {
-			name = "Agent"
-		}
+	// Calculate weeks since join
+	weeksIn := int(now.Sub(student.CreatedAt).Hours() / (24 * 7))
+	if weeksIn < 1 {
+		weeksIn = 1
+	}
 
-		embed := buildCheckinEmbed(name, weeksIn)
-
-		components := []discordgo.MessageComponent{
-			discordgo.ActionsRow{
-				Components: []discordgo.MessageComponent{
-					discordgo.Button{
-						Label:    "\u2705 On Track",
-						Style:    discordgo.SuccessButton,
-						CustomID: fmt.Sprintf("vipa:checkin:on_track:%s", weekStartStr),
-					},
-					discordgo.Button{
-						Label:    "\u23f8\ufe0f Need Help",
-						Style:    discordgo.SecondaryButton,
-						CustomID: fmt.Sprintf("vipa:checkin:need_help:%s", weekStartStr),
-					},
-					discordgo.Button{
-						Label:    "\U0001f393 Got Licensed!",
-						Style:    discordgo.PrimaryButton,
-						CustomID: fmt.Sprintf("vipa:checkin:got_licensed:%s", weekStartStr),
-					},
-				},
-			},
-		}
+	name := student.FirstName
+	if name == "" {
+		name = "Agent"
+	}
 
-		channel, err := b.session.UserChannelCreate(userID)
-		if err != nil {
-			log.Printf("Checkins: can't DM %s: %v", userID, err)
-			continue
-		}
+	embed := buildCheckinEmbed(name, weeksIn)
 
-		_, err = b.session.ChannelMessageSendComplex(channel.ID, &discordgo.MessageSend{
-			Embeds:     []*discordgo.MessageEmbed{embed},
-			Components: components,
-		})
-		if err != nil {
-			log.Printf("Checkins: failed to send to %s: %v", userID, err)
-			continue
-		}
+	channelID, err := b.dmChannelID(b.session, userID)
+	if err != nil {
+		log.Printf("Checkins: can't DM %s: %v", userID, err)
+		return false
+	}
 
-		b.db.RecordCheckinSent(ctx, student.DiscordID, weekStart)
-		log.Printf("Checkins: sent week %d check-in to %s (%s)", weeksIn, name, userID)
+	_, err = b.session.ChannelMessageSendComplex(channelID, &discordgo.MessageSend{
+		Embeds:     []*discordgo.MessageEmbed{embed},
+		Components: components,
+	})
+	if err != nil {
+		log.Printf("Checkins: failed to send to %s: %v", userID, err)
+		return false
 	}
+
+	b.db.RecordCheckinSent(ctx, student.DiscordID, weekStart)
+	log.Printf("Checkins: sent week %d check-in to %s (%s)", weeksIn, name, userID)
+	return true
 }
@@ -50,10 +50,10 @@ func (b *Bot) handleRestart(s *discordgo.Session, i *discordgo.InteractionCreate
 	b.db.LogActivity(context.Background(), userIDInt, "restart", "Onboarding restarted by staff")
 
 	// Send welcome DM to the target user
-	channel, err := s.UserChannelCreate(targetUser.ID)
+	channelID, err := b.dmChannelID(s, targetUser.ID)
 	if err == nil {
 		embed := buildWelcomeEmbed()
-		s.ChannelMessageSendComplex(channel.ID, &discordgo.MessageSend{
+		s.ChannelMessageSendComplex(channelID, &discordgo.MessageSend{
 			Embeds: []*discordgo.MessageEmbed{embed},
 			Components: []discordgo.MessageComponent{
 				discordgo.ActionsRow{
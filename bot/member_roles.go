@@ -0,0 +1,92 @@
+package bot
+
+import "github.com/bwmarrin/discordgo"
+
+// editMemberRoles adds and removes roles for one member with a single GuildMemberEdit,
+// instead of one REST call (and one rate-limit hit) per role. The edit replaces the whole
+// role list, so the member is fetched from the API right before it rather than taken from
+// the state cache or an interaction, either of which can miss a change made since. A
+// role changed by someone else between the read and the edit is still reverted, and the
+// read plus the edit cost two calls, so it is only worth it for more than two changes,
+// like the intake sort. Smaller changes, such as a Student/Licensed swap, go through the
+// per-role endpoints, as does everything when the member can't be read. Empty role IDs
+// are ignored, and a role in both add and remove ends up removed.
+func (b *Bot) editMemberRoles(s *discordgo.Session, guildID, userID string, add, remove []string) error {
+	if countRoleIDs(add)+countRoleIDs(remove) <= 2 {
+		return applyRolesIndividually(s, guildID, userID, add, remove)
+	}
+
+	member, err := s.GuildMember(guildID, userID)
+	if err != nil {
+		return applyRolesIndividually(s, guildID, userID, add, remove)
+	}
+	current := member.Roles
+
+	drop := make(map[string]bool, len(remove))
+	for _, id := range remove {
+		if id != "" {
+			drop[id] = true
+		}
+	}
+	have := make(map[string]bool, len(current)+len(add))
+	roles := make([]string, 0, len(current)+len(add))
+	changed := false
+	for _, id := range current {
+		if drop[id] {
+			changed = true
+			continue
+		}
+		have[id] = true
+		roles = append(roles, id)
+	}
+	for _, id := range add {
+		if id == "" || drop[id] || have[id] {
+			continue
+		}
+		have[id] = true
+		roles = append(roles, id)
+		changed = true
+	}
+	if !changed {
+		return nil
+	}
+
+	_, err = s.GuildMemberEdit(guildID, userID, &discordgo.GuildMemberParams{Roles: &roles})
+	return err
+}
+
+// countRoleIDs returns how many of ids are non-empty.
+func countRoleIDs(ids []string) int {
+	n := 0
+	for _, id := range ids {
+		if id != "" {
+			n++
+		}
+	}
+	return n
+}
+
+// applyRolesIndividually is the per-role fallback for editMemberRoles. It applies every
+// change and returns the first error.
+func applyRolesIndividually(s *discordgo.Session, guildID, userID string, add, remove []string) error {
+	drop := make(map[string]bool, len(remove))
+	var firstErr error
+	for _, id := range remove {
+		if id == "" {
+			continue
+		}
+		drop[id] = true
+		if err := s.GuildMemberRoleRemove(guildID, userID, id); err != nil && firstErr == nil {
+			firstErr = err
+		}
+	}
+	for _, id := range add {
+		if id == "" || drop[id] {
+			continue
+		}
+		if err := s.GuildMemberRoleAdd(guildID, userID, id); err != nil && firstErr == nil {
+			firstErr = err
+		}
+	}
+	return firstErr
+}
@@ -17,7 +17,7 @@ func (b *Bot) npnSingleState(s *discordgo.Session, i *discordgo.InteractionCreat
 	ctx, cancel := context.WithTimeout(context.Background(), 90*time.Second)
 	defer cancel()
 
-	results, err := scraper.LookupByName(ctx, firstName, lastName)
+	results, err := b.cachedLookupByName(ctx, scraper, state, firstName, lastName)
 	if err != nil {
 		b.followUp(s, i, fmt.Sprintf("**Lookup Error** for %s: %v", state, err))
 		return
@@ -3,8 +3,6 @@ package bot
 import (
 	"context"
 	"fmt"
-	"log"
-	"sync"
 	"time"
 
 	"github.com/bwmarrin/discordgo"
@@ -17,14 +15,7 @@ func (b *Bot) npnMultiState(s *discordgo.Session, i *discordgo.InteractionCreate
 	ctx, cancel := context.WithTimeout(context.Background(), 120*time.Second)
 	defer cancel()
 
-	var mu sync.Mutex
-	var allResults []scrapers.LicenseResult
-	var wg sync.WaitGroup
-
-	// Search all NAIC states in parallel (capped at 10 concurrent)
-	sem := make(chan struct{}, 10)
-
-	naicStates := make([]string, 0, len(scrapers.NAICStates))
+	naicStates := make([]string, 0, len(scrapers.NAICStates)+3)
 	for st := range scrapers.NAICStates {
 		naicStates = append(naicStates, st)
 	}
@@ -37,32 +28,16 @@ func (b *Bot) npnMultiState(s *discordgo.Session, i *discordgo.InteractionCreate
 		}
 	}
 
-	for _, st := range naicStates {
-		wg.Add(1)
-		go func(stateCode string) {
-			defer wg.Done()
-			sem <- struct{}{}
-			defer func() { <-sem }()
-
-			scraper := b.registry.GetScraper(stateCode)
-			results, err := scraper.LookupByName(ctx, firstName, lastName)
-			if err != nil {
-				log.Printf("NPN search %s error: %v", stateCode, err)
-				return
-			}
-
-			mu.Lock()
-			for _, r := range results {
-				if r.Found && r.NPN != "" {
-					allResults = append(allResults, r)
-				}
+	// Search all states in parallel (capped at 10 concurrent)
+	var allResults []scrapers.LicenseResult
+	for _, results := range b.registry.LookupByNameInStates(ctx, naicStates, firstName, lastName, 10) {
+		for _, r := range results {
+			if r.Found && r.NPN != "" {
+				allResults = append(allResults, r)
 			}
-			mu.Unlock()
-		}(st)
+		}
 	}
 
-	wg.Wait()
-
 	if len(allResults) == 0 {
 		b.followUp(s, i, fmt.Sprintf(
 			"No NPN found for **%s %s** across %d states.\n\n"+
@@ -2,6 +2,7 @@ package bot
 
 import (
 	"fmt"
+	"log"
 	"strconv"
 
 	"github.com/bwmarrin/discordgo"
@@ -11,18 +12,37 @@ import (
 
 func (b *Bot) auditAgentRoles(s *discordgo.Session, agents []db.AgentRow) []string {
 	var conflicts []string
+	// guildID -> userID -> roles, listed once per guild instead of one GuildMember call per agent
+	memberRoles := make(map[string]map[string][]string)
 	for _, agent := range agents {
 		userID := strconv.FormatInt(agent.DiscordID, 10)
 		guildID := strconv.FormatInt(agent.GuildID, 10)
 
-		member, err := s.GuildMember(guildID, userID)
-		if err != nil {
-			continue // Member left server
+		roles, ok := memberRoles[guildID]
+		if !ok {
+			var err error
+			if roles, err = listMemberRoles(s, guildID); err != nil {
+				log.Printf("Role audit: listing members of %s failed, falling back to per-member lookups: %v", guildID, err)
+			}
+			memberRoles[guildID] = roles // nil on error
+		}
+
+		var agentRoles []string
+		if roles != nil {
+			if agentRoles, ok = roles[userID]; !ok {
+				continue // Member left server
+			}
+		} else {
+			member, err := s.GuildMember(guildID, userID)
+			if err != nil {
+				continue // Member left server
+			}
+			agentRoles = member.Roles
 		}
 
-		hasStudent := roleInList(member.Roles, b.cfg.StudentRoleID)
-		hasLicensed := roleInList(member.Roles, b.cfg.LicensedAgentRoleID)
-		hasActive := roleInList(member.Roles, b.cfg.ActiveAgentRoleID)
+		hasStudent := roleInList(agentRoles, b.cfg.StudentRoleID)
+		hasLicensed := roleInList(agentRoles, b.cfg.LicensedAgentRoleID)
+		hasActive := roleInList(agentRoles, b.cfg.ActiveAgentRoleID)
 
 		// Conflict: both Student + Licensed
 		if hasStudent && hasLicensed {
@@ -41,3 +61,25 @@ func (b *Bot) auditAgentRoles(s *discordgo.Session, agents []db.AgentRow) []stri
 	}
 	return conflicts
 }
+
+// listMemberRoles pages through every member of a guild (1000 per request) and returns
+// their role IDs keyed by user ID.
+func listMemberRoles(s *discordgo.Session, guildID string) (map[string][]string, error) {
+	roles := make(map[string][]string)
+	afterID := ""
+	for {
+		members, err := s.GuildMembers(guildID, afterID, 1000)
+		if err != nil {
+			return nil, err
+		}
+		for _, m := range members {
+			if m.User != nil {
+				roles[m.User.ID] = m.Roles
+				afterID = m.User.ID
+			}
+		}
+		if len(members) < 1000 {
+			return roles, nil
+		}
+	}
+}
@@ -2,31 +2,27 @@ package bot
 
 import (
 	"fmt"
-	"time"
 
 	"github.com/bwmarrin/discordgo"
 
 	"license-bot-go/scrapers"
 )
 
-func (b *Bot) postSchedulerVerifyToChannel(match *scrapers.LicenseResult, state, userID string) {
-	channelID := b.verifyLogChannelID()
+// postSchedulerVerifyToChannel posts a scheduled auto-verify to the log channel. The
+// channel and embed template are built once per sweep by the caller; embed is passed by
+// value so each call fills in its own copy.
+func (b *Bot) postSchedulerVerifyToChannel(channelID string, embed discordgo.MessageEmbed, match *scrapers.LicenseResult, state, userID string) {
 	if channelID == "" {
 		return
 	}
 
-	embed := &discordgo.MessageEmbed{
-		Title: "License Auto-Verified (Scheduled Check)",
-		Description: fmt.Sprintf(
-			"<@%s> was automatically verified during a scheduled check.\n\n"+
-				"**Name:** %s\n"+
-				"**License #:** %s\n"+
-				"**State:** %s | **Status:** %s",
-			userID, match.FullName, nvl(match.LicenseNumber, "N/A"), state, match.Status,
-		),
-		Color:     0x2ECC71,
-		Timestamp: time.Now().Format(time.RFC3339),
-	}
+	embed.Description = fmt.Sprintf(
+		"<@%s> was automatically verified during a scheduled check.\n\n"+
+			"**Name:** %s\n"+
+			"**License #:** %s\n"+
+			"**State:** %s | **Status:** %s",
+		userID, match.FullName, nvl(match.LicenseNumber, "N/A"), state, match.Status,
+	)
 
-	b.session.ChannelMessageSendEmbed(channelID, embed)
+	b.session.ChannelMessageSendEmbed(channelID, &embed)
 }
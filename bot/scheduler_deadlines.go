@@ -21,24 +21,38 @@ func (b *Bot) handleExpiredDeadlines(ctx context.Context, mailer *email.Client)
 		return
 	}
 
-	for _, dl := range expired {
-		userID := strconv.FormatInt(dl.DiscordID, 10)
+	if len(expired) == 0 {
+		return
+	}
 
-		// DM the user
-		b.dmUser(b.session, userID,
-			"**Your 30-day verification deadline has passed.**\n\n"+
-				"An admin has been notified. Please contact your upline to discuss next steps.")
+	// Only the description varies per recruit; everything else is built once per sweep
+	adminChannelID := b.adminNotifyChannelID()
+	adminEmbed := discordgo.MessageEmbed{
+		Title:     "Verification Deadline Expired",
+		Color:     0xE74C3C, // Red
+		Timestamp: time.Now().Format(time.RFC3339),
+	}
 
-		// Email the user (if opted in)
-		if mailer != nil {
-			agent, err := b.db.GetAgent(ctx, dl.DiscordID)
-			if err == nil && agent != nil && agent.Email != "" && agent.EmailOptIn {
-				mailer.SendDeadlineExpired(agent.Email, dl.FirstName+" "+dl.LastName)
-			}
-		}
+	for _, dl := range expired {
+		userID := strconv.FormatInt(dl.DiscordID, 10)
 
-		// Notify admin channel
-		b.notifyAdmin(dl, userID)
+		// DM the user, email them (if opted in) and notify the admin channel concurrently
+		runParallel("Scheduler: expired deadline "+userID,
+			func() {
+				b.dmUser(b.session, userID,
+					"**Your 30-day verification deadline has passed.**\n\n"+
+						"An admin has been notified. Please contact your upline to discuss next steps.")
+			},
+			func() {
+				if mailer == nil {
+					return
+				}
+				if addr, err := b.db.GetOptedInEmail(ctx, dl.DiscordID); err == nil && addr != "" {
+					mailer.SendDeadlineExpired(addr, dl.FirstName+" "+dl.LastName)
+				}
+			},
+			func() { b.notifyAdmin(adminChannelID, adminEmbed, dl, userID) },
+		)
 
 		// Mark as admin notified
 		b.db.MarkAdminNotified(ctx, dl.DiscordID)
@@ -46,35 +60,36 @@ func (b *Bot) handleExpiredDeadlines(ctx context.Context, mailer *email.Client)
 	}
 }
 
-func (b *Bot) notifyAdmin(dl db.VerificationDeadline, userID string) {
-	channelID := b.cfg.AdminNotificationChannelID
-	if channelID == "" {
-		channelID = b.cfg.LicenseCheckChannelID
+// adminNotifyChannelID picks the channel for expired-deadline alerts.
+func (b *Bot) adminNotifyChannelID() string {
+	if b.cfg.AdminNotificationChannelID != "" {
+		return b.cfg.AdminNotificationChannelID
 	}
-	if channelID == "" {
-		channelID = b.cfg.HiringLogChannelID
+	if b.cfg.LicenseCheckChannelID != "" {
+		return b.cfg.LicenseCheckChannelID
 	}
+	return b.cfg.HiringLogChannelID
+}
+
+// notifyAdmin posts an expired-deadline alert. embed is the per-sweep template (passed by
+// value, so each call fills in its own copy).
+func (b *Bot) notifyAdmin(channelID string, embed discordgo.MessageEmbed, dl db.VerificationDeadline, userID string) {
 	if channelID == "" {
 		return
 	}
 
-	embed := &discordgo.MessageEmbed{
-		Title: "Verification Deadline Expired",
-		Description: fmt.Sprintf(
-			"<@%s> has not verified their license within 30 days.\n\n"+
-				"**Name:** %s %s\n"+
-				"**State:** %s\n"+
-				"**Status:** %s\n"+
-				"**Deadline:** %s\n\n"+
-				"Please follow up with this recruit.",
-			userID, dl.FirstName, dl.LastName,
-			nvl(dl.HomeState, "Unknown"),
-			dl.LicenseStatus,
-			dl.DeadlineAt.Format("January 2, 2006"),
-		),
-		Color:     0xE74C3C, // Red
-		Timestamp: time.Now().Format(time.RFC3339),
-	}
+	embed.Description = fmt.Sprintf(
+		"<@%s> has not verified their license within 30 days.\n\n"+
+			"**Name:** %s %s\n"+
+			"**State:** %s\n"+
+			"**Status:** %s\n"+
+			"**Deadline:** %s\n\n"+
+			"Please follow up with this recruit.",
+		userID, dl.FirstName, dl.LastName,
+		nvl(dl.HomeState, "Unknown"),
+		dl.LicenseStatus,
+		dl.DeadlineAt.Format("January 2, 2006"),
+	)
 
-	b.session.ChannelMessageSendEmbed(channelID, embed)
+	b.session.ChannelMessageSendEmbed(channelID, &embed)
 }
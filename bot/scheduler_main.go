@@ -3,11 +3,31 @@ package bot
 import (
 	"context"
 	"log"
+	"sync"
 	"time"
 
 	"license-bot-go/email"
 )
 
+var (
+	easternOnce sync.Once
+	eastern     *time.Location
+)
+
+// easternLocation returns America/New_York, loading the tz database only once.
+// Falls back to UTC if the zone data is missing so the scheduler never panics on In(nil).
+func easternLocation() *time.Location {
+	easternOnce.Do(func() {
+		loc, err := time.LoadLocation("America/New_York")
+		if err != nil {
+			log.Printf("Scheduler: failed to load America/New_York, using UTC: %v", err)
+			loc = time.UTC
+		}
+		eastern = loc
+	})
+	return eastern
+}
+
 // StartScheduler runs a background loop that checks deadlines every 24 hours.
 // It sends reminders at day 7, 14, and 21, and notifies admin when deadlines expire.
 func (b *Bot) StartScheduler(ctx context.Context, mailer *email.Client) {
@@ -52,8 +72,7 @@ func (b *Bot) runSchedulerCycle(mailer *email.Client) {
 	b.handleExpiredDeadlines(ctx, mailer)
 
 	// 4. Weekly check-ins (only on configured day)
-	loc, _ := time.LoadLocation("America/New_York")
-	nowET := time.Now().In(loc)
+	nowET := time.Now().In(easternLocation())
 	if int(nowET.Weekday()) == b.cfg.CheckinDay {
 		b.sendWeeklyCheckins(ctx)
 	}
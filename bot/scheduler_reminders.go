@@ -6,62 +6,147 @@ import (
 	"log"
 	"math"
 	"strconv"
+	"sync"
 	"time"
 
+	"license-bot-go/db"
 	"license-bot-go/email"
 )
 
+// reminderConcurrency caps how many reminders (DM + email) are in flight at once per sweep.
+// Emails are additionally paced by the mailer to stay within Resend's rate limit.
+const reminderConcurrency = 8
+
+// reminderInterval is how long after one reminder the next one becomes due.
+const reminderInterval = 6 * 24 * time.Hour
+
 // sendReminders sends DM + email reminders for deadlines approaching.
-// Reminders are sent at roughly day 7, 14, and 21 (every 7 days).
+// Reminders are sent at roughly day 7, 14, and 21 (every 7 days). Emails that failed
+// on an earlier sweep are retried on their own, without repeating the DM.
 func (b *Bot) sendReminders(ctx context.Context, mailer *email.Client) {
 	// Get deadlines that haven't had a reminder in the last 6 days
-	deadlines, err := b.db.GetPendingDeadlines(ctx, 6*24*time.Hour)
+	deadlines, err := b.db.GetPendingDeadlines(ctx, reminderInterval)
 	if err != nil {
 		log.Printf("Scheduler: failed to get reminder deadlines: %v", err)
 		return
 	}
+	var retries []db.VerificationDeadline
+	if mailer != nil {
+		retries, err = b.db.GetReminderEmailRetries(ctx, reminderInterval)
+		if err != nil {
+			// Still send the reminders that are due
+			log.Printf("Scheduler: failed to get reminder email retries: %v", err)
+		}
+	}
 
+	// Each reminder waits on Discord and Resend round trips, so send a few at a time
+	sem := make(chan struct{}, reminderConcurrency)
+	var wg sync.WaitGroup
 	for _, dl := range deadlines {
 		daysLeft := int(math.Ceil(time.Until(dl.DeadlineAt).Hours() / 24))
 		if daysLeft > 25 {
 			continue // Too early for reminders (first week)
 		}
 
-		userID := strconv.FormatInt(dl.DiscordID, 10)
-
-		// Discord DM reminder
-		var urgency string
-		switch {
-		case daysLeft <= 7:
-			urgency = "**URGENT:** "
-		case daysLeft <= 14:
-			urgency = "**Reminder:** "
-		default:
-			urgency = ""
-		}
+		wg.Add(1)
+		go func(dl db.VerificationDeadline, daysLeft int) {
+			defer wg.Done()
+			defer func() {
+				if r := recover(); r != nil {
+					log.Printf("Scheduler: reminder panic for %d: %v", dl.DiscordID, r)
+				}
+			}()
+			sem <- struct{}{}
+			defer func() { <-sem }()
 
-		msg := fmt.Sprintf(
-			"%sYou have **%d days** left to get your insurance license verified.\n\n"+
-				"We're checking state records automatically every day. "+
-				"As soon as your license shows up, you'll be promoted to **Licensed Producer** automatically.\n\n"+
-				"Want to check now? Use `/verify first_name:YourFirst last_name:YourLast state:XX`\n"+
-				"Need help? Contact your upline.",
-			urgency, daysLeft)
-
-		b.dmUser(b.session, userID, msg)
-
-		// Email reminder (if opted in)
-		if mailer != nil {
-			agent, err := b.db.GetAgent(ctx, dl.DiscordID)
-			if err == nil && agent != nil && agent.Email != "" && agent.EmailOptIn {
-				if err := mailer.SendReminder(agent.Email, dl.FirstName+" "+dl.LastName, daysLeft); err != nil {
-					log.Printf("Scheduler: email failed for %d: %v", dl.DiscordID, err)
+			b.sendReminder(ctx, mailer, dl, daysLeft)
+		}(dl, daysLeft)
+	}
+	for _, dl := range retries {
+		daysLeft := int(math.Ceil(time.Until(dl.DeadlineAt).Hours() / 24))
+
+		wg.Add(1)
+		go func(dl db.VerificationDeadline, daysLeft int) {
+			defer wg.Done()
+			defer func() {
+				if r := recover(); r != nil {
+					log.Printf("Scheduler: reminder email retry panic for %d: %v", dl.DiscordID, r)
 				}
+			}()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			b.retryReminderEmail(ctx, mailer, dl, daysLeft)
+		}(dl, daysLeft)
+	}
+	wg.Wait()
+}
+
+// sendReminder DMs one recruit (and emails them if opted in) about their deadline.
+func (b *Bot) sendReminder(ctx context.Context, mailer *email.Client, dl db.VerificationDeadline, daysLeft int) {
+	userID := strconv.FormatInt(dl.DiscordID, 10)
+
+	// Discord DM reminder
+	var urgency string
+	if label, _ := email.ReminderUrgency(daysLeft); label != "" {
+		urgency = "**" + label + ":** "
+	}
+
+	msg := fmt.Sprintf(
+		"%sYou have **%d days** left to get your insurance license verified.\n\n"+
+			"We're checking state records automatically every day. "+
+			"As soon as your license shows up, you'll be promoted to **Licensed Producer** automatically.\n\n"+
+			"Want to check now? Use `/verify first_name:YourFirst last_name:YourLast state:XX`\n"+
+			"Need help? Contact your upline.",
+		urgency, daysLeft)
+
+	delivered := false
+	if channelID, err := b.dmChannelID(b.session, userID); err != nil {
+		log.Printf("Cannot create DM channel for %s: %v", userID, err)
+	} else if _, err := b.session.ChannelMessageSend(channelID, msg); err != nil {
+		log.Printf("Cannot send DM to %s: %v", userID, err)
+	} else {
+		delivered = true
+	}
+
+	// Email reminder (if opted in). A failed email is retried by later sweeps on its own.
+	emailPending := false
+	if mailer != nil {
+		if addr, err := b.db.GetOptedInEmail(ctx, dl.DiscordID); err == nil && addr != "" {
+			if err := mailer.SendReminder(addr, dl.FirstName+" "+dl.LastName, daysLeft); err != nil {
+				log.Printf("Scheduler: email failed for %d: %v", dl.DiscordID, err)
+				emailPending = true
+			} else {
+				delivered = true
 			}
 		}
+	}
+
+	if !delivered {
+		// Nothing reached them; leave the reminder due so the next sweep tries again
+		return
+	}
+
+	// Mark reminder sent
+	b.db.UpdateReminderSent(ctx, dl.DiscordID, emailPending)
+	log.Printf("Scheduler: sent %d-day reminder to %d (%s %s)", daysLeft, dl.DiscordID, dl.FirstName, dl.LastName)
+}
 
-		// Mark reminder sent
-		b.db.UpdateReminderSent(ctx, dl.DiscordID)
-		log.Printf("Scheduler: sent %d-day reminder to %d (%s %s)", daysLeft, dl.DiscordID, dl.FirstName, dl.LastName)
+// retryReminderEmail re-sends a reminder email that failed on an earlier sweep. The DM
+// for that reminder already went out, so it is not repeated.
+func (b *Bot) retryReminderEmail(ctx context.Context, mailer *email.Client, dl db.VerificationDeadline, daysLeft int) {
+	addr, err := b.db.GetOptedInEmail(ctx, dl.DiscordID)
+	if err != nil {
+		log.Printf("Scheduler: email lookup failed for %d: %v", dl.DiscordID, err)
+		return
+	}
+	if addr != "" {
+		if err := mailer.SendReminder(addr, dl.FirstName+" "+dl.LastName, daysLeft); err != nil {
+			log.Printf("Scheduler: email retry failed for %d: %v", dl.DiscordID, err)
+			return
+		}
+		log.Printf("Scheduler: sent %d-day reminder email to %d on retry", daysLeft, dl.DiscordID)
 	}
+	// Sent, or they have opted out since
+	b.db.ClearReminderEmailPending(ctx, dl.DiscordID)
 }
@@ -5,69 +5,200 @@ import (
 	"fmt"
 	"log"
 	"strconv"
+	"strings"
+	"sync"
 	"time"
 
+	"github.com/bwmarrin/discordgo"
+
 	"license-bot-go/db"
 	"license-bot-go/email"
+	"license-bot-go/scrapers"
 )
 
+// verifiedDeadline pairs a pending deadline with the license that satisfied it.
+type verifiedDeadline struct {
+	dl    db.PendingVerification
+	match *scrapers.LicenseResult
+}
+
+// stateLookup is the per-state scraper and concurrency slot shared by one sweep.
+type stateLookup struct {
+	scraper scrapers.Scraper
+	sem     chan struct{}
+}
+
+// sweepSettings holds values that are fixed for the whole re-check sweep, resolved once
+// up front instead of per promoted agent.
+type sweepSettings struct {
+	licensedRoleID string
+	studentRoleID  string
+	logChannelID   string
+	logEmbed       discordgo.MessageEmbed // log-channel post template; only the description varies
+}
+
 // retryVerifications attempts auto-verify for all pending deadlines.
+// Lookups are network-bound, so they run concurrently, capped at
+// LicenseCheckConcurrency overall and LicenseCheckPerState per state so a
+// cluster of agents in one state doesn't hammer a single DOI. Matches are then
+// persisted in one batch before the agents are promoted and notified.
 func (b *Bot) retryVerifications(ctx context.Context, mailer *email.Client) {
-	deadlines, err := b.db.GetPendingDeadlines(ctx, 0) // Get all pending
-	if err != nil {
-		log.Printf("Scheduler: failed to get pending deadlines: %v", err)
-		return
+	concurrency := b.cfg.LicenseCheckConcurrency
+	if concurrency <= 0 {
+		concurrency = 10
+	}
+	perState := b.cfg.LicenseCheckPerState
+	if perState <= 0 || perState > concurrency {
+		perState = concurrency
 	}
+	sem := make(chan struct{}, concurrency)
+	startedAt := time.Now()
+	b.pruneLookupCache()
 
-	for _, dl := range deadlines {
-		if dl.FirstName == "" || dl.LastName == "" || dl.HomeState == "" {
-			continue
+	var mu sync.Mutex
+	var wg sync.WaitGroup
+	checked, failed := 0, 0
+	var matches []verifiedDeadline
+
+	// One scraper and slot pool per state, so agents in the same state share it (and its connections).
+	byState := make(map[string]stateLookup)
+
+	// Rows are streamed: lookups start as soon as each deadline is scanned.
+	err := b.db.EachPendingVerification(ctx, func(dl db.PendingVerification) error {
+		// Normalize once; the lookup, cache, DB rows and messages all use this code
+		state := strings.ToUpper(strings.TrimSpace(dl.HomeState))
+		if len(state) != 2 {
+			log.Printf("Scheduler: skipping %d: invalid state code %q", dl.DiscordID, dl.HomeState)
+			mu.Lock()
+			checked++
+			failed++
+			mu.Unlock()
+			return nil
 		}
+		dl.HomeState = state
+		lookup, ok := byState[state]
+		if !ok {
+			lookup = stateLookup{scraper: b.registry.GetScraper(state), sem: make(chan struct{}, perState)}
+			byState[state] = lookup
+		}
+
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			defer func() {
+				if r := recover(); r != nil {
+					log.Printf("Scheduler: retryVerification panic for %d: %v", dl.DiscordID, r)
+				}
+			}()
+			// Take the state slot first so waiting on a busy DOI doesn't hold a global slot
+			lookup.sem <- struct{}{}
+			defer func() { <-lookup.sem }()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			verifyCtx, cancel := context.WithTimeout(ctx, 90*time.Second)
+			result := b.lookupLicense(verifyCtx, lookup.scraper, dl.FirstName, dl.LastName, dl.HomeState)
+			cancel()
+
+			mu.Lock()
+			checked++
+			if result.Found && result.Match != nil {
+				matches = append(matches, verifiedDeadline{dl: dl, match: result.Match})
+			} else if result.Error != "" {
+				failed++
+			}
+			mu.Unlock()
+		}()
+		return nil
+	})
+	if err != nil {
+		// Lookups already started still finish and are persisted below
+		log.Printf("Scheduler: failed to read pending deadlines: %v", err)
+	}
 
-		verifyCtx, cancel := context.WithTimeout(ctx, 90*time.Second)
-		result := b.performVerification(verifyCtx, dl.FirstName, dl.LastName, dl.HomeState, dl.DiscordID, dl.GuildID)
-		cancel()
+	wg.Wait()
 
-		if result.Found && result.Match != nil {
-			log.Printf("Scheduler: auto-verified %s %s (%d)", dl.FirstName, dl.LastName, dl.DiscordID)
-			b.db.MarkDeadlineVerified(ctx, dl.DiscordID)
+	// Persist every match in one transaction per table
+	upserts := make([]db.AgentUpsert, 0, len(matches))
+	checks := make([]db.LicenseCheck, 0, len(matches))
+	for _, v := range matches {
+		upserts = append(upserts, db.AgentUpsert{
+			DiscordID: v.dl.DiscordID,
+			GuildID:   v.dl.GuildID,
+			Updates:   verifiedAgentUpdate(v.dl.FirstName, v.dl.LastName, v.dl.HomeState, v.match),
+		})
+		check := verifiedLicenseCheck(v.dl.DiscordID, v.dl.GuildID, v.dl.FirstName, v.dl.LastName, v.dl.HomeState, v.match)
+		check.CheckedAt = startedAt // every check from one sweep carries the sweep's start time
+		checks = append(checks, check)
+	}
+	if err := b.db.UpsertAgents(ctx, upserts); err != nil {
+		log.Printf("Scheduler: failed to save %d verified agents: %v", len(upserts), err)
+	}
+	if err := b.db.SaveLicenseChecks(ctx, checks); err != nil {
+		log.Printf("Scheduler: failed to save %d license checks: %v", len(checks), err)
+	}
+
+	sweep := sweepSettings{
+		licensedRoleID: b.cfg.LicensedAgentRoleID,
+		studentRoleID:  b.cfg.StudentRoleID,
+		logChannelID:   b.verifyLogChannelID(),
+		logEmbed: discordgo.MessageEmbed{
+			Title:     "License Auto-Verified (Scheduled Check)",
+			Color:     0x2ECC71,
+			Timestamp: time.Now().Format(time.RFC3339),
+		},
+	}
+	for _, v := range matches {
+		b.promoteVerified(ctx, mailer, sweep, v.dl, v.match)
+	}
+	log.Printf("Scheduler: re-checked %d pending deadlines (%d verified, %d errors)", checked, len(matches), failed)
+}
 
-			// Assign role and notify
-			userID := strconv.FormatInt(dl.DiscordID, 10)
-			guildID := strconv.FormatInt(dl.GuildID, 10)
+// promoteVerified closes out a pending deadline whose license was found: it marks the
+// deadline verified, swaps roles and sends the usual notifications.
+func (b *Bot) promoteVerified(ctx context.Context, mailer *email.Client, sweep sweepSettings, dl db.PendingVerification, match *scrapers.LicenseResult) {
+	log.Printf("Scheduler: auto-verified %s %s (%d)", dl.FirstName, dl.LastName, dl.DiscordID)
+	b.db.MarkDeadlineVerified(ctx, dl.DiscordID)
 
-			if b.cfg.LicensedAgentRoleID != "" {
-				b.session.GuildMemberRoleAdd(guildID, userID, b.cfg.LicensedAgentRoleID)
+	userID := strconv.FormatInt(dl.DiscordID, 10)
+	guildID := strconv.FormatInt(dl.GuildID, 10)
+
+	// Roles, DM, email and the log-channel post are independent network calls
+	runParallel("Scheduler: promote "+userID,
+		func() {
+			if sweep.licensedRoleID != "" {
+				b.session.GuildMemberRoleAdd(guildID, userID, sweep.licensedRoleID)
 			}
-			if b.cfg.StudentRoleID != "" {
-				b.session.GuildMemberRoleRemove(guildID, userID, b.cfg.StudentRoleID)
+			if sweep.studentRoleID != "" {
+				b.session.GuildMemberRoleRemove(guildID, userID, sweep.studentRoleID)
 			}
-
-			// Discord DM
+		},
+		func() {
 			b.dmUser(b.session, userID, fmt.Sprintf(
 				"**Great news!** Your license has been verified for **%s %s** in **%s**!\n\n"+
 					"You've been promoted to **Licensed Agent**. Use `/contract` to book your contracting appointment.",
 				dl.FirstName, dl.LastName, dl.HomeState))
-
+		},
+		func() {
 			// Email notification (if opted in)
-			if mailer != nil {
-				agent, err := b.db.GetAgent(ctx, dl.DiscordID)
-				if err == nil && agent != nil && agent.Email != "" && agent.EmailOptIn {
-					licNum := "N/A"
-					if result.Match.LicenseNumber != "" {
-						licNum = result.Match.LicenseNumber
-					}
-					if err := mailer.SendVerificationSuccess(agent.Email, dl.FirstName+" "+dl.LastName, dl.HomeState, licNum); err != nil {
-						log.Printf("Scheduler: email failed for %d: %v", dl.DiscordID, err)
-					}
+			if mailer == nil {
+				return
+			}
+			if addr, err := b.db.GetOptedInEmail(ctx, dl.DiscordID); err == nil && addr != "" {
+				licNum := "N/A"
+				if match.LicenseNumber != "" {
+					licNum = match.LicenseNumber
+				}
+				if err := mailer.SendVerificationSuccess(addr, dl.FirstName+" "+dl.LastName, dl.HomeState, licNum); err != nil {
+					log.Printf("Scheduler: email failed for %d: %v", dl.DiscordID, err)
 				}
 			}
+		},
+		func() {
+			b.postSchedulerVerifyToChannel(sweep.logChannelID, sweep.logEmbed, match, dl.HomeState, userID)
+		},
+	)
 
-			// Post to channel
-			b.postSchedulerVerifyToChannel(result.Match, dl.HomeState, userID)
-
-			// GHL sync
-			go b.syncGHLStage(dl.DiscordID, db.StageVerified)
-		}
-	}
+	// GHL sync
+	go b.syncGHLStage(dl.DiscordID, db.StageVerified)
 }
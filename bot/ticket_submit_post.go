@@ -15,17 +15,11 @@ func (b *Bot) postTicketToThread(s *discordgo.Session, i *discordgo.InteractionC
 	s.ThreadMemberAdd(thread.ID, userID)
 
 	// Add staff members to the thread
-	staffRoles := b.cfg.StaffRoleIDList()
 	members, err := s.GuildMembers(i.GuildID, "", 1000)
 	if err == nil {
 		for _, m := range members {
-			for _, memberRoleID := range m.Roles {
-				for _, staffRoleID := range staffRoles {
-					if memberRoleID == staffRoleID {
-						s.ThreadMemberAdd(thread.ID, m.User.ID)
-						break
-					}
-				}
+			if b.cfg.IsStaff(m.Roles) {
+				s.ThreadMemberAdd(thread.ID, m.User.ID)
 			}
 		}
 	}
@@ -0,0 +1,82 @@
+package bot
+
+import (
+	"context"
+	"strings"
+	"time"
+
+	"license-bot-go/scrapers"
+)
+
+// cachedLookup is a positive LookupByName result kept so the daily sweep (and repeat
+// /verify runs) can skip a DOI round-trip for someone who was just verified.
+type cachedLookup struct {
+	results  []scrapers.LicenseResult
+	cachedAt time.Time
+}
+
+func lookupCacheKey(state, firstName, lastName string) string {
+	return strings.ToUpper(state) + "|" + strings.ToLower(firstName) + "|" + strings.ToLower(lastName)
+}
+
+// cachedLookupByName is scraper.LookupByName read through the lookup cache: a fresh
+// positive result is reused, anything else is scraped and then offered to the cache.
+func (b *Bot) cachedLookupByName(ctx context.Context, scraper scrapers.Scraper, state, firstName, lastName string) ([]scrapers.LicenseResult, error) {
+	if results, ok := b.getCachedLookup(state, firstName, lastName); ok {
+		return results, nil
+	}
+	results, err := scraper.LookupByName(ctx, firstName, lastName)
+	if err != nil {
+		return nil, err
+	}
+	b.cacheLookup(state, firstName, lastName, results)
+	return results, nil
+}
+
+// getCachedLookup returns a fresh cached result for the name/state, if any.
+func (b *Bot) getCachedLookup(state, firstName, lastName string) ([]scrapers.LicenseResult, bool) {
+	ttl := time.Duration(b.cfg.LicenseLookupTTLHours) * time.Hour
+	if ttl <= 0 {
+		return nil, false
+	}
+	key := lookupCacheKey(state, firstName, lastName)
+	v, ok := b.lookupCache.Load(key)
+	if !ok {
+		return nil, false
+	}
+	entry := v.(cachedLookup)
+	if time.Since(entry.cachedAt) > ttl {
+		b.lookupCache.Delete(key)
+		return nil, false
+	}
+	return entry.results, true
+}
+
+// cacheLookup stores results only when they contain an active license; misses and
+// errors are always re-scraped so a newly issued license is picked up promptly.
+func (b *Bot) cacheLookup(state, firstName, lastName string, results []scrapers.LicenseResult) {
+	if b.cfg.LicenseLookupTTLHours <= 0 {
+		return
+	}
+	for _, r := range results {
+		if r.Found && r.Active {
+			b.lookupCache.Store(lookupCacheKey(state, firstName, lastName), cachedLookup{
+				results:  results,
+				cachedAt: time.Now(),
+			})
+			return
+		}
+	}
+}
+
+// pruneLookupCache drops expired entries. Reads only evict the key they touch, so this
+// keeps the cache bounded by the TTL rather than by every name ever looked up.
+func (b *Bot) pruneLookupCache() {
+	ttl := time.Duration(b.cfg.LicenseLookupTTLHours) * time.Hour
+	b.lookupCache.Range(func(key, v interface{}) bool {
+		if ttl <= 0 || time.Since(v.(cachedLookup).cachedAt) > ttl {
+			b.lookupCache.Delete(key)
+		}
+		return true
+	})
+}
@@ -17,7 +17,7 @@ func (b *Bot) dmNextSteps(s *discordgo.Session, i *discordgo.InteractionCreate,
 		}
 	}()
 
-	channel, err := s.UserChannelCreate(i.Member.User.ID)
+	channelID, err := b.dmChannelID(s, i.Member.User.ID)
 	if err != nil {
 		log.Printf("Cannot create DM channel: %v", err)
 		return
@@ -36,5 +36,5 @@ func (b *Bot) dmNextSteps(s *discordgo.Session, i *discordgo.InteractionCreate,
 		},
 	}
 
-	s.ChannelMessageSendEmbed(channel.ID, embed)
+	s.ChannelMessageSendEmbed(channelID, embed)
 }
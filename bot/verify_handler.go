@@ -77,7 +77,7 @@ func (b *Bot) handleVerify(s *discordgo.Session, i *discordgo.InteractionCreate)
 	if phone != "" {
 		cleanPhone := cleanPhoneNumber(phone)
 		if cleanPhone != "" {
-			b.db.UpsertAgent(context.Background(), userIDInt, guildIDInt, db.AgentUpdate{
+			b.db.UpsertAgentIfChanged(context.Background(), userIDInt, guildIDInt, db.AgentUpdate{
 				PhoneNumber: &cleanPhone,
 			})
 		}
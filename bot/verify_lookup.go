@@ -30,26 +30,10 @@ func (b *Bot) performVerifyLookup(s *discordgo.Session, i *discordgo.Interaction
 		b.followUp(s, i, msg)
 		return
 	}
+	b.cacheLookup(state, firstName, lastName, results)
 
-	// Find best match
-	var match *scrapers.LicenseResult
-
-	// First pass: prefer life-licensed active results
-	for idx := range results {
-		if results[idx].Found && results[idx].Active && results[idx].IsLifeLicensed() {
-			match = &results[idx]
-			break
-		}
-	}
-	// Second pass: any active result
-	if match == nil {
-		for idx := range results {
-			if results[idx].Found && results[idx].Active {
-				match = &results[idx]
-				break
-			}
-		}
-	}
+	// Find best match: prefer life-licensed active, then any active
+	match := scrapers.BestMatch(results)
 
 	// Respond based on result
 	b.handleVerifyResult(s, i, match, results, firstName, lastName, state, userID, userIDInt, guildIDInt)
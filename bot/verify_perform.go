@@ -22,57 +22,25 @@ func (b *Bot) performVerification(ctx context.Context, firstName, lastName, stat
 		return VerifyResult{Error: "invalid state code"}
 	}
 
-	scraper := b.registry.GetScraper(state)
+	result := b.lookupLicense(ctx, b.registry.GetScraper(state), firstName, lastName, state)
+	if result.Found && result.Match != nil {
+		b.db.UpsertAgentIfChanged(ctx, discordID, guildID, verifiedAgentUpdate(firstName, lastName, state, result.Match))
+		b.db.SaveLicenseCheck(ctx, verifiedLicenseCheck(discordID, guildID, firstName, lastName, state, result.Match))
+	}
+	return result
+}
 
-	results, err := scraper.LookupByName(ctx, firstName, lastName)
+// lookupLicense runs the name lookup against an already-resolved scraper and picks the
+// best match. It does not write to the DB, so batch callers can persist results together.
+func (b *Bot) lookupLicense(ctx context.Context, scraper scrapers.Scraper, firstName, lastName, state string) VerifyResult {
+	results, err := b.cachedLookupByName(ctx, scraper, state, firstName, lastName)
 	if err != nil {
 		msg := fmt.Sprintf("Lookup error for %s: %v", state, err)
 		return VerifyResult{Error: msg}
 	}
 
 	// Find best match: prefer life-licensed active results
-	var match *scrapers.LicenseResult
-	for idx := range results {
-		if results[idx].Found && results[idx].Active && results[idx].IsLifeLicensed() {
-			match = &results[idx]
-			break
-		}
-	}
-	if match == nil {
-		for idx := range results {
-			if results[idx].Found && results[idx].Active {
-				match = &results[idx]
-				break
-			}
-		}
-	}
-
-	if match != nil {
-		// Save to DB
-		verified := true
-		stage := db.StageVerified
-		b.db.UpsertAgent(ctx, discordID, guildID, db.AgentUpdate{
-			FirstName:       &firstName,
-			LastName:        &lastName,
-			State:           &state,
-			LicenseVerified: &verified,
-			LicenseNPN:      &match.NPN,
-			CurrentStage:    &stage,
-		})
-		b.db.SaveLicenseCheck(ctx, db.LicenseCheck{
-			DiscordID:      discordID,
-			GuildID:        guildID,
-			FirstName:      firstName,
-			LastName:       lastName,
-			State:          state,
-			NPN:            match.NPN,
-			LicenseNumber:  match.LicenseNumber,
-			LicenseType:    match.LicenseType,
-			LicenseStatus:  match.Status,
-			ExpirationDate: match.ExpirationDate,
-			LOAs:           match.LOAs,
-			Found:          true,
-		})
+	if match := scrapers.BestMatch(results); match != nil {
 		return VerifyResult{Found: true, Match: match}
 	}
 
@@ -85,3 +53,35 @@ func (b *Bot) performVerification(ctx context.Context, firstName, lastName, stat
 		Message: fmt.Sprintf("No active license found for %s %s in %s", firstName, lastName, state),
 	}
 }
+
+// verifiedAgentUpdate marks the agent as licensed and moves them to the verified stage.
+func verifiedAgentUpdate(firstName, lastName, state string, match *scrapers.LicenseResult) db.AgentUpdate {
+	verified := true
+	stage := db.StageVerified
+	return db.AgentUpdate{
+		FirstName:       &firstName,
+		LastName:        &lastName,
+		State:           &state,
+		LicenseVerified: &verified,
+		LicenseNPN:      &match.NPN,
+		CurrentStage:    &stage,
+	}
+}
+
+// verifiedLicenseCheck builds the license_checks row for a successful match.
+func verifiedLicenseCheck(discordID, guildID int64, firstName, lastName, state string, match *scrapers.LicenseResult) db.LicenseCheck {
+	return db.LicenseCheck{
+		DiscordID:      discordID,
+		GuildID:        guildID,
+		FirstName:      firstName,
+		LastName:       lastName,
+		State:          state,
+		NPN:            match.NPN,
+		LicenseNumber:  match.LicenseNumber,
+		LicenseType:    match.LicenseType,
+		LicenseStatus:  match.Status,
+		ExpirationDate: match.ExpirationDate,
+		LOAs:           match.LOAs,
+		Found:          true,
+	}
+}
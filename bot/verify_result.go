@@ -25,7 +25,7 @@ func (b *Bot) handleVerifySuccess(s *discordgo.Session, i *discordgo.Interaction
 	match *scrapers.LicenseResult, firstName, lastName, state, userID string, userIDInt, guildIDInt int64) {
 	verified := true
 	stg := db.StageVerified
-	b.db.UpsertAgent(context.Background(), userIDInt, guildIDInt, db.AgentUpdate{
+	b.db.UpsertAgentIfChanged(context.Background(), userIDInt, guildIDInt, db.AgentUpdate{
 		FirstName:       &firstName,
 		LastName:        &lastName,
 		State:           &state,
@@ -1,23 +1,35 @@
 package bot
 
-import "strings"
-
+// cleanPhoneNumber normalizes a US phone number to E.164 (+1XXXXXXXXXX), or "" if invalid.
+// Digits are collected into a fixed stack buffer in one pass; anything over 11 digits
+// is rejected as soon as it is seen, and the result is built with a single allocation.
 func cleanPhoneNumber(phone string) string {
-	digits := strings.Map(func(r rune) rune {
-		if r >= '0' && r <= '9' {
-			return r
+	var buf [13]byte // "+1" + up to 11 digits
+	buf[0], buf[1] = '+', '1'
+	n := 2
+	for i := 0; i < len(phone); i++ {
+		c := phone[i]
+		if c < '0' || c > '9' {
+			continue
+		}
+		if n == len(buf) {
+			return ""
 		}
-		return -1
-	}, phone)
+		buf[n] = c
+		n++
+	}
+	digits := buf[2:n]
 	// Remove leading 1 for US numbers
 	if len(digits) == 11 && digits[0] == '1' {
 		digits = digits[1:]
+		copy(buf[2:], digits)
+		n--
 	}
 	// Require exactly 10 digits for a valid US phone number
-	if len(digits) != 10 {
+	if n != 12 {
 		return ""
 	}
-	return "+1" + digits
+	return string(buf[:n])
 }
 
 func nvl(s, fallback string) string {
@@ -0,0 +1,29 @@
+package bot
+
+import "testing"
+
+func TestCleanPhoneNumber(t *testing.T) {
+	tests := []struct {
+		in   string
+		want string
+	}{
+		{"5551234567", "+15551234567"},
+		{"(555) 123-4567", "+15551234567"},
+		{"555.123.4567", "+15551234567"},
+		{"+1 555 123 4567", "+15551234567"},
+		{"1-555-123-4567", "+15551234567"},
+		{"11234567890", "+11234567890"},
+		{"tel: 555-123-4567 ", "+15551234567"},
+		{"", ""},
+		{"555-1234", ""},
+		{"25551234567", ""},   // 11 digits without a leading 1
+		{"155512345678", ""},  // 12 digits
+		{"1555123456789", ""}, // more digits than the buffer holds
+		{"555１234567", ""},    // full-width digits are not digits
+	}
+	for _, tt := range tests {
+		if got := cleanPhoneNumber(tt.in); got != tt.want {
+			t.Errorf("cleanPhoneNumber(%q) = %q, want %q", tt.in, got, tt.want)
+		}
+	}
+}
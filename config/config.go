@@ -10,16 +10,17 @@ import (
 )
 
 type Config struct {
-	DiscordToken          string
-	GuildID               string
-	DatabaseURL           string
-	CapSolverAPIKey       string
-	LicenseCheckChannelID      string
+	DiscordToken              string
+	GuildID                   string
+	DatabaseURL               string
+	DBMaxConns                int // Postgres pool size, shared by commands, API and scheduler (default: 10)
+	CapSolverAPIKey           string
+	LicenseCheckChannelID     string
 	LicenseVerifyLogChannelID string
 	HiringLogChannelID        string
-	StudentRoleID         string
-	LicensedAgentRoleID   string
-	LogLevel              string
+	StudentRoleID             string
+	LicensedAgentRoleID       string
+	LogLevel                  string
 
 	// Resend Email
 	ResendAPIKey  string
@@ -60,11 +61,14 @@ type Config struct {
 	WAVVAPIKey           string // Future: for WAVV API integration when available
 
 	// Scheduler config
-	InactivityKickWeeks  int
-	UnlicensedKickDays   int    // Days before unlicensed agents are kicked (default: 60)
-	UnlicensedWarnDays   string // Comma-separated warning days (e.g., "15,30,45,59")
-	CheckinDay           int    // 0=Sunday, 1=Monday, ..., 6=Saturday
-	CheckinHour          int    // Hour in ET (0-23)
+	InactivityKickWeeks     int
+	UnlicensedKickDays      int    // Days before unlicensed agents are kicked (default: 60)
+	UnlicensedWarnDays      string // Comma-separated warning days (e.g., "15,30,45,59")
+	CheckinDay              int    // 0=Sunday, 1=Monday, ..., 6=Saturday
+	CheckinHour             int    // Hour in ET (0-23)
+	LicenseCheckConcurrency int    // Max concurrent DOI lookups during the scheduled re-check (default: 10)
+	LicenseCheckPerState    int    // Max concurrent lookups against any one state's DOI (default: 4)
+	LicenseLookupTTLHours   int    // How long a positive license lookup is reused before re-scraping (default: 24, 0 disables)
 
 	// Tracker
 	TrackerChannelID string
@@ -109,6 +113,14 @@ type Config struct {
 	APIToken      string
 	APIPort       string
 	AllowedOrigin string
+
+	// Parsed once in MustLoad; the env-string fields above never change at runtime
+	parsed             bool
+	guildIDInt         int64
+	staffRoleIDs       []string
+	staffRoleSet       map[string]struct{}
+	unlicensedWarnDays []int
+	ghlStageMap        map[int]string
 }
 
 func MustLoad() *Config {
@@ -211,6 +223,10 @@ func MustLoad() *Config {
 	cfg.CheckinDay = getEnvInt("CHECKIN_DAY", 1) // 1 = Monday
 	cfg.CheckinHour = getEnvInt("CHECKIN_HOUR", 9)
 	cfg.NudgeAfterDays = getEnvInt("NUDGE_AFTER_DAYS", 30)
+	cfg.LicenseCheckConcurrency = getEnvInt("LICENSE_CHECK_CONCURRENCY", 10)
+	cfg.LicenseCheckPerState = getEnvInt("LICENSE_CHECK_PER_STATE", 4)
+	cfg.LicenseLookupTTLHours = getEnvInt("LICENSE_LOOKUP_TTL_HOURS", 24)
+	cfg.DBMaxConns = getEnvInt("DB_MAX_CONNS", 10)
 
 	// Validate required
 	if cfg.DiscordToken == "" {
@@ -223,17 +239,46 @@ func MustLoad() *Config {
 		log.Fatal("DATABASE_URL is required")
 	}
 
+	cfg.parse()
 	return cfg
 }
 
+// parse precomputes the derived values served by the accessor methods below, so hot
+// paths (IsStaff on every staff command, etc.) don't re-split env strings per call.
+func (c *Config) parse() {
+	c.guildIDInt = c.parseGuildID()
+	c.staffRoleIDs = c.parseStaffRoleIDs()
+	c.staffRoleSet = make(map[string]struct{}, len(c.staffRoleIDs))
+	for _, id := range c.staffRoleIDs {
+		c.staffRoleSet[id] = struct{}{}
+	}
+	c.unlicensedWarnDays = c.parseUnlicensedWarnDays()
+	c.ghlStageMap = c.buildGHLStageMap()
+	c.parsed = true
+}
+
 // GuildIDInt returns the guild ID as int64 for discordgo (which uses string, but we might need int for DB).
 func (c *Config) GuildIDInt() int64 {
+	if c.parsed {
+		return c.guildIDInt
+	}
+	return c.parseGuildID()
+}
+
+func (c *Config) parseGuildID() int64 {
 	v, _ := strconv.ParseInt(c.GuildID, 10, 64)
 	return v
 }
 
-// StaffRoleIDList returns the staff role IDs as a slice.
+// StaffRoleIDList returns the staff role IDs as a slice. Callers must not modify it.
 func (c *Config) StaffRoleIDList() []string {
+	if c.parsed {
+		return c.staffRoleIDs
+	}
+	return c.parseStaffRoleIDs()
+}
+
+func (c *Config) parseStaffRoleIDs() []string {
 	if c.StaffRoleIDs == "" {
 		return nil
 	}
@@ -250,6 +295,14 @@ func (c *Config) StaffRoleIDList() []string {
 
 // IsStaff returns true if any of the given role IDs match a staff role.
 func (c *Config) IsStaff(memberRoles []string) bool {
+	if c.parsed {
+		for _, roleID := range memberRoles {
+			if _, ok := c.staffRoleSet[roleID]; ok {
+				return true
+			}
+		}
+		return false
+	}
 	staffIDs := c.StaffRoleIDList()
 	for _, roleID := range memberRoles {
 		for _, staffID := range staffIDs {
@@ -287,8 +340,15 @@ func (c *Config) GetAgencyRoleID(agency string) string {
 	}
 }
 
-// GHLStageMap returns the mapping of bot stages (1-8) to GHL stage IDs.
+// GHLStageMap returns the mapping of bot stages (1-8) to GHL stage IDs. Callers must not modify it.
 func (c *Config) GHLStageMap() map[int]string {
+	if c.parsed {
+		return c.ghlStageMap
+	}
+	return c.buildGHLStageMap()
+}
+
+func (c *Config) buildGHLStageMap() map[int]string {
 	return map[int]string{
 		1: c.GHLStageWelcome,
 		2: c.GHLStageForm,
@@ -327,8 +387,15 @@ func (c *Config) GetAgencyOwnerID(agency string) string {
 	}
 }
 
-// UnlicensedWarnDaysList returns the warning days as a slice of ints.
+// UnlicensedWarnDaysList returns the warning days as a slice of ints. Callers must not modify it.
 func (c *Config) UnlicensedWarnDaysList() []int {
+	if c.parsed {
+		return c.unlicensedWarnDays
+	}
+	return c.parseUnlicensedWarnDays()
+}
+
+func (c *Config) parseUnlicensedWarnDays() []int {
 	if c.UnlicensedWarnDays == "" {
 		return []int{15, 30, 45, 59}
 	}
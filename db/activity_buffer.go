@@ -0,0 +1,145 @@
+package db
+
+import (
+	"context"
+	"fmt"
+	"log"
+	"strings"
+	"sync"
+	"time"
+)
+
+const (
+	activityFlushInterval = 500 * time.Millisecond
+	activityFlushBatch    = 100
+	activityQueueSize     = 1024
+)
+
+// activityRow is a queued agent_activity_log insert.
+type activityRow struct {
+	discordID int64
+	eventType string
+	details   string
+	at        time.Time
+}
+
+// activityBuffer queues activity-log rows and writes them in multi-row INSERTs from a
+// single background goroutine, so a burst of events costs one commit per batch instead
+// of one per row.
+type activityBuffer struct {
+	mu     sync.RWMutex
+	closed bool
+	ch     chan activityRow
+	done   chan struct{}
+}
+
+func (d *DB) startActivityBuffer() {
+	d.activity = &activityBuffer{
+		ch:   make(chan activityRow, activityQueueSize),
+		done: make(chan struct{}),
+	}
+	go d.runActivityFlusher()
+}
+
+// enqueueActivity hands a row to the flusher. It returns false if the buffer is not
+// running or is full, in which case the caller should insert directly.
+func (d *DB) enqueueActivity(row activityRow) bool {
+	b := d.activity
+	if b == nil {
+		return false
+	}
+	b.mu.RLock()
+	defer b.mu.RUnlock()
+	if b.closed {
+		return false
+	}
+	select {
+	case b.ch <- row:
+		return true
+	default:
+		return false
+	}
+}
+
+func (d *DB) runActivityFlusher() {
+	b := d.activity
+	defer close(b.done)
+
+	ticker := time.NewTicker(activityFlushInterval)
+	defer ticker.Stop()
+
+	batch := make([]activityRow, 0, activityFlushBatch)
+	flush := func() {
+		if len(batch) == 0 {
+			return
+		}
+		if err := d.insertActivityRows(batch); err != nil {
+			// One bad row fails the whole INSERT, so retry the rows one at a time
+			log.Printf("db: activity log flush of %d rows failed, retrying individually: %v", len(batch), err)
+			for i := range batch {
+				if err := d.insertActivityRows(batch[i : i+1]); err != nil {
+					log.Printf("db: activity log row dropped (%d %s): %v", batch[i].discordID, batch[i].eventType, err)
+				}
+			}
+		}
+		batch = batch[:0]
+	}
+
+	for {
+		select {
+		case row, ok := <-b.ch:
+			if !ok {
+				flush()
+				return
+			}
+			batch = append(batch, row)
+			if len(batch) >= activityFlushBatch {
+				flush()
+			}
+		case <-ticker.C:
+			flush()
+		}
+	}
+}
+
+func (d *DB) insertActivityRows(rows []activityRow) error {
+	defer func() {
+		if r := recover(); r != nil {
+			log.Printf("db: activity log flush panic: %v", r)
+		}
+	}()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+
+	var sb strings.Builder
+	sb.WriteString(`INSERT INTO agent_activity_log (discord_id, event_type, details, created_at) VALUES `)
+	args := make([]interface{}, 0, len(rows)*4)
+	for i, r := range rows {
+		if i > 0 {
+			sb.WriteString(", ")
+		}
+		n := i * 4
+		fmt.Fprintf(&sb, "($%d, $%d, $%d, $%d)", n+1, n+2, n+3, n+4)
+		args = append(args, r.discordID, r.eventType, r.details, r.at)
+	}
+	_, err := d.pool.ExecContext(ctx, sb.String(), args...)
+	return err
+}
+
+// stopActivityBuffer stops accepting rows and waits for the queue to be written out.
+func (d *DB) stopActivityBuffer() {
+	b := d.activity
+	if b == nil {
+		return
+	}
+	b.mu.Lock()
+	if b.closed {
+		b.mu.Unlock()
+		return
+	}
+	b.closed = true
+	close(b.ch)
+	b.mu.Unlock()
+	<-b.done
+}
@@ -14,11 +14,17 @@ type ActivityEvent struct {
 	CreatedAt time.Time
 }
 
-// LogActivity records an event in the activity log.
+// LogActivity records an event in the activity log. The row is normally queued and
+// written by the background flusher within ~500ms (keeping its original timestamp);
+// it is inserted directly only if the queue is full or already shut down.
 func (d *DB) LogActivity(ctx context.Context, discordID int64, eventType, details string) error {
+	row := activityRow{discordID: discordID, eventType: eventType, details: details, at: time.Now()}
+	if d.enqueueActivity(row) {
+		return nil
+	}
 	_, err := d.pool.ExecContext(ctx,
-		`INSERT INTO agent_activity_log (discord_id, event_type, details)
-         VALUES ($1, $2, $3)`, discordID, eventType, details)
+		`INSERT INTO agent_activity_log (discord_id, event_type, details, created_at)
+         VALUES ($1, $2, $3, $4)`, discordID, eventType, details, row.at)
 	return err
 }
 
@@ -122,19 +128,34 @@ func (d *DB) GetKickedCount(ctx context.Context) (int, error) {
 
 // queryAgents is a helper that scans full Agent rows from any query.
 func (d *DB) queryAgents(ctx context.Context, query string, args ...interface{}) ([]Agent, error) {
-	rows, err := d.pool.QueryContext(ctx, query, args...)
+	var result []Agent
+	err := d.eachAgent(ctx, query, func(a Agent) error {
+		result = append(result, a)
+		return nil
+	}, args...)
 	if err != nil {
 		return nil, err
 	}
+	return result, nil
+}
+
+// eachAgent runs query and calls fn for each agent as it is scanned. A non-nil error
+// from fn stops the iteration and is returned.
+func (d *DB) eachAgent(ctx context.Context, query string, fn func(Agent) error, args ...interface{}) error {
+	rows, err := d.pool.QueryContext(ctx, query, args...)
+	if err != nil {
+		return err
+	}
 	defer rows.Close()
 
-	var result []Agent
 	for rows.Next() {
 		a, err := ScanAgent(rows.Scan)
 		if err != nil {
-			return nil, fmt.Errorf("db: scan agent: %w", err)
+			return fmt.Errorf("db: scan agent: %w", err)
+		}
+		if err := fn(a); err != nil {
+			return err
 		}
-		result = append(result, a)
 	}
-	return result, rows.Err()
+	return rows.Err()
 }
@@ -17,6 +17,21 @@ type CheckinRecord struct {
 
 // GetStudentsForCheckin returns students in stages 1-4 who haven't been checked in this week.
 func (d *DB) GetStudentsForCheckin(ctx context.Context, weekStart time.Time) ([]Agent, error) {
+	var result []Agent
+	err := d.EachStudentForCheckin(ctx, weekStart, func(a Agent) error {
+		result = append(result, a)
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+	return result, nil
+}
+
+// EachStudentForCheckin streams the rows GetStudentsForCheckin would return, calling fn
+// for each as it is scanned. The connection is held until fn has seen every row, so fn
+// should hand slow work off rather than block on it.
+func (d *DB) EachStudentForCheckin(ctx context.Context, weekStart time.Time, fn func(Agent) error) error {
 	query := fmt.Sprintf(`SELECT %s FROM onboarding_agents a
          WHERE a.current_stage BETWEEN 1 AND 4
            AND a.kicked_at IS NULL
@@ -26,7 +41,7 @@ func (d *DB) GetStudentsForCheckin(ctx context.Context, weekStart time.Time) ([]
                WHERE c.discord_id = a.discord_id AND c.week_start = $1
            )
          ORDER BY a.created_at ASC`, AgentSelectColumns("a"))
-	return d.queryAgents(ctx, query, weekStart)
+	return d.eachAgent(ctx, query, fn, weekStart)
 }
 
 // GetInactiveAgents returns agents whose last_active is older than the given threshold.
@@ -3,12 +3,15 @@ package db
 import (
 	"context"
 	"database/sql"
+	"database/sql/driver"
 	"fmt"
 	"log"
+	"net/url"
 	"strings"
+	"sync"
 	"time"
 
-	_ "github.com/lib/pq"
+	"github.com/lib/pq"
 	"license-bot-go/config"
 )
 
@@ -39,29 +42,88 @@ var StageMap = map[string]int{
 }
 
 type DB struct {
-	pool *sql.DB
+	pool     *sql.DB
+	stmts    preparedStmts   // hot-path prepared statements; see statements.go
+	activity *activityBuffer // batches LogActivity inserts; see activity_buffer.go
+}
+
+// withDSNParam sets key=value on a connection string unless the key is already set. It
+// handles both postgres:// URLs and libpq key=value strings.
+func withDSNParam(dsn, key, value string) string {
+	if strings.HasPrefix(dsn, "postgres://") || strings.HasPrefix(dsn, "postgresql://") {
+		u, err := url.Parse(dsn)
+		if err != nil {
+			return dsn // let pq.NewConnector report the malformed URL
+		}
+		q := u.Query()
+		if q.Has(key) {
+			return dsn
+		}
+		q.Set(key, value)
+		u.RawQuery = q.Encode()
+		return u.String()
+	}
+	for _, field := range strings.Fields(dsn) {
+		if strings.HasPrefix(field, key+"=") {
+			return dsn
+		}
+	}
+	if strings.TrimSpace(dsn) == "" {
+		return key + "=" + value
+	}
+	return dsn + " " + key + "=" + value
+}
+
+// sessionSetup runs on every new pooled connection: wait up to 30s on row locks (the
+// sweep's batch writes can briefly contend with interactive upserts), and never let an
+// abandoned transaction pin a connection. These are SET statements rather than startup
+// parameters because PgBouncer-based poolers (e.g. Neon's pooled endpoint) reject
+// startup parameters they don't know.
+const sessionSetup = `SET lock_timeout = '30s'; SET idle_in_transaction_session_timeout = '60s'`
+
+// sessionConnector wraps the pq connector to apply sessionSetup to each new connection.
+type sessionConnector struct {
+	driver.Connector
+}
+
+func (c sessionConnector) Connect(ctx context.Context) (driver.Conn, error) {
+	conn, err := c.Connector.Connect(ctx)
+	if err != nil {
+		return nil, err
+	}
+	if ex, ok := conn.(driver.ExecerContext); ok {
+		if _, err := ex.ExecContext(ctx, sessionSetup, nil); err != nil {
+			conn.Close()
+			return nil, fmt.Errorf("db: session setup: %w", err)
+		}
+	}
+	return conn, nil
 }
 
 func New(cfg *config.Config) (*DB, error) {
 	dsn := cfg.DatabaseURL
 	// Railway internal Postgres doesn't use SSL; ensure sslmode is set
-	if !strings.Contains(dsn, "sslmode=") {
-		if strings.Contains(dsn, "?") {
-			dsn += "&sslmode=disable"
-		} else {
-			dsn += "?sslmode=disable"
-		}
-	}
+	dsn = withDSNParam(dsn, "sslmode", "disable")
+	// application_name is a standard startup parameter that poolers pass through
+	dsn = withDSNParam(dsn, "application_name", "license-bot")
 
 	log.Printf("Connecting to database...")
-	pool, err := sql.Open("postgres", dsn)
+	connector, err := pq.NewConnector(dsn)
 	if err != nil {
 		return nil, fmt.Errorf("db: open failed: %w", err)
 	}
+	pool := sql.OpenDB(sessionConnector{connector})
 
-	pool.SetMaxOpenConns(10)
-	pool.SetMaxIdleConns(5)
+	// Keep every open connection warm: with fewer idle slots than open ones, bursts
+	// (the concurrent license sweep, bulk logging) close and re-dial connections.
+	maxConns := cfg.DBMaxConns
+	if maxConns <= 0 {
+		maxConns = 10
+	}
+	pool.SetMaxOpenConns(maxConns)
+	pool.SetMaxIdleConns(maxConns)
 	pool.SetConnMaxLifetime(30 * time.Minute)
+	pool.SetConnMaxIdleTime(10 * time.Minute)
 
 	// Retry connection up to 5 times (Railway services may start before DB is ready)
 	var pingErr error
@@ -87,11 +149,17 @@ func New(cfg *config.Config) (*DB, error) {
 		return nil, fmt.Errorf("db: migration failed: %w", err)
 	}
 
+	d.prepareStatements(migCtx)
+	d.startActivityBuffer()
+
 	log.Println("Database connected and migrated")
 	return d, nil
 }
 
+// Close flushes any buffered activity rows, then closes the pool.
 func (d *DB) Close() error {
+	d.stopActivityBuffer()
+	d.closeStatements()
 	return d.pool.Close()
 }
 
@@ -147,6 +215,10 @@ func (d *DB) migrate(ctx context.Context) error {
             admin_notified BOOLEAN DEFAULT FALSE,
             created_at TIMESTAMPTZ DEFAULT NOW()
         )`,
+		// Scheduler sweeps only ever read unverified deadlines, ordered by deadline_at
+		`CREATE INDEX IF NOT EXISTS idx_deadlines_pending ON verification_deadlines(deadline_at) WHERE auto_verified = FALSE`,
+		// Set when a reminder's DM went out but its email failed, so the email alone is retried
+		`ALTER TABLE verification_deadlines ADD COLUMN IF NOT EXISTS reminder_email_pending BOOLEAN DEFAULT FALSE`,
 
 		// Migration: convert current_stage from TEXT to INTEGER
 		`DO $$ BEGIN
@@ -193,6 +265,8 @@ func (d *DB) migrate(ctx context.Context) error {
 		`ALTER TABLE onboarding_agents ADD COLUMN IF NOT EXISTS kicked_reason TEXT`,
 		`ALTER TABLE onboarding_agents ADD COLUMN IF NOT EXISTS last_active TIMESTAMPTZ DEFAULT NOW()`,
 		`ALTER TABLE onboarding_agents ADD COLUMN IF NOT EXISTS course_enrolled BOOLEAN DEFAULT FALSE`,
+		// Stage sweeps (check-ins, inactivity, stage lists and counts) only read non-kicked agents
+		`CREATE INDEX IF NOT EXISTS idx_agents_active_stage ON onboarding_agents(current_stage) WHERE kicked_at IS NULL`,
 
 		// New tables for onboarding pipeline
 		`CREATE TABLE IF NOT EXISTS agent_activity_log (
@@ -421,21 +495,63 @@ type LicenseCheck struct {
 	LOAs           string
 	Found          bool
 	Error          string
+	CheckedAt      time.Time // zero means now
+}
+
+// checkedAt returns the timestamp to store for c, falling back to now.
+func (c LicenseCheck) checkedAt(now time.Time) time.Time {
+	if c.CheckedAt.IsZero() {
+		return now
+	}
+	return c.CheckedAt
 }
 
 func (d *DB) SaveLicenseCheck(ctx context.Context, c LicenseCheck) error {
-	_, err := d.pool.ExecContext(ctx,
-		`INSERT INTO license_checks
-         (discord_id, guild_id, first_name, last_name, state, npn, license_number,
-          license_type, license_status, expiration_date, loas, found, error)
-         VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)`,
+	_, err := d.execStmt(ctx, d.stmts.insertLicenseCheck, insertLicenseCheckSQL,
 		c.DiscordID, c.GuildID, c.FirstName, c.LastName, c.State, c.NPN,
 		c.LicenseNumber, c.LicenseType, c.LicenseStatus, c.ExpirationDate,
-		c.LOAs, c.Found, c.Error,
+		c.LOAs, c.Found, c.Error, c.checkedAt(time.Now()),
 	)
 	return err
 }
 
+// SaveLicenseChecks inserts a batch of license check records in a single transaction.
+// Rows without a CheckedAt share one timestamp, so a batch can be correlated later.
+func (d *DB) SaveLicenseChecks(ctx context.Context, checks []LicenseCheck) error {
+	if len(checks) == 0 {
+		return nil
+	}
+
+	tx, err := d.pool.BeginTx(ctx, nil)
+	if err != nil {
+		return fmt.Errorf("db: begin tx: %w", err)
+	}
+	defer tx.Rollback()
+
+	// license_checks is an audit trail; don't wait on the WAL flush for it.
+	if _, err := tx.ExecContext(ctx, `SET LOCAL synchronous_commit = off`); err != nil {
+		return fmt.Errorf("db: set synchronous_commit: %w", err)
+	}
+
+	stmt, err := txStmt(ctx, tx, d.stmts.insertLicenseCheck, insertLicenseCheckSQL)
+	if err != nil {
+		return fmt.Errorf("db: prepare: %w", err)
+	}
+	defer stmt.Close()
+
+	now := time.Now()
+	for _, c := range checks {
+		if _, err := stmt.ExecContext(ctx,
+			c.DiscordID, c.GuildID, c.FirstName, c.LastName, c.State, c.NPN,
+			c.LicenseNumber, c.LicenseType, c.LicenseStatus, c.ExpirationDate,
+			c.LOAs, c.Found, c.Error, c.checkedAt(now),
+		); err != nil {
+			return fmt.Errorf("db: save license check %d: %w", c.DiscordID, err)
+		}
+	}
+	return tx.Commit()
+}
+
 // AgentUpdate holds fields to update for an agent.
 type AgentUpdate struct {
 	FirstName       *string
@@ -479,219 +595,343 @@ type AgentUpdate struct {
 	GHLContactID             *string
 }
 
-func (d *DB) UpsertAgent(ctx context.Context, discordID, guildID int64, updates AgentUpdate) error {
-	// Insert if not exists
-	_, err := d.pool.ExecContext(ctx,
-		`INSERT INTO onboarding_agents (discord_id, guild_id)
+const upsertAgentInsertSQL = `INSERT INTO onboarding_agents (discord_id, guild_id)
          VALUES ($1, $2)
-         ON CONFLICT (discord_id) DO NOTHING`,
-		discordID, guildID,
-	)
+         ON CONFLICT (discord_id) DO NOTHING`
+
+func (d *DB) UpsertAgent(ctx context.Context, discordID, guildID int64, updates AgentUpdate) error {
+	return d.upsertAgent(ctx, discordID, guildID, updates, false)
+}
+
+// UpsertAgentIfChanged is UpsertAgent, but an existing row is only updated when at least
+// one field actually differs from what is stored. Re-running /verify with the same details
+// then writes no new row version and leaves updated_at alone.
+func (d *DB) UpsertAgentIfChanged(ctx context.Context, discordID, guildID int64, updates AgentUpdate) error {
+	return d.upsertAgent(ctx, discordID, guildID, updates, true)
+}
+
+func (d *DB) upsertAgent(ctx context.Context, discordID, guildID int64, updates AgentUpdate, onlyIfChanged bool) error {
+	query, args := agentUpsertSQL(discordID, guildID, updates, onlyIfChanged)
+	var err error
+	if query == upsertAgentInsertSQL {
+		_, err = d.execStmt(ctx, d.stmts.upsertAgentInsert, query, args...)
+	} else {
+		_, err = d.pool.ExecContext(ctx, query, args...)
+	}
 	if err != nil {
-		return fmt.Errorf("db: upsert insert: %w", err)
+		return fmt.Errorf("db: upsert agent: %w", err)
 	}
+	return nil
+}
 
-	// Build dynamic UPDATE
-	sets := []string{"updated_at = NOW()"}
-	args := []interface{}{}
-	argN := 1
+// AgentUpsert is one row for UpsertAgents.
+type AgentUpsert struct {
+	DiscordID int64
+	GuildID   int64
+	Updates   AgentUpdate
+}
+
+// UpsertAgents applies many UpsertAgent calls in a single transaction. Rows that set the
+// same fields share one prepared upsert, so a sweep of N agents is one commit, not N.
+func (d *DB) UpsertAgents(ctx context.Context, upserts []AgentUpsert) error {
+	if len(upserts) == 0 {
+		return nil
+	}
+
+	tx, err := d.pool.BeginTx(ctx, nil)
+	if err != nil {
+		return fmt.Errorf("db: begin tx: %w", err)
+	}
+	defer tx.Rollback()
+
+	stmts := make(map[string]*sql.Stmt)
+	defer func() {
+		for _, stmt := range stmts {
+			stmt.Close()
+		}
+	}()
+
+	for _, u := range upserts {
+		query, args := agentUpsertSQL(u.DiscordID, u.GuildID, u.Updates, false)
+		stmt, ok := stmts[query]
+		if !ok {
+			var prepared *sql.Stmt
+			if query == upsertAgentInsertSQL {
+				prepared = d.stmts.upsertAgentInsert
+			}
+			if stmt, err = txStmt(ctx, tx, prepared, query); err != nil {
+				return fmt.Errorf("db: prepare: %w", err)
+			}
+			stmts[query] = stmt
+		}
+		if _, err := stmt.ExecContext(ctx, args...); err != nil {
+			return fmt.Errorf("db: upsert agent %d: %w", u.DiscordID, err)
+		}
+	}
+	return tx.Commit()
+}
+
+// AgentUpdate column indexes. They follow the field order of AgentUpdate, which is also
+// the order agentUpsertSQL appends arguments in.
+const (
+	agentColFirstName = iota
+	agentColLastName
+	agentColPhoneNumber
+	agentColEmail
+	agentColEmailOptIn
+	agentColState
+	agentColLicenseVerified
+	agentColLicenseNPN
+	agentColCurrentStage
+	agentColAgency
+	agentColUplineManager
+	agentColExperienceLevel
+	agentColLicenseStatus
+	agentColProductionWritten
+	agentColLeadSource
+	agentColVisionGoals
+	agentColCompPct
+	agentColShowComp
+	agentColRoleBackground
+	agentColFunHobbies
+	agentColNotificationPref
+	agentColCourseEnrolled
+	agentColContractingBooked
+	agentColContractingCompleted
+	agentColSetupCompleted
+	agentColFormCompletedAt
+	agentColSortedAt
+	agentColActivatedAt
+	agentColKickedAt
+	agentColKickedReason
+	agentColLastActive
+	agentColUplineManagerDiscordID
+	agentColLastNudgeSentAt
+	agentColDirectManagerDiscordID
+	agentColDirectManagerName
+	agentColApprovalStatus
+	agentColGHLContactID
+)
+
+// agentUpdateColumns maps each AgentUpdate column index to its onboarding_agents column.
+var agentUpdateColumns = [...]string{
+	agentColFirstName:              "first_name",
+	agentColLastName:               "last_name",
+	agentColPhoneNumber:            "phone_number",
+	agentColEmail:                  "email",
+	agentColEmailOptIn:             "email_opt_in",
+	agentColState:                  "state",
+	agentColLicenseVerified:        "license_verified",
+	agentColLicenseNPN:             "license_npn",
+	agentColCurrentStage:           "current_stage",
+	agentColAgency:                 "agency",
+	agentColUplineManager:          "upline_manager",
+	agentColExperienceLevel:        "experience_level",
+	agentColLicenseStatus:          "license_status",
+	agentColProductionWritten:      "production_written",
+	agentColLeadSource:             "lead_source",
+	agentColVisionGoals:            "vision_goals",
+	agentColCompPct:                "comp_pct",
+	agentColShowComp:               "show_comp",
+	agentColRoleBackground:         "role_background",
+	agentColFunHobbies:             "fun_hobbies",
+	agentColNotificationPref:       "notification_pref",
+	agentColCourseEnrolled:         "course_enrolled",
+	agentColContractingBooked:      "contracting_booked",
+	agentColContractingCompleted:   "contracting_completed",
+	agentColSetupCompleted:         "setup_completed",
+	agentColFormCompletedAt:        "form_completed_at",
+	agentColSortedAt:               "sorted_at",
+	agentColActivatedAt:            "activated_at",
+	agentColKickedAt:               "kicked_at",
+	agentColKickedReason:           "kicked_reason",
+	agentColLastActive:             "last_active",
+	agentColUplineManagerDiscordID: "upline_manager_discord_id",
+	agentColLastNudgeSentAt:        "last_nudge_sent_at",
+	agentColDirectManagerDiscordID: "direct_manager_discord_id",
+	agentColDirectManagerName:      "direct_manager_name",
+	agentColApprovalStatus:         "approval_status",
+	agentColGHLContactID:           "ghl_contact_id",
+}
+
+// agentUpsertQueryKey identifies one upsert shape: which columns are set, and whether
+// the changed-only guard is appended.
+type agentUpsertQueryKey struct {
+	cols          uint64
+	onlyIfChanged bool
+}
+
+// agentUpsertQueries caches the SQL text per agentUpsertQueryKey, so repeat callers with
+// the same set of fields reuse identical text rather than rebuilding it each time.
+var agentUpsertQueries sync.Map
+
+// agentUpsertSQL builds a single INSERT ... ON CONFLICT DO UPDATE that creates the agent
+// row if needed and writes the non-nil fields of updates. Columns always appear in struct
+// order, so the same set of fields always yields the same SQL text. With onlyIfChanged,
+// rows whose stored values already match are left untouched. With no fields set it is
+// just the insert-if-missing.
+func agentUpsertSQL(discordID, guildID int64, updates AgentUpdate, onlyIfChanged bool) (string, []interface{}) {
+	var cols uint64
+	args := make([]interface{}, 2, 10)
+	args[0], args[1] = discordID, guildID
+	set := func(col int, v interface{}) {
+		cols |= 1 << col
+		args = append(args, v)
+	}
 
 	if updates.FirstName != nil {
-		sets = append(sets, fmt.Sprintf("first_name = $%d", argN))
-		args = append(args, *updates.FirstName)
-		argN++
+		set(agentColFirstName, *updates.FirstName)
 	}
 	if updates.LastName != nil {
-		sets = append(sets, fmt.Sprintf("last_name = $%d", argN))
-		args = append(args, *updates.LastName)
-		argN++
+		set(agentColLastName, *updates.LastName)
 	}
 	if updates.PhoneNumber != nil {
-		sets = append(sets, fmt.Sprintf("phone_number = $%d", argN))
-		args = append(args, *updates.PhoneNumber)
-		argN++
+		set(agentColPhoneNumber, *updates.PhoneNumber)
 	}
 	if updates.Email != nil {
-		sets = append(sets, fmt.Sprintf("email = $%d", argN))
-		args = append(args, *updates.Email)
-		argN++
+		set(agentColEmail, *updates.Email)
 	}
 	if updates.EmailOptIn != nil {
-		sets = append(sets, fmt.Sprintf("email_opt_in = $%d", argN))
-		args = append(args, *updates.EmailOptIn)
-		argN++
+		set(agentColEmailOptIn, *updates.EmailOptIn)
 	}
 	if updates.State != nil {
-		sets = append(sets, fmt.Sprintf("state = $%d", argN))
-		args = append(args, *updates.State)
-		argN++
+		set(agentColState, *updates.State)
 	}
 	if updates.LicenseVerified != nil {
-		sets = append(sets, fmt.Sprintf("license_verified = $%d", argN))
-		args = append(args, *updates.LicenseVerified)
-		argN++
+		set(agentColLicenseVerified, *updates.LicenseVerified)
 	}
 	if updates.LicenseNPN != nil {
-		sets = append(sets, fmt.Sprintf("license_npn = $%d", argN))
-		args = append(args, *updates.LicenseNPN)
-		argN++
+		set(agentColLicenseNPN, *updates.LicenseNPN)
 	}
 	if updates.CurrentStage != nil {
-		sets = append(sets, fmt.Sprintf("current_stage = $%d", argN))
-		args = append(args, *updates.CurrentStage)
-		argN++
+		set(agentColCurrentStage, *updates.CurrentStage)
 	}
 	if updates.Agency != nil {
-		sets = append(sets, fmt.Sprintf("agency = $%d", argN))
-		args = append(args, *updates.Agency)
-		argN++
+		set(agentColAgency, *updates.Agency)
 	}
 	if updates.UplineManager != nil {
-		sets = append(sets, fmt.Sprintf("upline_manager = $%d", argN))
-		args = append(args, *updates.UplineManager)
-		argN++
+		set(agentColUplineManager, *updates.UplineManager)
 	}
 	if updates.ExperienceLevel != nil {
-		sets = append(sets, fmt.Sprintf("experience_level = $%d", argN))
-		args = append(args, *updates.ExperienceLevel)
-		argN++
+		set(agentColExperienceLevel, *updates.ExperienceLevel)
 	}
 	if updates.LicenseStatus != nil {
-		sets = append(sets, fmt.Sprintf("license_status = $%d", argN))
-		args = append(args, *updates.LicenseStatus)
-		argN++
+		set(agentColLicenseStatus, *updates.LicenseStatus)
 	}
 	if updates.ProductionWritten != nil {
-		sets = append(sets, fmt.Sprintf("production_written = $%d", argN))
-		args = append(args, *updates.ProductionWritten)
-		argN++
+		set(agentColProductionWritten, *updates.ProductionWritten)
 	}
 	if updates.LeadSource != nil {
-		sets = append(sets, fmt.Sprintf("lead_source = $%d", argN))
-		args = append(args, *updates.LeadSource)
-		argN++
+		set(agentColLeadSource, *updates.LeadSource)
 	}
 	if updates.VisionGoals != nil {
-		sets = append(sets, fmt.Sprintf("vision_goals = $%d", argN))
-		args = append(args, *updates.VisionGoals)
-		argN++
+		set(agentColVisionGoals, *updates.VisionGoals)
 	}
 	if updates.CompPct != nil {
-		sets = append(sets, fmt.Sprintf("comp_pct = $%d", argN))
-		args = append(args, *updates.CompPct)
-		argN++
+		set(agentColCompPct, *updates.CompPct)
 	}
 	if updates.ShowComp != nil {
-		sets = append(sets, fmt.Sprintf("show_comp = $%d", argN))
-		args = append(args, *updates.ShowComp)
-		argN++
+		set(agentColShowComp, *updates.ShowComp)
 	}
 	if updates.RoleBackground != nil {
-		sets = append(sets, fmt.Sprintf("role_background = $%d", argN))
-		args = append(args, *updates.RoleBackground)
-		argN++
+		set(agentColRoleBackground, *updates.RoleBackground)
 	}
 	if updates.FunHobbies != nil {
-		sets = append(sets, fmt.Sprintf("fun_hobbies = $%d", argN))
-		args = append(args, *updates.FunHobbies)
-		argN++
+		set(agentColFunHobbies, *updates.FunHobbies)
 	}
 	if updates.NotificationPref != nil {
-		sets = append(sets, fmt.Sprintf("notification_pref = $%d", argN))
-		args = append(args, *updates.NotificationPref)
-		argN++
+		set(agentColNotificationPref, *updates.NotificationPref)
 	}
 	if updates.CourseEnrolled != nil {
-		sets = append(sets, fmt.Sprintf("course_enrolled = $%d", argN))
-		args = append(args, *updates.CourseEnrolled)
-		argN++
+		set(agentColCourseEnrolled, *updates.CourseEnrolled)
 	}
 	if updates.ContractingBooked != nil {
-		sets = append(sets, fmt.Sprintf("contracting_booked = $%d", argN))
-		args = append(args, *updates.ContractingBooked)
-		argN++
+		set(agentColContractingBooked, *updates.ContractingBooked)
 	}
 	if updates.ContractingCompleted != nil {
-		sets = append(sets, fmt.Sprintf("contracting_completed = $%d", argN))
-		args = append(args, *updates.ContractingCompleted)
-		argN++
+		set(agentColContractingCompleted, *updates.ContractingCompleted)
 	}
 	if updates.SetupCompleted != nil {
-		sets = append(sets, fmt.Sprintf("setup_completed = $%d", argN))
-		args = append(args, *updates.SetupCompleted)
-		argN++
+		set(agentColSetupCompleted, *updates.SetupCompleted)
 	}
 	if updates.FormCompletedAt != nil {
-		sets = append(sets, fmt.Sprintf("form_completed_at = $%d", argN))
-		args = append(args, *updates.FormCompletedAt)
-		argN++
+		set(agentColFormCompletedAt, *updates.FormCompletedAt)
 	}
 	if updates.SortedAt != nil {
-		sets = append(sets, fmt.Sprintf("sorted_at = $%d", argN))
-		args = append(args, *updates.SortedAt)
-		argN++
+		set(agentColSortedAt, *updates.SortedAt)
 	}
 	if updates.ActivatedAt != nil {
-		sets = append(sets, fmt.Sprintf("activated_at = $%d", argN))
-		args = append(args, *updates.ActivatedAt)
-		argN++
+		set(agentColActivatedAt, *updates.ActivatedAt)
 	}
 	if updates.KickedAt != nil {
-		sets = append(sets, fmt.Sprintf("kicked_at = $%d", argN))
-		args = append(args, *updates.KickedAt)
-		argN++
+		set(agentColKickedAt, *updates.KickedAt)
 	}
 	if updates.KickedReason != nil {
-		sets = append(sets, fmt.Sprintf("kicked_reason = $%d", argN))
-		args = append(args, *updates.KickedReason)
-		argN++
+		set(agentColKickedReason, *updates.KickedReason)
 	}
 	if updates.LastActive != nil {
-		sets = append(sets, fmt.Sprintf("last_active = $%d", argN))
-		args = append(args, *updates.LastActive)
-		argN++
+		set(agentColLastActive, *updates.LastActive)
 	}
 	if updates.UplineManagerDiscordID != nil {
-		sets = append(sets, fmt.Sprintf("upline_manager_discord_id = $%d", argN))
-		args = append(args, *updates.UplineManagerDiscordID)
-		argN++
+		set(agentColUplineManagerDiscordID, *updates.UplineManagerDiscordID)
 	}
 	if updates.LastNudgeSentAt != nil {
-		sets = append(sets, fmt.Sprintf("last_nudge_sent_at = $%d", argN))
-		args = append(args, *updates.LastNudgeSentAt)
-		argN++
+		set(agentColLastNudgeSentAt, *updates.LastNudgeSentAt)
 	}
 	if updates.DirectManagerDiscordID != nil {
-		sets = append(sets, fmt.Sprintf("direct_manager_discord_id = $%d", argN))
-		args = append(args, *updates.DirectManagerDiscordID)
-		argN++
+		set(agentColDirectManagerDiscordID, *updates.DirectManagerDiscordID)
 	}
 	if updates.DirectManagerName != nil {
-		sets = append(sets, fmt.Sprintf("direct_manager_name = $%d", argN))
-		args = append(args, *updates.DirectManagerName)
-		argN++
+		set(agentColDirectManagerName, *updates.DirectManagerName)
 	}
 	if updates.ApprovalStatus != nil {
-		sets = append(sets, fmt.Sprintf("approval_status = $%d", argN))
-		args = append(args, *updates.ApprovalStatus)
-		argN++
+		set(agentColApprovalStatus, *updates.ApprovalStatus)
 	}
 	if updates.GHLContactID != nil {
-		sets = append(sets, fmt.Sprintf("ghl_contact_id = $%d", argN))
-		args = append(args, *updates.GHLContactID)
-		argN++
+		set(agentColGHLContactID, *updates.GHLContactID)
 	}
 
-	if len(args) == 0 {
-		return nil // Nothing to update beyond updated_at
+	if cols == 0 {
+		return upsertAgentInsertSQL, args
 	}
 
-	args = append(args, discordID)
-	query := fmt.Sprintf("UPDATE onboarding_agents SET %s WHERE discord_id = $%d",
-		strings.Join(sets, ", "), argN)
+	key := agentUpsertQueryKey{cols: cols, onlyIfChanged: onlyIfChanged}
+	if query, ok := agentUpsertQueries.Load(key); ok {
+		return query.(string), args
+	}
+	query := buildAgentUpsertSQL(key)
+	agentUpsertQueries.Store(key, query)
+	return query, args
+}
 
-	_, err = d.pool.ExecContext(ctx, query, args...)
-	return err
+// buildAgentUpsertSQL renders the upsert text for one column set. discord_id and
+// guild_id take $1 and $2; the set columns follow in column order. guild_id is only
+// written on insert, as before.
+func buildAgentUpsertSQL(key agentUpsertQueryKey) string {
+	names := []string{"discord_id", "guild_id"}
+	params := []string{"$1", "$2"}
+	sets := []string{"updated_at = NOW()"}
+	var diffs []string
+	for col, name := range agentUpdateColumns {
+		if key.cols&(1<<col) == 0 {
+			continue
+		}
+		names = append(names, name)
+		params = append(params, fmt.Sprintf("$%d", len(params)+1))
+		sets = append(sets, fmt.Sprintf("%s = EXCLUDED.%s", name, name))
+		if key.onlyIfChanged {
+			diffs = append(diffs, fmt.Sprintf("onboarding_agents.%s IS DISTINCT FROM EXCLUDED.%s", name, name))
+		}
+	}
+
+	query := fmt.Sprintf(`INSERT INTO onboarding_agents (%s)
+         VALUES (%s)
+         ON CONFLICT (discord_id) DO UPDATE SET %s`,
+		strings.Join(names, ", "), strings.Join(params, ", "), strings.Join(sets, ", "))
+	if key.onlyIfChanged {
+		query += " WHERE " + strings.Join(diffs, " OR ")
+	}
+	return query
 }
 
 
@@ -837,8 +1077,7 @@ func ScanAgent(scan func(dest ...interface{}) error) (Agent, error) {
 }
 
 func (d *DB) GetAgent(ctx context.Context, discordID int64) (*Agent, error) {
-	query := fmt.Sprintf(`SELECT %s FROM onboarding_agents WHERE discord_id = $1`, AgentSelectColumns(""))
-	row := d.pool.QueryRowContext(ctx, query, discordID)
+	row := d.queryRowStmt(ctx, d.stmts.getAgent, getAgentSQL, discordID)
 	a, err := ScanAgent(row.Scan)
 
 	if err == sql.ErrNoRows {
@@ -850,6 +1089,17 @@ func (d *DB) GetAgent(ctx context.Context, discordID int64) (*Agent, error) {
 	return &a, nil
 }
 
+// GetOptedInEmail returns the agent's email if they have one and opted in to email,
+// or "" otherwise. Scheduler loops use it instead of loading the full agent row.
+func (d *DB) GetOptedInEmail(ctx context.Context, discordID int64) (string, error) {
+	var email string
+	err := d.queryRowStmt(ctx, d.stmts.optedInEmail, optedInEmailSQL, discordID).Scan(&email)
+	if err == sql.ErrNoRows {
+		return "", nil
+	}
+	return email, err
+}
+
 // VerificationDeadline represents a row in the verification_deadlines table.
 type VerificationDeadline struct {
 	DiscordID     int64
@@ -894,9 +1144,19 @@ func (d *DB) MarkAdminNotified(ctx context.Context, discordID int64) error {
 	return err
 }
 
-func (d *DB) UpdateReminderSent(ctx context.Context, discordID int64) error {
+// UpdateReminderSent records that a reminder went out. emailPending marks its email as
+// failed, to be retried on its own by later sweeps.
+func (d *DB) UpdateReminderSent(ctx context.Context, discordID int64, emailPending bool) error {
 	_, err := d.pool.ExecContext(ctx,
-		`UPDATE verification_deadlines SET last_reminder_at = NOW()
+		`UPDATE verification_deadlines SET last_reminder_at = NOW(), reminder_email_pending = $2
+         WHERE discord_id = $1`, discordID, emailPending)
+	return err
+}
+
+// ClearReminderEmailPending marks a retried reminder email as done.
+func (d *DB) ClearReminderEmailPending(ctx context.Context, discordID int64) error {
+	_, err := d.pool.ExecContext(ctx,
+		`UPDATE verification_deadlines SET reminder_email_pending = FALSE
          WHERE discord_id = $1`, discordID)
 	return err
 }
@@ -910,6 +1170,22 @@ func (d *DB) DeleteDeadline(ctx context.Context, discordID int64) error {
 // GetPendingDeadlines returns non-verified deadlines that need reminders.
 // It returns deadlines where the last reminder was more than `reminderInterval` ago (or never sent).
 func (d *DB) GetPendingDeadlines(ctx context.Context, reminderInterval time.Duration) ([]VerificationDeadline, error) {
+	var result []VerificationDeadline
+	err := d.EachPendingDeadline(ctx, reminderInterval, func(dl VerificationDeadline) error {
+		result = append(result, dl)
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+	return result, nil
+}
+
+// EachPendingDeadline streams the rows GetPendingDeadlines would return, calling fn for
+// each as it is scanned instead of materializing the whole set first. A non-nil error
+// from fn stops the iteration and is returned. The connection is held until fn has seen
+// every row, so fn should hand slow work off rather than block on it.
+func (d *DB) EachPendingDeadline(ctx context.Context, reminderInterval time.Duration, fn func(VerificationDeadline) error) error {
 	cutoff := time.Now().Add(-reminderInterval)
 	rows, err := d.pool.QueryContext(ctx,
 		`SELECT discord_id, guild_id, COALESCE(first_name,''), COALESCE(last_name,''),
@@ -921,6 +1197,78 @@ func (d *DB) GetPendingDeadlines(ctx context.Context, reminderInterval time.Dura
            AND deadline_at > NOW()
            AND (last_reminder_at IS NULL OR last_reminder_at < $1)
          ORDER BY deadline_at ASC`, cutoff)
+	if err != nil {
+		return err
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var dl VerificationDeadline
+		if err := rows.Scan(&dl.DiscordID, &dl.GuildID, &dl.FirstName, &dl.LastName,
+			&dl.HomeState, &dl.LicenseStatus, &dl.DeadlineAt, &dl.AutoVerified,
+			&dl.LastReminder, &dl.AdminNotified, &dl.CreatedAt); err != nil {
+			return err
+		}
+		if err := fn(dl); err != nil {
+			return err
+		}
+	}
+	return rows.Err()
+}
+
+// PendingVerification is the slice of a verification_deadlines row the re-check sweep
+// needs: who to look up, and where.
+type PendingVerification struct {
+	DiscordID int64
+	GuildID   int64
+	FirstName string
+	LastName  string
+	HomeState string
+}
+
+// EachPendingVerification streams unverified, unexpired deadlines that have a name and
+// state to look up, scanning only the columns the re-check sweep uses.
+func (d *DB) EachPendingVerification(ctx context.Context, fn func(PendingVerification) error) error {
+	rows, err := d.pool.QueryContext(ctx,
+		`SELECT discord_id, guild_id, first_name, last_name, home_state
+         FROM verification_deadlines
+         WHERE auto_verified = FALSE
+           AND deadline_at > NOW()
+           AND first_name <> '' AND last_name <> '' AND home_state <> ''
+         ORDER BY deadline_at ASC`)
+	if err != nil {
+		return err
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var p PendingVerification
+		if err := rows.Scan(&p.DiscordID, &p.GuildID, &p.FirstName, &p.LastName, &p.HomeState); err != nil {
+			return err
+		}
+		if err := fn(p); err != nil {
+			return err
+		}
+	}
+	return rows.Err()
+}
+
+// GetReminderEmailRetries returns non-verified deadlines whose last reminder email failed
+// and that aren't due a full reminder yet (the last one went out less than
+// reminderInterval ago), so only the email needs to be sent again.
+func (d *DB) GetReminderEmailRetries(ctx context.Context, reminderInterval time.Duration) ([]VerificationDeadline, error) {
+	cutoff := time.Now().Add(-reminderInterval)
+	rows, err := d.pool.QueryContext(ctx,
+		`SELECT discord_id, guild_id, COALESCE(first_name,''), COALESCE(last_name,''),
+         COALESCE(home_state,''), COALESCE(license_status,'none'), deadline_at,
+         COALESCE(auto_verified, false), last_reminder_at,
+         COALESCE(admin_notified, false), created_at
+         FROM verification_deadlines
+         WHERE auto_verified = FALSE
+           AND reminder_email_pending = TRUE
+           AND deadline_at > NOW()
+           AND last_reminder_at >= $1
+         ORDER BY deadline_at ASC`, cutoff)
 	if err != nil {
 		return nil, err
 	}
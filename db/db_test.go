@@ -0,0 +1,108 @@
+package db
+
+import (
+	"fmt"
+	"reflect"
+	"strings"
+	"testing"
+)
+
+func TestWithDSNParam(t *testing.T) {
+	tests := []struct {
+		name       string
+		dsn        string
+		key, value string
+		want       string
+	}{
+		{"url without query", "postgres://u:p@host:5432/vipa", "sslmode", "disable",
+			"postgres://u:p@host:5432/vipa?sslmode=disable"},
+		{"url with query", "postgres://u:p@host/vipa?connect_timeout=5", "sslmode", "disable",
+			"postgres://u:p@host/vipa?connect_timeout=5&sslmode=disable"},
+		{"url already set", "postgres://u:p@host/vipa?sslmode=require", "sslmode", "disable",
+			"postgres://u:p@host/vipa?sslmode=require"},
+		{"url key is only a suffix of another key", "postgresql://host/vipa?fallback_application_name=x", "application_name", "license-bot",
+			"postgresql://host/vipa?application_name=license-bot&fallback_application_name=x"},
+		{"key=value", "host=localhost dbname=vipa", "sslmode", "disable",
+			"host=localhost dbname=vipa sslmode=disable"},
+		{"key=value already set", "host=localhost sslmode=require", "sslmode", "disable",
+			"host=localhost sslmode=require"},
+		{"key=value suffix of another key", "host=localhost fallback_application_name=x", "application_name", "license-bot",
+			"host=localhost fallback_application_name=x application_name=license-bot"},
+		{"empty", "", "sslmode", "disable", "sslmode=disable"},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := withDSNParam(tt.dsn, tt.key, tt.value); got != tt.want {
+				t.Errorf("withDSNParam(%q, %q) = %q, want %q", tt.dsn, tt.key, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestAgentUpsertSQLNoFields(t *testing.T) {
+	query, args := agentUpsertSQL(1, 2, AgentUpdate{}, false)
+	if query != upsertAgentInsertSQL {
+		t.Errorf("query = %q, want upsertAgentInsertSQL", query)
+	}
+	if !reflect.DeepEqual(args, []interface{}{int64(1), int64(2)}) {
+		t.Errorf("args = %v, want [1 2]", args)
+	}
+}
+
+func TestAgentUpsertSQL(t *testing.T) {
+	first, state, verified := "Ann", "FL", true
+	// Set in a different order than the struct to show columns follow struct order
+	updates := AgentUpdate{LicenseVerified: &verified, State: &state, FirstName: &first}
+
+	const insert = `INSERT INTO onboarding_agents (discord_id, guild_id, first_name, state, license_verified)
+         VALUES ($1, $2, $3, $4, $5)
+         ON CONFLICT (discord_id) DO UPDATE SET updated_at = NOW(), first_name = EXCLUDED.first_name, state = EXCLUDED.state, license_verified = EXCLUDED.license_verified`
+	wantArgs := []interface{}{int64(10), int64(20), "Ann", "FL", true}
+
+	tests := []struct {
+		name          string
+		onlyIfChanged bool
+		want          string
+	}{
+		{"always update", false, insert},
+		{"only if changed", true, insert + " WHERE onboarding_agents.first_name IS DISTINCT FROM EXCLUDED.first_name" +
+			" OR onboarding_agents.state IS DISTINCT FROM EXCLUDED.state" +
+			" OR onboarding_agents.license_verified IS DISTINCT FROM EXCLUDED.license_verified"},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			query, args := agentUpsertSQL(10, 20, updates, tt.onlyIfChanged)
+			if query != tt.want {
+				t.Errorf("query =\n%s\nwant\n%s", query, tt.want)
+			}
+			if !reflect.DeepEqual(args, wantArgs) {
+				t.Errorf("args = %v, want %v", args, wantArgs)
+			}
+			// guild_id is written on insert only, never overwritten on conflict
+			if strings.Contains(query, "guild_id = ") {
+				t.Errorf("query updates guild_id on conflict: %s", query)
+			}
+			// The cached text is reused for the same shape
+			if again, _ := agentUpsertSQL(11, 21, updates, tt.onlyIfChanged); again != query {
+				t.Errorf("second call returned different SQL:\n%s", again)
+			}
+		})
+	}
+}
+
+func TestAgentUpsertSQLCoversEveryColumn(t *testing.T) {
+	for col, name := range agentUpdateColumns {
+		if name == "" {
+			t.Errorf("agentUpdateColumns[%d] is empty", col)
+		}
+	}
+	query := buildAgentUpsertSQL(agentUpsertQueryKey{cols: 1<<len(agentUpdateColumns) - 1})
+	for _, name := range agentUpdateColumns {
+		if !strings.Contains(query, name+" = EXCLUDED."+name) {
+			t.Errorf("full-shape query is missing %s", name)
+		}
+	}
+	if want := fmt.Sprintf("$%d)", len(agentUpdateColumns)+2); !strings.Contains(query, want) {
+		t.Errorf("full-shape query should end its VALUES at %s: %s", want, query)
+	}
+}
@@ -0,0 +1,82 @@
+package db
+
+import (
+	"context"
+	"database/sql"
+	"fmt"
+	"log"
+)
+
+// Hot-path statements with fixed SQL text. They are prepared once at startup;
+// database/sql re-prepares each one lazily on any new pooled connection.
+const (
+	insertLicenseCheckSQL = `INSERT INTO license_checks
+         (discord_id, guild_id, first_name, last_name, state, npn, license_number,
+          license_type, license_status, expiration_date, loas, found, error, checked_at)
+         VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)`
+
+	optedInEmailSQL = `SELECT COALESCE(email,'') FROM onboarding_agents
+         WHERE discord_id = $1 AND COALESCE(email_opt_in, false)`
+)
+
+var getAgentSQL = fmt.Sprintf(`SELECT %s FROM onboarding_agents WHERE discord_id = $1`, AgentSelectColumns(""))
+
+// preparedStmts holds the statements used on every /verify, sweep row and agent lookup.
+// A nil field means preparing failed; callers then fall back to the plain query.
+type preparedStmts struct {
+	getAgent           *sql.Stmt
+	upsertAgentInsert  *sql.Stmt
+	insertLicenseCheck *sql.Stmt
+	optedInEmail       *sql.Stmt
+}
+
+func (d *DB) prepareStatements(ctx context.Context) {
+	prepare := func(name, query string) *sql.Stmt {
+		stmt, err := d.pool.PrepareContext(ctx, query)
+		if err != nil {
+			log.Printf("db: prepare %s failed, using unprepared queries: %v", name, err)
+			return nil
+		}
+		return stmt
+	}
+	d.stmts = preparedStmts{
+		getAgent:           prepare("getAgent", getAgentSQL),
+		upsertAgentInsert:  prepare("upsertAgentInsert", upsertAgentInsertSQL),
+		insertLicenseCheck: prepare("insertLicenseCheck", insertLicenseCheckSQL),
+		optedInEmail:       prepare("optedInEmail", optedInEmailSQL),
+	}
+}
+
+func (d *DB) closeStatements() {
+	for _, stmt := range []*sql.Stmt{
+		d.stmts.getAgent, d.stmts.upsertAgentInsert, d.stmts.insertLicenseCheck, d.stmts.optedInEmail,
+	} {
+		if stmt != nil {
+			stmt.Close()
+		}
+	}
+}
+
+// execStmt runs a prepared statement, or query directly if it wasn't prepared.
+func (d *DB) execStmt(ctx context.Context, stmt *sql.Stmt, query string, args ...interface{}) (sql.Result, error) {
+	if stmt != nil {
+		return stmt.ExecContext(ctx, args...)
+	}
+	return d.pool.ExecContext(ctx, query, args...)
+}
+
+// queryRowStmt is execStmt for single-row queries.
+func (d *DB) queryRowStmt(ctx context.Context, stmt *sql.Stmt, query string, args ...interface{}) *sql.Row {
+	if stmt != nil {
+		return stmt.QueryRowContext(ctx, args...)
+	}
+	return d.pool.QueryRowContext(ctx, query, args...)
+}
+
+// txStmt returns stmt bound to tx, or a freshly prepared one if stmt is nil.
+func txStmt(ctx context.Context, tx *sql.Tx, stmt *sql.Stmt, query string) (*sql.Stmt, error) {
+	if stmt != nil {
+		return tx.StmtContext(ctx, stmt), nil
+	}
+	return tx.PrepareContext(ctx, query)
+}
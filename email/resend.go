@@ -3,15 +3,23 @@ package email
 import (
 	"fmt"
 	"log"
+	"sync"
+	"time"
 
 	"github.com/resend/resend-go/v3"
 )
 
+// sendInterval spaces Resend API calls to stay under its rate limit of 2 requests per
+// second, however many goroutines are sending.
+const sendInterval = 500 * time.Millisecond
+
 // Client sends transactional emails via Resend.
 type Client struct {
-	client    *resend.Client
-	fromEmail string
-	fromName  string
+	client *resend.Client
+	from   string // "Name <email>", formatted once in NewClient
+
+	mu       sync.Mutex
+	nextSend time.Time
 }
 
 // NewClient returns a configured Resend client, or nil if not configured.
@@ -23,9 +31,8 @@ func NewClient(apiKey, fromEmail, fromName string) *Client {
 		fromName = "VIPA Insurance"
 	}
 	return &Client{
-		client:    resend.NewClient(apiKey),
-		fromEmail: fromEmail,
-		fromName:  fromName,
+		client: resend.NewClient(apiKey),
+		from:   fmt.Sprintf("%s <%s>", fromName, fromEmail),
 	}
 }
 
@@ -35,10 +42,10 @@ func (c *Client) Send(toEmail, toName, subject, htmlBody string) error {
 		return fmt.Errorf("email: client not configured")
 	}
 
-	from := fmt.Sprintf("%s <%s>", c.fromName, c.fromEmail)
+	c.waitTurn()
 
 	params := &resend.SendEmailRequest{
-		From:    from,
+		From:    c.from,
 		To:      []string{toEmail},
 		Subject: subject,
 		Html:    htmlBody,
@@ -53,16 +60,46 @@ func (c *Client) Send(toEmail, toName, subject, htmlBody string) error {
 	return nil
 }
 
+// waitTurn blocks until sendInterval has passed since the previous send started.
+func (c *Client) waitTurn() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if d := time.Until(c.nextSend); d > 0 {
+		time.Sleep(d)
+	}
+	c.nextSend = time.Now().Add(sendInterval)
+}
+
+// reminderUrgency maps the days left on a verification deadline to the reminder label
+// and header color, most urgent first. Anything past the last entry gets no label and
+// defaultReminderColor.
+var reminderUrgency = []struct {
+	maxDays int
+	label   string
+	color   string
+}{
+	{7, "URGENT", "#e74c3c"},    // red
+	{14, "Reminder", "#f39c12"}, // orange
+}
+
+const defaultReminderColor = "#3498db" // blue
+
+// ReminderUrgency returns the label ("" when not urgent) and color for a reminder sent
+// with daysLeft days remaining, so the Discord DM and the email escalate together.
+func ReminderUrgency(daysLeft int) (label, color string) {
+	for _, u := range reminderUrgency {
+		if daysLeft <= u.maxDays {
+			return u.label, u.color
+		}
+	}
+	return "", defaultReminderColor
+}
+
 // SendReminder sends a license verification reminder email.
 func (c *Client) SendReminder(toEmail, toName string, daysLeft int) error {
 	subject := fmt.Sprintf("VIPA: %d days left to verify your license", daysLeft)
 
-	urgencyColor := "#3498db" // blue
-	if daysLeft <= 7 {
-		urgencyColor = "#e74c3c" // red
-	} else if daysLeft <= 14 {
-		urgencyColor = "#f39c12" // orange
-	}
+	_, urgencyColor := ReminderUrgency(daysLeft)
 
 	html := fmt.Sprintf(`
 <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
@@ -0,0 +1,26 @@
+package email
+
+import "testing"
+
+func TestReminderUrgency(t *testing.T) {
+	tests := []struct {
+		daysLeft  int
+		wantLabel string
+		wantColor string
+	}{
+		{-1, "URGENT", "#e74c3c"},
+		{0, "URGENT", "#e74c3c"},
+		{7, "URGENT", "#e74c3c"},
+		{8, "Reminder", "#f39c12"},
+		{14, "Reminder", "#f39c12"},
+		{15, "", "#3498db"},
+		{25, "", "#3498db"},
+	}
+	for _, tt := range tests {
+		label, color := ReminderUrgency(tt.daysLeft)
+		if label != tt.wantLabel || color != tt.wantColor {
+			t.Errorf("ReminderUrgency(%d) = %q, %q, want %q, %q",
+				tt.daysLeft, label, color, tt.wantLabel, tt.wantColor)
+		}
+	}
+}
@@ -4,6 +4,7 @@ go 1.24.0
 
 require (
 	github.com/PuerkitoBio/goquery v1.11.0
+	github.com/andybalholm/cascadia v1.3.3
 	github.com/bogdanfinn/fhttp v0.5.29
 	github.com/bogdanfinn/tls-client v1.7.9
 	github.com/bwmarrin/discordgo v0.29.0
@@ -11,18 +12,17 @@ require (
 	github.com/joho/godotenv v1.5.1
 	github.com/lib/pq v1.11.2
 	github.com/resend/resend-go/v3 v3.1.0
+	golang.org/x/net v0.47.0
 )
 
 require (
 	github.com/andybalholm/brotli v1.1.1 // indirect
-	github.com/andybalholm/cascadia v1.3.3 // indirect
 	github.com/bogdanfinn/utls v1.6.2 // indirect
 	github.com/cloudflare/circl v1.5.0 // indirect
 	github.com/klauspost/compress v1.17.11 // indirect
 	github.com/quic-go/quic-go v0.48.1 // indirect
 	github.com/tam7t/hpkp v0.0.0-20160821193359-2b70b4024ed5 // indirect
 	golang.org/x/crypto v0.44.0 // indirect
-	golang.org/x/net v0.47.0 // indirect
 	golang.org/x/sys v0.38.0 // indirect
 	golang.org/x/text v0.31.0 // indirect
 )
@@ -31,6 +31,7 @@ func main() {
 	log.Println("Database ready")
 
 	tlsClient := tlsclient.New()
+	defer tlsClient.Close()
 	log.Println("TLS client ready")
 
 	// Create WebSocket hub for real-time event broadcasting
@@ -38,6 +39,8 @@ func main() {
 
 	b, err := bot.New(cfg, database, tlsClient, hub)
 	if err != nil {
+		// log.Fatalf skips deferred calls; close the DB so queued activity rows are written
+		database.Close()
 		log.Fatalf("Bot init failed: %v", err)
 	}
 	log.Println("Bot created, connecting to Discord...")
@@ -55,6 +58,7 @@ func main() {
 	}
 
 	if err := b.Run(ctx); err != nil {
+		database.Close()
 		log.Fatalf("Bot error: %v", err)
 	}
 }
@@ -1,6 +1,7 @@
 package scrapers
 
 import (
+	"bytes"
 	"context"
 	"fmt"
 	"log"
@@ -44,6 +45,7 @@ func (s *CaliforniaScraper) LookupByName(ctx context.Context, firstName, lastNam
 	if err != nil {
 		return nil, fmt.Errorf("ca: session error: %w", err)
 	}
+	defer releaseSession(session)
 
 	// Step 1: Solve Turnstile
 	token, err := s.capSolver.SolveTurnstile(ctx, caBaseURL+"/IndividualNameSearch", caTurnstileSiteKey)
@@ -58,10 +60,11 @@ func (s *CaliforniaScraper) LookupByName(ctx context.Context, firstName, lastNam
 		return nil, fmt.Errorf("ca: get request error: %w", err)
 	}
 	getReq.Header = http.Header{
-		"Accept":            {"text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"},
-		"Accept-Language":   {"en-US,en;q=0.9"},
-		"User-Agent":        {"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"},
-		http.HeaderOrderKey: {"Accept", "Accept-Language", "User-Agent"},
+		"Accept":            {acceptBrowserHTML},
+		"Accept-Language":   {acceptLanguage},
+		"Accept-Encoding":   {acceptEncoding},
+		"User-Agent":        {browserUserAgent},
+		http.HeaderOrderKey: {"Accept", "Accept-Language", "Accept-Encoding", "User-Agent"},
 	}
 
 	resp, err := session.Do(getReq)
@@ -70,13 +73,11 @@ func (s *CaliforniaScraper) LookupByName(ctx context.Context, firstName, lastNam
 	}
 	defer resp.Body.Close()
 
-	doc, err := goquery.NewDocumentFromReader(resp.Body)
+	csrfToken, err := inputValue(resp.Body, "__RequestVerificationToken")
 	if err != nil {
 		return nil, fmt.Errorf("ca: parse page failed: %w", err)
 	}
 
-	csrfToken, _ := doc.Find("input[name='__RequestVerificationToken']").Attr("value")
-
 	// Step 3: POST search
 	formData := url.Values{
 		"SearchLastName":            {lastName},
@@ -92,10 +93,11 @@ func (s *CaliforniaScraper) LookupByName(ctx context.Context, firstName, lastNam
 	postReq.Header = http.Header{
 		"Content-Type":      {"application/x-www-form-urlencoded"},
 		"Referer":           {searchURL},
-		"Accept":            {"text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"},
-		"Accept-Language":   {"en-US,en;q=0.9"},
-		"User-Agent":        {"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"},
-		http.HeaderOrderKey: {"Content-Type", "Referer", "Accept", "Accept-Language", "User-Agent"},
+		"Accept":            {acceptBrowserHTML},
+		"Accept-Language":   {acceptLanguage},
+		"Accept-Encoding":   {acceptEncoding},
+		"User-Agent":        {browserUserAgent},
+		http.HeaderOrderKey: {"Content-Type", "Referer", "Accept", "Accept-Language", "Accept-Encoding", "User-Agent"},
 	}
 
 	postResp, err := session.Do(postReq)
@@ -104,28 +106,34 @@ func (s *CaliforniaScraper) LookupByName(ctx context.Context, firstName, lastNam
 	}
 	defer postResp.Body.Close()
 
-	resultDoc, err := goquery.NewDocumentFromReader(postResp.Body)
+	bodyBytes, err := readBody(postResp)
+	if err != nil {
+		return nil, fmt.Errorf("ca: read results failed: %w", err)
+	}
+
+	// Most sweep lookups come back empty -- skip building the DOM when no table has a cell.
+	if !hasDataCells(bodyBytes) {
+		log.Println("CA: No results found")
+		return []LicenseResult{{Found: false, State: "CA"}}, nil
+	}
+
+	resultDoc, err := goquery.NewDocumentFromReader(bytes.NewReader(tablesSpan(bodyBytes)))
 	if err != nil {
 		return nil, fmt.Errorf("ca: parse results failed: %w", err)
 	}
 
 	// Step 4: Parse results table
-	var results []LicenseResult
-	resultDoc.Find("table tbody tr").Each(func(i int, row *goquery.Selection) {
-		if i >= 5 {
-			return
-		}
-		cells := row.Find("td")
-		if cells.Length() < 3 {
-			return
+	results := make([]LicenseResult, 0, maxNameResults)
+	resultDoc.FindMatcher(selResultRows).EachWithBreak(func(i int, row *goquery.Selection) bool {
+		if i >= maxNameResults {
+			return false
 		}
-		name := strings.TrimSpace(cells.Eq(0).Text())
-		licNum := strings.TrimSpace(cells.Eq(1).Text())
-		licType := strings.TrimSpace(cells.Eq(2).Text())
-		status := ""
-		if cells.Length() > 3 {
-			status = strings.TrimSpace(cells.Eq(3).Text())
+		// Name | License # | Type | Status
+		var cols [4]string
+		if cellTexts(row, cols[:]) < 3 {
+			return true
 		}
+		name, licNum, licType, status := cols[0], cols[1], cols[2], cols[3]
 
 		active := strings.Contains(strings.ToLower(status), "active")
 
@@ -138,6 +146,7 @@ func (s *CaliforniaScraper) LookupByName(ctx context.Context, firstName, lastNam
 			LicenseType:   licType,
 			Status:        status,
 		})
+		return true
 	})
 
 	if len(results) == 0 {
@@ -1,11 +1,12 @@
 package captcha
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
 	"io"
-	"strings"
+	"sync"
 	"time"
 
 	http "github.com/bogdanfinn/fhttp"
@@ -15,36 +16,73 @@ import (
 
 type CapSolver struct {
 	APIKey string
+
+	// session, when set, supplies the process-wide pooled TLS client so CapSolver
+	// calls ride the same keep-alive pool as the rest of the bot.
+	session func() (tls_client.HttpClient, error)
+
+	clientOnce sync.Once
+	client     tls_client.HttpClient
+	clientErr  error
 }
 
-func NewCapSolver(apiKey string) *CapSolver {
+func NewCapSolver(apiKey string, session func() (tls_client.HttpClient, error)) *CapSolver {
 	if apiKey == "" {
 		return nil
 	}
-	return &CapSolver{APIKey: apiKey}
+	return &CapSolver{APIKey: apiKey, session: session}
+}
+
+// Request bodies for the CapSolver API. Typed structs encode without the map
+// reflection and key sorting json.Marshal does for map payloads.
+type turnstileTask struct {
+	Type       string `json:"type"`
+	WebsiteURL string `json:"websiteURL"`
+	WebsiteKey string `json:"websiteKey"`
+}
+
+type createTaskRequest struct {
+	ClientKey string        `json:"clientKey"`
+	Task      turnstileTask `json:"task"`
+}
+
+type taskResultRequest struct {
+	ClientKey string `json:"clientKey"`
+	TaskID    string `json:"taskId"`
+}
+
+// httpClient returns the TLS client used for CapSolver API calls (not the per-lookup
+// DOI sessions). The CapSolver API is stateless, so it uses the shared session when
+// one was provided; otherwise a private client is built once and reused.
+func (cs *CapSolver) httpClient() (tls_client.HttpClient, error) {
+	if cs.session != nil {
+		return cs.session()
+	}
+	cs.clientOnce.Do(func() {
+		options := []tls_client.HttpClientOption{
+			tls_client.WithTimeoutSeconds(90),
+			tls_client.WithClientProfile(tls_client_profiles.Chrome_124),
+			tls_client.WithCookieJar(tls_client.NewCookieJar()),
+		}
+		cs.client, cs.clientErr = tls_client.NewHttpClient(nil, options...)
+	})
+	return cs.client, cs.clientErr
 }
 
 // SolveTurnstile solves a Cloudflare Turnstile challenge via CapSolver API.
 func (cs *CapSolver) SolveTurnstile(ctx context.Context, websiteURL, siteKey string) (string, error) {
-	// Create a basic TLS client for CapSolver API calls (not the same session as DOI sites)
-	jar := tls_client.NewCookieJar()
-	options := []tls_client.HttpClientOption{
-		tls_client.WithTimeoutSeconds(90),
-		tls_client.WithClientProfile(tls_client_profiles.Chrome_124),
-		tls_client.WithCookieJar(jar),
-	}
-	client, err := tls_client.NewHttpClient(nil, options...)
+	client, err := cs.httpClient()
 	if err != nil {
 		return "", fmt.Errorf("capsolver: client error: %w", err)
 	}
 
 	// Step 1: Create task
-	taskPayload := map[string]interface{}{
-		"clientKey": cs.APIKey,
-		"task": map[string]interface{}{
-			"type":       "AntiTurnstileTaskProxyLess",
-			"websiteURL": websiteURL,
-			"websiteKey": siteKey,
+	taskPayload := createTaskRequest{
+		ClientKey: cs.APIKey,
+		Task: turnstileTask{
+			Type:       "AntiTurnstileTaskProxyLess",
+			WebsiteURL: websiteURL,
+			WebsiteKey: siteKey,
 		},
 	}
 	taskJSON, err := json.Marshal(taskPayload)
@@ -52,7 +90,7 @@ func (cs *CapSolver) SolveTurnstile(ctx context.Context, websiteURL, siteKey str
 		return "", fmt.Errorf("capsolver: failed to marshal task: %w", err)
 	}
 
-	req, err := http.NewRequestWithContext(ctx, http.MethodPost, "https://api.capsolver.com/createTask", strings.NewReader(string(taskJSON)))
+	req, err := http.NewRequestWithContext(ctx, http.MethodPost, "https://api.capsolver.com/createTask", bytes.NewReader(taskJSON))
 	if err != nil {
 		return "", fmt.Errorf("capsolver: create request error: %w", err)
 	}
@@ -83,9 +121,9 @@ func (cs *CapSolver) SolveTurnstile(ctx context.Context, websiteURL, siteKey str
 	}
 
 	// Step 2: Poll for result every 3s, max 60s
-	pollPayload := map[string]string{
-		"clientKey": cs.APIKey,
-		"taskId":    createResp.TaskID,
+	pollPayload := taskResultRequest{
+		ClientKey: cs.APIKey,
+		TaskID:    createResp.TaskID,
 	}
 	pollJSON, err := json.Marshal(pollPayload)
 	if err != nil {
@@ -100,7 +138,7 @@ func (cs *CapSolver) SolveTurnstile(ctx context.Context, websiteURL, siteKey str
 		case <-time.After(3 * time.Second):
 		}
 
-		req, err := http.NewRequestWithContext(ctx, http.MethodPost, "https://api.capsolver.com/getTaskResult", strings.NewReader(string(pollJSON)))
+		req, err := http.NewRequestWithContext(ctx, http.MethodPost, "https://api.capsolver.com/getTaskResult", bytes.NewReader(pollJSON))
 		if err != nil {
 			return "", fmt.Errorf("capsolver: poll request error: %w", err)
 		}
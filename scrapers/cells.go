@@ -0,0 +1,44 @@
+package scrapers
+
+import (
+	"strings"
+
+	"github.com/PuerkitoBio/goquery"
+	"golang.org/x/net/html"
+)
+
+// cellTexts fills dst with the trimmed text of the first len(dst) <td> cells in row,
+// leaving "" for cells the row doesn't have, and returns how many cells the row has.
+// It reads the text straight off the nodes, instead of wrapping every cell in its own
+// Selection via Eq(i) and flattening it with Text().
+func cellTexts(row *goquery.Selection, dst []string) int {
+	cells := row.FindMatcher(selTd).Nodes
+	for i := range dst {
+		if i < len(cells) {
+			dst[i] = nodeText(cells[i])
+		} else {
+			dst[i] = ""
+		}
+	}
+	return len(cells)
+}
+
+// nodeText returns the trimmed text content of n, like Selection.Text followed by
+// strings.TrimSpace. A cell holding a single text node is returned without copying.
+func nodeText(n *html.Node) string {
+	if c := n.FirstChild; c != nil && c.NextSibling == nil && c.Type == html.TextNode {
+		return strings.TrimSpace(c.Data)
+	}
+	var sb strings.Builder
+	var walk func(*html.Node)
+	walk = func(n *html.Node) {
+		if n.Type == html.TextNode {
+			sb.WriteString(n.Data)
+		}
+		for c := n.FirstChild; c != nil; c = c.NextSibling {
+			walk(c)
+		}
+	}
+	walk(n)
+	return strings.TrimSpace(sb.String())
+}
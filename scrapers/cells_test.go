@@ -0,0 +1,71 @@
+package scrapers
+
+import (
+	"strings"
+	"testing"
+
+	"github.com/PuerkitoBio/goquery"
+)
+
+func parseRow(t *testing.T, cells string) *goquery.Selection {
+	t.Helper()
+	doc, err := goquery.NewDocumentFromReader(strings.NewReader("<table><tr>" + cells + "</tr></table>"))
+	if err != nil {
+		t.Fatalf("parse: %v", err)
+	}
+	return doc.FindMatcher(selTr).First()
+}
+
+func TestCellTexts(t *testing.T) {
+	tests := []struct {
+		name      string
+		cells     string
+		dstLen    int
+		want      []string
+		wantCells int
+	}{
+		{"plain text", `<td>Smith</td><td> Jane </td><td>CA</td>`, 3,
+			[]string{"Smith", "Jane", "CA"}, 3},
+		{"nested markup", `<td> <a href="#"><b>Jane</b> Doe</a> </td><td>Line 1<br>Line 2</td>`, 2,
+			[]string{"Jane Doe", "Line 1Line 2"}, 2},
+		{"entities", `<td>A &amp; B</td><td>&nbsp;Active</td>`, 2,
+			[]string{"A & B", "Active"}, 2},
+		{"empty cells", `<td></td><td>   </td>`, 2,
+			[]string{"", ""}, 2},
+		{"short row pads with empty", `<td>Smith</td>`, 3,
+			[]string{"Smith", "", ""}, 1},
+		{"long row is truncated", `<td>a</td><td>b</td><td>c</td><td>d</td>`, 2,
+			[]string{"a", "b"}, 4},
+		{"header cells ignored", `<th>Name</th><td>Smith</td>`, 1,
+			[]string{"Smith"}, 1},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			dst := make([]string, tt.dstLen)
+			for i := range dst {
+				dst[i] = "stale"
+			}
+			n := cellTexts(parseRow(t, tt.cells), dst)
+			if n != tt.wantCells {
+				t.Errorf("cellTexts returned %d, want %d", n, tt.wantCells)
+			}
+			for i := range tt.want {
+				if dst[i] != tt.want[i] {
+					t.Errorf("dst[%d] = %q, want %q", i, dst[i], tt.want[i])
+				}
+			}
+		})
+	}
+}
+
+// nodeText must agree with the Selection.Text + TrimSpace it replaced.
+func TestNodeTextMatchesSelectionText(t *testing.T) {
+	row := parseRow(t, `<td>Smith</td><td> <span>Jane</span>
+		<i>Q.</i> </td><td></td><td>&lt;none&gt;</td><td><div><p>deep</p> text</div></td>`)
+	row.FindMatcher(selTd).Each(func(i int, cell *goquery.Selection) {
+		want := strings.TrimSpace(cell.Text())
+		if got := nodeText(cell.Nodes[0]); got != want {
+			t.Errorf("cell %d: nodeText = %q, Text = %q", i, got, want)
+		}
+	})
+}
@@ -1,27 +1,56 @@
 package scrapers
 
 import (
+	"bytes"
 	"context"
 	"fmt"
 	"io"
 	"log"
 	"net/url"
 	"strings"
+	"sync"
+	"time"
 
-	http "github.com/bogdanfinn/fhttp"
 	"github.com/PuerkitoBio/goquery"
+	http "github.com/bogdanfinn/fhttp"
+	tls_client "github.com/bogdanfinn/tls-client"
 )
 
 const flBaseURL = "https://licenseesearch.fldfs.com"
 
+// The FL search needs a GET / for its ASP.NET session cookies before the POST. Those
+// cookies outlive a single lookup, so finished sessions are parked (up to flIdleSessions)
+// and the next lookup reuses one instead of paying for the warm-up GET again, as long as
+// it was last used within flSessionTTL (kept under ASP.NET's default 20-minute sliding
+// session timeout). Each lookup still has a session to itself.
+const (
+	flIdleSessions = 4
+	flSessionTTL   = 15 * time.Minute
+)
+
+// flSession is a TLS client whose cookie jar holds FL DOI session cookies.
+type flSession struct {
+	client   tls_client.HttpClient
+	lastUsed time.Time
+}
+
+// httpDoer is the part of a TLS client session the FL parsers need to fetch detail pages.
+type httpDoer interface {
+	Do(req *http.Request) (*http.Response, error)
+}
+
 // FloridaScraper scrapes the Florida Department of Financial Services license search.
 type FloridaScraper struct {
 	sessionFactory SessionFactory
+	idle           chan *flSession // warmed sessions not in use
 }
 
 // NewFloridaScraper creates a new Florida DOI scraper.
 func NewFloridaScraper(sessionFactory SessionFactory) *FloridaScraper {
-	return &FloridaScraper{sessionFactory: sessionFactory}
+	return &FloridaScraper{
+		sessionFactory: sessionFactory,
+		idle:           make(chan *flSession, flIdleSessions),
+	}
 }
 
 // StateCode returns "FL".
@@ -51,189 +80,327 @@ func (s *FloridaScraper) LookupByLicenseNumber(ctx context.Context, licenseNumbe
 	return s.search(ctx, form)
 }
 
+// flFormTemplate is the URL-encoded part of the FL DOI search form that never changes:
+// every filter we don't search on, paging, tabs and the hidden endpoint URLs. It is
+// encoded once; buildFormData only appends the four search fields.
+var flFormTemplate = url.Values{
+	"IndividualMNameFilter":                     {""},
+	"EmailAddressBeginContainFilter":            {"1"},
+	"EmailFilter":                               {""},
+	"FirmNameBeginContainFilter":                {"1"},
+	"FirmNameFilter":                            {""},
+	"ResidentStatusFilter":                      {""},
+	"LicenseStatusFilter":                       {"1"},
+	"LicenseCategoryFilter":                     {""},
+	"LicenseIssueDateFromFilter":                {""},
+	"LicenseIssueDateToFilter":                  {""},
+	"OnlyLicWithNoQuApptFilter":                 {"false"},
+	"BusinessStateFilter":                       {""},
+	"BusinessCityFilter":                        {""},
+	"BusinessCountyFilter":                      {""},
+	"BusinessZipFilter":                         {""},
+	"CEDueDtFromFilter":                         {""},
+	"CEDueDtToFilter":                           {""},
+	"CEHrsNotMetFilter":                         {"false"},
+	"AppointingEntityTYCLFilter":                {""},
+	"AppointingEntityStatusFilter":              {""},
+	"AppointingEntityStatusDateFromFilter":      {""},
+	"AppointingEntityStatusDateToFilter":        {""},
+	"LicenseeSearchInfo.PagingInfo.SortBy":      {"Name"},
+	"LicenseeSearchInfo.PagingInfo.SortDesc":    {"False"},
+	"LicenseeSearchInfo.PagingInfo.CurrentPage": {"1"},
+	"AppointingEntityIdFilter":                  {""},
+	"AppointingEntityDisplayName":               {""},
+	"TabLLValue":                                {"0"},
+	"TabCEValue":                                {"0"},
+	"TabAppValue":                               {""},
+	"hdnLApptEntitySearchListUrl":               {"/Home/GetAppointingEntityListForSearch"},
+	"hdnLicenseeSearchListUrl":                  {"/Home/GetLicenseeSearchListPartialView"},
+}.Encode()
+
 // buildFormData builds the full POST payload matching the FL DOI form exactly.
-func (s *FloridaScraper) buildFormData(firstName, lastName, licenseNumber, npn string) url.Values {
-	return url.Values{
-		"IndividualFNameFilter":                          {strings.TrimSpace(firstName)},
-		"IndividualLNameFilter":                          {strings.TrimSpace(lastName)},
-		"IndividualMNameFilter":                          {""},
-		"EmailAddressBeginContainFilter":                 {"1"},
-		"EmailFilter":                                    {""},
-		"FirmNameBeginContainFilter":                     {"1"},
-		"FirmNameFilter":                                 {""},
-		"ResidentStatusFilter":                           {""},
-		"FLLicenseNoFilter":                              {strings.TrimSpace(licenseNumber)},
-		"NPNNoFilter":                                    {strings.TrimSpace(npn)},
-		"LicenseStatusFilter":                            {"1"},
-		"LicenseCategoryFilter":                          {""},
-		"LicenseIssueDateFromFilter":                     {""},
-		"LicenseIssueDateToFilter":                       {""},
-		"OnlyLicWithNoQuApptFilter":                      {"false"},
-		"BusinessStateFilter":                            {""},
-		"BusinessCityFilter":                             {""},
-		"BusinessCountyFilter":                           {""},
-		"BusinessZipFilter":                              {""},
-		"CEDueDtFromFilter":                              {""},
-		"CEDueDtToFilter":                                {""},
-		"CEHrsNotMetFilter":                              {"false"},
-		"AppointingEntityTYCLFilter":                     {""},
-		"AppointingEntityStatusFilter":                   {""},
-		"AppointingEntityStatusDateFromFilter":            {""},
-		"AppointingEntityStatusDateToFilter":              {""},
-		"LicenseeSearchInfo.PagingInfo.SortBy":           {"Name"},
-		"LicenseeSearchInfo.PagingInfo.SortDesc":         {"False"},
-		"LicenseeSearchInfo.PagingInfo.CurrentPage":      {"1"},
-		"AppointingEntityIdFilter":                       {""},
-		"AppointingEntityDisplayName":                    {""},
-		"TabLLValue":                                     {"0"},
-		"TabCEValue":                                     {"0"},
-		"TabAppValue":                                    {""},
-		"hdnLApptEntitySearchListUrl":                    {"/Home/GetAppointingEntityListForSearch"},
-		"hdnLicenseeSearchListUrl":                       {"/Home/GetLicenseeSearchListPartialView"},
+func (s *FloridaScraper) buildFormData(firstName, lastName, licenseNumber, npn string) string {
+	search := url.Values{
+		"IndividualFNameFilter": {strings.TrimSpace(firstName)},
+		"IndividualLNameFilter": {strings.TrimSpace(lastName)},
+		"FLLicenseNoFilter":     {strings.TrimSpace(licenseNumber)},
+		"NPNNoFilter":           {strings.TrimSpace(npn)},
 	}
+	return flFormTemplate + "&" + search.Encode()
 }
 
-// search executes the two-step search: GET to establish cookies, then POST form to /.
-func (s *FloridaScraper) search(ctx context.Context, form url.Values) ([]LicenseResult, error) {
-	session, err := s.sessionFactory()
+// search executes the two-step search: GET to establish cookies (skipped on a warm
+// session), then POST form to /. A parked session may have been expired by the server
+// since it was last used; if it gets back a page that isn't a search response, the
+// search is retried once on a fresh session.
+func (s *FloridaScraper) search(ctx context.Context, form string) ([]LicenseResult, error) {
+	if sess := s.takeWarmSession(); sess != nil {
+		results, recognized, err := s.post(ctx, sess, form)
+		if err != nil || recognized {
+			return results, err
+		}
+		log.Println("FL: warm session got an unrecognized page, retrying with a fresh session")
+	}
+
+	client, err := s.sessionFactory()
 	if err != nil {
 		return nil, fmt.Errorf("fl: session error: %w", err)
 	}
 
 	// Step 1: GET / to establish session cookies
-	getReq, err := http.NewRequestWithContext(ctx, http.MethodGet, flBaseURL, nil)
-	if err != nil {
-		return nil, fmt.Errorf("fl: GET request build error: %w", err)
-	}
-	getReq.Header = http.Header{
-		"Accept":            {"text/html"},
-		"Accept-Language":   {"en-US,en;q=0.9"},
-		http.HeaderOrderKey: {"Accept", "Accept-Language"},
+	if results, err := s.warmUp(ctx, client); results != nil || err != nil {
+		releaseSession(client)
+		return results, err
 	}
 
-	getResp, err := session.Do(getReq)
-	if err != nil {
-		return nil, fmt.Errorf("fl: GET request failed: %w", err)
+	results, recognized, err := s.post(ctx, &flSession{client: client}, form)
+	if err == nil && !recognized {
+		return nil, fmt.Errorf("fl: search returned an unrecognized page")
 	}
-	io.Copy(io.Discard, getResp.Body)
-	getResp.Body.Close()
+	return results, err
+}
 
-	if getResp.StatusCode != 200 {
-		return []LicenseResult{{Error: fmt.Sprintf("HTTP %d on GET", getResp.StatusCode)}}, nil
-	}
+// post submits the search form on sess and parses the response. recognized is false
+// when a 200 page was neither a results table nor a no-results message, which is what
+// an expired session gets; results are nil then. sess is parked for reuse only when it
+// got a results page, and released otherwise.
+func (s *FloridaScraper) post(ctx context.Context, sess *flSession, form string) ([]LicenseResult, bool, error) {
+	keep := false
+	defer func() {
+		if keep {
+			s.putWarmSession(sess)
+		} else {
+			releaseSession(sess.client)
+		}
+	}()
+	session := sess.client
 
 	// Step 2: POST / with full form payload
-	postReq, err := http.NewRequestWithContext(ctx, http.MethodPost, flBaseURL+"/", strings.NewReader(form.Encode()))
+	postReq, err := http.NewRequestWithContext(ctx, http.MethodPost, flBaseURL+"/", strings.NewReader(form))
 	if err != nil {
-		return nil, fmt.Errorf("fl: POST request build error: %w", err)
+		return nil, false, fmt.Errorf("fl: POST request build error: %w", err)
 	}
 	postReq.Header = http.Header{
 		"Content-Type":      {"application/x-www-form-urlencoded"},
 		"Referer":           {flBaseURL},
 		"Accept":            {"text/html"},
-		"Accept-Language":   {"en-US,en;q=0.9"},
-		http.HeaderOrderKey: {"Content-Type", "Referer", "Accept", "Accept-Language"},
+		"Accept-Language":   {acceptLanguage},
+		"Accept-Encoding":   {acceptEncoding},
+		http.HeaderOrderKey: {"Content-Type", "Referer", "Accept", "Accept-Language", "Accept-Encoding"},
 	}
 
 	postResp, err := session.Do(postReq)
 	if err != nil {
-		return nil, fmt.Errorf("fl: POST request failed: %w", err)
+		return nil, false, fmt.Errorf("fl: POST request failed: %w", err)
 	}
 	defer postResp.Body.Close()
 
 	if postResp.StatusCode != 200 {
-		return []LicenseResult{{Error: fmt.Sprintf("HTTP %d on POST", postResp.StatusCode)}}, nil
+		return []LicenseResult{{Error: fmt.Sprintf("HTTP %d on POST", postResp.StatusCode)}}, true, nil
 	}
 
 	// Read the full body so we can check for "no results" text and also parse HTML
-	bodyBytes, err := io.ReadAll(postResp.Body)
+	bodyBytes, err := readBody(postResp)
+	if err != nil {
+		return nil, false, fmt.Errorf("fl: read POST body failed: %w", err)
+	}
+
+	results, recognized, err := s.parseSearchResults(ctx, session, bodyBytes)
+	keep = err == nil && recognized
+	return results, recognized, err
+}
+
+// warmUp GETs / so the session picks up its ASP.NET cookies. It returns nil, nil on
+// success, or the result/error search should return.
+func (s *FloridaScraper) warmUp(ctx context.Context, session tls_client.HttpClient) ([]LicenseResult, error) {
+	getReq, err := http.NewRequestWithContext(ctx, http.MethodGet, flBaseURL, nil)
+	if err != nil {
+		return nil, fmt.Errorf("fl: GET request build error: %w", err)
+	}
+	getReq.Header = http.Header{
+		"Accept":            {"text/html"},
+		"Accept-Language":   {acceptLanguage},
+		"Accept-Encoding":   {acceptEncoding},
+		http.HeaderOrderKey: {"Accept", "Accept-Language", "Accept-Encoding"},
+	}
+
+	getResp, err := session.Do(getReq)
 	if err != nil {
-		return nil, fmt.Errorf("fl: read POST body failed: %w", err)
+		return nil, fmt.Errorf("fl: GET request failed: %w", err)
+	}
+	io.Copy(io.Discard, getResp.Body)
+	getResp.Body.Close()
+
+	if getResp.StatusCode != 200 {
+		return []LicenseResult{{Error: fmt.Sprintf("HTTP %d on GET", getResp.StatusCode)}}, nil
+	}
+	return nil, nil
+}
+
+// takeWarmSession returns a parked session used within flSessionTTL, or nil. Stale
+// sessions found on the way are released.
+func (s *FloridaScraper) takeWarmSession() *flSession {
+	for {
+		select {
+		case sess := <-s.idle:
+			if time.Since(sess.lastUsed) < flSessionTTL {
+				return sess
+			}
+			releaseSession(sess.client)
+		default:
+			return nil
+		}
 	}
-	html := string(bodyBytes)
+}
 
-	return s.parseSearchResults(ctx, session, html)
+// putWarmSession parks sess for the next lookup, or releases it if the pool is full.
+func (s *FloridaScraper) putWarmSession(sess *flSession) {
+	sess.lastUsed = time.Now()
+	select {
+	case s.idle <- sess:
+	default:
+		releaseSession(sess.client)
+	}
 }
 
 // parseSearchResults parses the FL DOI search results page and fetches detail pages.
-func (s *FloridaScraper) parseSearchResults(ctx context.Context, session interface{ Do(req *http.Request) (*http.Response, error) }, html string) ([]LicenseResult, error) {
-	lowerHTML := strings.ToLower(html)
-	if strings.Contains(lowerHTML, "no licensee") || strings.Contains(lowerHTML, "no results") {
+// recognized reports whether the page was a real search response, i.e. it had the
+// results table or a no-results message. An expired ASP.NET session gets some other
+// page back; results are nil then and search retries on a fresh session.
+func (s *FloridaScraper) parseSearchResults(ctx context.Context, session httpDoer, body []byte) (results []LicenseResult, recognized bool, err error) {
+	if containsAnyFold(body, "no licensee", "no results") {
 		log.Println("FL: No results found")
-		return []LicenseResult{{Found: false, State: "FL"}}, nil
+		return []LicenseResult{{Found: false, State: "FL"}}, true, nil
 	}
 
-	doc, err := goquery.NewDocumentFromReader(strings.NewReader(html))
+	doc, err := goquery.NewDocumentFromReader(bytes.NewReader(tablesSpan(body)))
 	if err != nil {
-		return nil, fmt.Errorf("fl: parse HTML error: %w", err)
+		return nil, false, fmt.Errorf("fl: parse HTML error: %w", err)
 	}
 
-	table := doc.Find("table.table")
+	table := doc.FindMatcher(selTableTable)
 	if table.Length() == 0 {
 		log.Println("FL: Could not find results table")
-		return []LicenseResult{{Found: false, State: "FL"}}, nil
+		return nil, false, nil
 	}
 
-	tbody := table.First().Find("tbody")
+	tbody := table.First().FindMatcher(selTbody)
 	if tbody.Length() == 0 {
-		return []LicenseResult{{Found: false, State: "FL"}}, nil
+		return []LicenseResult{{Found: false, State: "FL"}}, true, nil
 	}
 
-	var results []LicenseResult
-	tbody.Find("tr").Each(func(i int, row *goquery.Selection) {
-		if len(results) >= 5 {
-			return
+	// Collect the rows first, then fetch their detail pages concurrently
+	results = make([]LicenseResult, 0, maxNameResults)
+	var detailPaths []string
+	tbody.FindMatcher(selTr).EachWithBreak(func(i int, row *goquery.Selection) bool {
+		if len(results) >= maxNameResults {
+			return false
 		}
 
-		cells := row.Find("td")
+		cells := row.FindMatcher(selTd)
 		if cells.Length() < 2 {
-			return
+			return true
 		}
 
 		nameCell := cells.Eq(0)
-		licenseCell := cells.Eq(1)
 
-		link := nameCell.Find("a")
+		link := nameCell.FindMatcher(selAnchor)
 		if link.Length() == 0 {
-			return
+			return true
 		}
 
 		fullName := strings.TrimSpace(link.Text())
 		detailPath, exists := link.Attr("href")
 		if !exists {
-			return
-		}
-		licenseNumber := strings.TrimSpace(licenseCell.Text())
-
-		// Fetch the detail page for status, type, expiration
-		detail := s.fetchDetail(ctx, session, detailPath)
-
-		status := detail["status"]
-		result := LicenseResult{
-			Found:           true,
-			State:           "FL",
-			FullName:        fullName,
-			LicenseNumber:   licenseNumber,
-			Status:          status,
-			Active:          strings.EqualFold(status, "VALID"),
-			LicenseType:     detail["type"],
-			NPN:             detail["npn"],
-			ExpirationDate:  detail["expiration"],
-			IssueDate:       detail["issue_date"],
-			BusinessAddress: detail["business_address"],
-			BusinessPhone:   detail["phone"],
-			Email:           detail["email"],
-			County:          detail["county"],
+			return true
 		}
-		results = append(results, result)
+		licenseNumber := nodeText(cells.Get(1))
+
+		results = append(results, LicenseResult{
+			Found:         true,
+			State:         "FL",
+			FullName:      fullName,
+			LicenseNumber: licenseNumber,
+		})
+		detailPaths = append(detailPaths, detailPath)
+		return true
 	})
 
+	// Fetch the detail pages for status, type, expiration
+	details := s.fetchDetails(ctx, session, detailPaths)
+	for i, detail := range details {
+		r := &results[i]
+		r.Status = detail["status"]
+		r.Active = strings.EqualFold(r.Status, "VALID")
+		r.LicenseType = detail["type"]
+		r.NPN = detail["npn"]
+		r.ExpirationDate = detail["expiration"]
+		r.IssueDate = detail["issue_date"]
+		r.BusinessAddress = detail["business_address"]
+		r.BusinessPhone = detail["phone"]
+		r.Email = detail["email"]
+		r.County = detail["county"]
+	}
+
 	if len(results) == 0 {
-		return []LicenseResult{{Found: false, State: "FL"}}, nil
+		return []LicenseResult{{Found: false, State: "FL"}}, true, nil
 	}
 
 	log.Printf("FL: Found %d results", len(results))
-	return results, nil
+	return results, true, nil
+}
+
+// flDetailConcurrency caps how many FL detail pages are fetched at once per search.
+const flDetailConcurrency = 5
+
+// fetchDetails runs fetchDetail for each path concurrently, at most flDetailConcurrency
+// at a time, and returns the details in the same order as paths.
+func (s *FloridaScraper) fetchDetails(ctx context.Context, session httpDoer, paths []string) []map[string]string {
+	details := make([]map[string]string, len(paths))
+	sem := make(chan struct{}, flDetailConcurrency)
+	var wg sync.WaitGroup
+	for i, path := range paths {
+		wg.Add(1)
+		go func(i int, path string) {
+			defer wg.Done()
+			defer func() {
+				if r := recover(); r != nil {
+					log.Printf("FL detail panic for %s: %v", path, r)
+					details[i] = map[string]string{"error": fmt.Sprint(r)}
+				}
+			}()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			details[i] = s.fetchDetail(ctx, session, path)
+		}(i, path)
+	}
+	wg.Wait()
+	return details
+}
+
+// flPanelKind is what a detail-page panel lists, going by its heading.
+type flPanelKind int
+
+const (
+	flPanelOther flPanelKind = iota
+	flPanelValidLicenses
+	flPanelInvalidLicenses
+	flPanelAppointments
+)
+
+// classifyFLPanel routes a panel by its heading ("Valid Licenses", "Invalid Licenses",
+// "Active Appointments", ...) with one case-insensitive scan per marker and no
+// lowercased copy. "invalid license" is checked first because it contains "valid license".
+func classifyFLPanel(heading string) flPanelKind {
+	switch {
+	case indexFold(heading, "invalid license") >= 0:
+		return flPanelInvalidLicenses
+	case indexFold(heading, "valid license") >= 0:
+		return flPanelValidLicenses
+	case indexFold(heading, "appointment") >= 0:
+		return flPanelAppointments
+	}
+	return flPanelOther
 }
 
 // fetchDetail fetches a licensee detail page and extracts status, type, NPN, etc.
@@ -246,7 +413,7 @@ func (s *FloridaScraper) parseSearchResults(ctx context.Context, session interfa
 //   - "Active Appointments" / "Inactive Appointments" panels
 //
 // Status is determined by WHICH panel the license appears in (Valid vs Invalid).
-func (s *FloridaScraper) fetchDetail(ctx context.Context, session interface{ Do(req *http.Request) (*http.Response, error) }, detailPath string) map[string]string {
+func (s *FloridaScraper) fetchDetail(ctx context.Context, session httpDoer, detailPath string) map[string]string {
 	result := map[string]string{}
 
 	detailURL := flBaseURL + detailPath
@@ -259,8 +426,9 @@ func (s *FloridaScraper) fetchDetail(ctx context.Context, session interface{ Do(
 	req.Header = http.Header{
 		"Accept":            {"text/html"},
 		"Referer":           {flBaseURL + "/"},
-		"Accept-Language":   {"en-US,en;q=0.9"},
-		http.HeaderOrderKey: {"Accept", "Referer", "Accept-Language"},
+		"Accept-Language":   {acceptLanguage},
+		"Accept-Encoding":   {acceptEncoding},
+		http.HeaderOrderKey: {"Accept", "Referer", "Accept-Language", "Accept-Encoding"},
 	}
 
 	resp, err := session.Do(req)
@@ -290,8 +458,8 @@ func (s *FloridaScraper) fetchDetail(ctx context.Context, session interface{ Do(
 	//     <div class="col-md-8">12345</div>
 	//   </div>
 	formFields := map[string]string{}
-	doc.Find("div.form-group").Each(func(_ int, fg *goquery.Selection) {
-		labelTag := fg.Find("label")
+	doc.FindMatcher(selFormGroup).Each(func(_ int, fg *goquery.Selection) {
+		labelTag := fg.FindMatcher(selLabel)
 		if labelTag.Length() == 0 {
 			return
 		}
@@ -327,7 +495,7 @@ func (s *FloridaScraper) fetchDetail(ctx context.Context, session interface{ Do(
 	result["mailing_address"] = formFields["mailing_address"]
 	result["county"] = formFields["county"]
 
-	// ── Extract license types from Valid / Invalid panels ──
+	// ── Walk the panels once: Valid / Invalid licenses and Active / Inactive appointments ──
 	type licenseEntry struct {
 		licType   string
 		issueDate string
@@ -336,37 +504,39 @@ func (s *FloridaScraper) fetchDetail(ctx context.Context, session interface{ Do(
 	var validLicenses []licenseEntry
 	var invalidLicenses []licenseEntry
 
-	doc.Find("div.panel").Each(func(_ int, panel *goquery.Selection) {
-		heading := panel.Find("div.panel-heading")
+	doc.FindMatcher(selPanel).Each(func(_ int, panel *goquery.Selection) {
+		heading := panel.FindMatcher(selPanelHeading)
 		if heading.Length() == 0 {
 			return
 		}
-		headingText := strings.ToLower(strings.TrimSpace(heading.Text()))
+		kind := classifyFLPanel(heading.Text())
+		if kind == flPanelOther {
+			return
+		}
 
-		table := panel.Find("table")
+		table := panel.FindMatcher(selTable)
 		if table.Length() == 0 {
 			return
 		}
-		tbody := table.Find("tbody")
+		tbody := table.FindMatcher(selTbody)
 		if tbody.Length() == 0 {
 			return
 		}
 
-		tbody.Find("tr").Each(func(_ int, row *goquery.Selection) {
-			cells := row.Find("td")
-			if cells.Length() < 2 {
-				return
-			}
-			licType := strings.TrimSpace(cells.Eq(0).Text())
-			issueDate := strings.TrimSpace(cells.Eq(1).Text())
-			entry := licenseEntry{licType: licType, issueDate: issueDate}
-
-			if strings.Contains(headingText, "valid license") {
-				entry.status = "VALID"
-				validLicenses = append(validLicenses, entry)
-			} else if strings.Contains(headingText, "invalid license") {
-				entry.status = "INVALID"
-				invalidLicenses = append(invalidLicenses, entry)
+		tbody.FindMatcher(selTr).Each(func(_ int, row *goquery.Selection) {
+			var cols [3]string
+			n := cellTexts(row, cols[:])
+
+			switch {
+			case kind == flPanelValidLicenses && n >= 2:
+				validLicenses = append(validLicenses, licenseEntry{licType: cols[0], issueDate: cols[1], status: "VALID"})
+			case kind == flPanelInvalidLicenses && n >= 2:
+				invalidLicenses = append(invalidLicenses, licenseEntry{licType: cols[0], issueDate: cols[1], status: "INVALID"})
+			// Active Appointments: Company Name | Issue Date | Exp Date | Status Date
+			case kind == flPanelAppointments && result["expiration"] == "" && n >= 3:
+				if expDate := cols[2]; expDate != "" {
+					result["expiration"] = expDate
+				}
 			}
 		})
 	})
@@ -394,40 +564,5 @@ func (s *FloridaScraper) fetchDetail(ctx context.Context, session interface{ Do(
 		result["status"] = chosen.status
 	}
 
-	// ── Extract expiration from Active/Inactive Appointments ──
-	doc.Find("div.panel").Each(func(_ int, panel *goquery.Selection) {
-		heading := panel.Find("div.panel-heading")
-		if heading.Length() == 0 {
-			return
-		}
-		headingText := strings.ToLower(strings.TrimSpace(heading.Text()))
-		if !strings.Contains(headingText, "appointment") {
-			return
-		}
-
-		table := panel.Find("table")
-		if table.Length() == 0 {
-			return
-		}
-		tbody := table.Find("tbody")
-		if tbody.Length() == 0 {
-			return
-		}
-
-		tbody.Find("tr").Each(func(_ int, row *goquery.Selection) {
-			if result["expiration"] != "" {
-				return
-			}
-			cells := row.Find("td")
-			// Active Appointments: Company Name | Issue Date | Exp Date | Status Date
-			if cells.Length() >= 3 {
-				expDate := strings.TrimSpace(cells.Eq(2).Text())
-				if expDate != "" {
-					result["expiration"] = expDate
-				}
-			}
-		})
-	})
-
 	return result
 }
@@ -0,0 +1,27 @@
+package scrapers
+
+import "testing"
+
+func TestClassifyFLPanel(t *testing.T) {
+	tests := []struct {
+		heading string
+		want    flPanelKind
+	}{
+		{"Valid Licenses", flPanelValidLicenses},
+		{"Invalid Licenses", flPanelInvalidLicenses},
+		{"Active Appointments", flPanelAppointments},
+		{"Inactive Appointments", flPanelAppointments},
+		{"VALID LICENSES", flPanelValidLicenses},
+		{"invalid licenses", flPanelInvalidLicenses},
+		{"  Valid Licenses (2)\n", flPanelValidLicenses},
+		{"iNvAlId LiCeNsEs", flPanelInvalidLicenses},
+		{"ACTIVE appointments", flPanelAppointments},
+		{"Licensee Information", flPanelOther},
+		{"", flPanelOther},
+	}
+	for _, tt := range tests {
+		if got := classifyFLPanel(tt.heading); got != tt.want {
+			t.Errorf("classifyFLPanel(%q) = %d, want %d", tt.heading, got, tt.want)
+		}
+	}
+}
@@ -0,0 +1,14 @@
+package scrapers
+
+// Request header values shared by the scrapers, so a browser version bump is a one-line
+// change. The TLS fingerprint itself comes from the tlsclient profile.
+const (
+	browserUserAgent  = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
+	acceptBrowserHTML = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+	acceptLanguage    = "en-US,en;q=0.9"
+
+	// acceptEncoding is what Chrome sends. tls-client decompresses the response by its
+	// Content-Encoding, so the parsers still see plain HTML/JSON, and the large FL and
+	// CA/TX results pages cross the wire compressed.
+	acceptEncoding = "gzip, deflate, br"
+)
@@ -0,0 +1,70 @@
+package scrapers
+
+import (
+	"io"
+
+	"golang.org/x/net/html"
+)
+
+// inputValue returns the value attribute of the first <input> named name in the HTML
+// read from r, or "" if there is none. It tokenizes instead of building a DOM and stops
+// at the match, for pages where a single hidden field is all we need. The rest of r is
+// drained so the connection can be reused for the follow-up request.
+func inputValue(r io.Reader, name string) (string, error) {
+	defer io.Copy(io.Discard, r)
+
+	z := html.NewTokenizer(r)
+	for {
+		switch z.Next() {
+		case html.ErrorToken:
+			if err := z.Err(); err != io.EOF {
+				return "", err
+			}
+			return "", nil
+		case html.StartTagToken, html.SelfClosingTagToken:
+			tag, hasAttr := z.TagName()
+			if string(tag) != "input" || !hasAttr {
+				continue
+			}
+			var matched bool
+			var value string
+			for more := true; more; {
+				var key, val []byte
+				key, val, more = z.TagAttr()
+				switch string(key) {
+				case "name":
+					matched = string(val) == name
+				case "value":
+					value = string(val)
+				}
+			}
+			if matched {
+				return value, nil
+			}
+		}
+	}
+}
+
+// tablesSpan returns the part of body from the first <table to the end of the last
+// </table>, or body itself if it has no table. The results pages only read rows out of
+// their tables, so handing the parser this span skips building DOM nodes for the head,
+// scripts, nav, the re-rendered search form and the footer.
+func tablesSpan(body []byte) []byte {
+	start := indexFold(body, "<table")
+	if start < 0 {
+		return body
+	}
+	end := lastIndexFold(body[start:], "</table>")
+	if end < 0 {
+		return body[start:]
+	}
+	return body[start : start+end+len("</table>")]
+}
+
+// hasDataCells reports whether the tables in body contain any <td> cell. A results page
+// without one can't yield a row, so it can be reported as not found without parsing.
+// Unlike matching "no results" text, it can't be fooled by placeholder strings sitting in
+// scripts, hidden templates or the footer of a page that does have rows.
+func hasDataCells(body []byte) bool {
+	return indexFold(tablesSpan(body), "<td") >= 0
+}
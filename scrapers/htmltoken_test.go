@@ -0,0 +1,84 @@
+package scrapers
+
+import (
+	"strings"
+	"testing"
+)
+
+func TestInputValue(t *testing.T) {
+	tests := []struct {
+		name string
+		html string
+		want string
+	}{
+		{"hidden field", `<form><input type="hidden" name="token" value="abc123"></form>`, "abc123"},
+		{"self-closing", `<input name="token" value="abc123"/>`, "abc123"},
+		{"value before name", `<input value="abc123" name="token">`, "abc123"},
+		{"upper case tag", `<INPUT NAME="token" VALUE="abc123">`, "abc123"},
+		{"skips other inputs", `<input name="other" value="no"><input name="token" value="yes">`, "yes"},
+		{"first match wins", `<input name="token" value="first"><input name="token" value="second">`, "first"},
+		{"entities unescaped", `<input name="token" value="a&amp;b">`, "a&b"},
+		{"no value", `<input name="token">`, ""},
+		{"missing", `<html><body><input name="other" value="x"></body></html>`, ""},
+		{"empty", ``, ""},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			r := strings.NewReader(tt.html + `<p>trailing content</p>`)
+			got, err := inputValue(r, "token")
+			if err != nil {
+				t.Fatalf("inputValue: %v", err)
+			}
+			if got != tt.want {
+				t.Errorf("inputValue = %q, want %q", got, tt.want)
+			}
+			if r.Len() != 0 {
+				t.Errorf("inputValue left %d bytes unread", r.Len())
+			}
+		})
+	}
+}
+
+func TestTablesSpan(t *testing.T) {
+	tests := []struct {
+		name string
+		body string
+		want string
+	}{
+		{"one table", `<head><script>x</script></head><table><tr><td>A</td></tr></table><footer>f</footer>`,
+			`<table><tr><td>A</td></tr></table>`},
+		{"first to last table", `<nav>n</nav><TABLE id="a"></TABLE><div>between</div><table id="b"></Table><p>end</p>`,
+			`<TABLE id="a"></TABLE><div>between</div><table id="b"></Table>`},
+		{"unclosed table", `<p>x</p><table><tr><td>A`, `<table><tr><td>A`},
+		{"no table", `<p>no results</p>`, `<p>no results</p>`},
+		{"empty", ``, ``},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := string(tablesSpan([]byte(tt.body))); got != tt.want {
+				t.Errorf("tablesSpan = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestHasDataCells(t *testing.T) {
+	tests := []struct {
+		name string
+		body string
+		want bool
+	}{
+		{"row with cells", `<table><tr><th>Name</th></tr><tr><TD>Smith</TD></tr></table>`, true},
+		{"header only", `<table><tr><th>Name</th></tr></table>`, false},
+		{"cell outside tables", `<table><tr><th>Name</th></tr></table><script>"<td>"</script>`, false},
+		{"placeholder text with rows", `<script>var msg = "No results";</script><table><tr><td>Smith</td></tr></table>`, true},
+		{"no table", `<p>No results found</p>`, false},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := hasDataCells([]byte(tt.body)); got != tt.want {
+				t.Errorf("hasDataCells(%q) = %v, want %v", tt.body, got, tt.want)
+			}
+		})
+	}
+}
@@ -0,0 +1,32 @@
+package scrapers
+
+import (
+	"bytes"
+	"io"
+
+	http "github.com/bogdanfinn/fhttp"
+	tls_client "github.com/bogdanfinn/tls-client"
+)
+
+// releaseSession drops a per-lookup session's idle keep-alive connections in the
+// background, so the TLS/TCP teardown stays off the lookup's return path. Do not
+// use it on shared sessions.
+func releaseSession(session tls_client.HttpClient) {
+	go session.CloseIdleConnections()
+}
+
+// maxBodyPrealloc caps how much readBody trusts a response's Content-Length up front.
+const maxBodyPrealloc = 4 << 20
+
+// readBody reads the whole response body. When the server sends a Content-Length the
+// buffer is sized for it once, instead of io.ReadAll growing and copying it repeatedly
+// on the way up to a 100KB+ results page. The bytes go to the parsers as-is: the DOI
+// sites and NAIC all serve UTF-8, which is what the HTML and JSON decoders expect.
+func readBody(resp *http.Response) ([]byte, error) {
+	if n := resp.ContentLength; n > 0 && n <= maxBodyPrealloc {
+		buf := bytes.NewBuffer(make([]byte, 0, n+bytes.MinRead))
+		_, err := buf.ReadFrom(resp.Body)
+		return buf.Bytes(), err
+	}
+	return io.ReadAll(resp.Body)
+}
@@ -0,0 +1,77 @@
+package scrapers
+
+// containsAnyFold reports whether body contains any of the markers, ignoring ASCII case.
+// Markers must be lowercase. It scans the raw response bytes once, trying every marker
+// at each position, so checking a page for its "no results" placeholders doesn't copy
+// the body into a string, lowercase it, or walk it once per marker.
+func containsAnyFold(body []byte, markers ...string) bool {
+	for i := range body {
+		c := toLowerASCII(body[i])
+		for _, m := range markers {
+			if len(m) > 0 && m[0] == c && hasPrefixFold(body[i:], m) {
+				return true
+			}
+		}
+	}
+	return false
+}
+
+// hasPrefixFold reports whether b starts with lower, ignoring ASCII case. lower must be
+// lowercase.
+func hasPrefixFold(b []byte, lower string) bool {
+	if len(b) < len(lower) {
+		return false
+	}
+	for j := 0; j < len(lower); j++ {
+		if toLowerASCII(b[j]) != lower[j] {
+			return false
+		}
+	}
+	return true
+}
+
+// indexFold returns the index of the first ASCII case-insensitive match of lower in b,
+// or -1. lower must be lowercase. b may be a response body or an already-extracted string.
+func indexFold[T ~string | ~[]byte](b T, lower string) int {
+	n := len(lower)
+	if n == 0 {
+		return 0
+	}
+	first := lower[0]
+	for i := 0; i+n <= len(b); i++ {
+		if toLowerASCII(b[i]) != first {
+			continue
+		}
+		j := 1
+		for j < n && toLowerASCII(b[i+j]) == lower[j] {
+			j++
+		}
+		if j == n {
+			return i
+		}
+	}
+	return -1
+}
+
+func toLowerASCII(c byte) byte {
+	if 'A' <= c && c <= 'Z' {
+		return c + ('a' - 'A')
+	}
+	return c
+}
+
+// lastIndexFold returns the index of the last ASCII case-insensitive match of lower in
+// b, or -1. lower must be lowercase.
+func lastIndexFold(b []byte, lower string) int {
+	n := len(lower)
+	for i := len(b) - n; i >= 0; i-- {
+		j := 0
+		for j < n && toLowerASCII(b[i+j]) == lower[j] {
+			j++
+		}
+		if j == n {
+			return i
+		}
+	}
+	return -1
+}
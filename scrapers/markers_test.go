@@ -0,0 +1,73 @@
+package scrapers
+
+import "testing"
+
+func TestContainsAnyFold(t *testing.T) {
+	tests := []struct {
+		name    string
+		body    string
+		markers []string
+		want    bool
+	}{
+		{"exact", "<p>no results found</p>", []string{"no results"}, true},
+		{"mixed case body", "<p>No Results Found</p>", []string{"no results"}, true},
+		{"upper case body", "NO LICENSEE MATCHED", []string{"no results", "no licensee"}, true},
+		{"second marker", "Nothing here. No Licensee.", []string{"no results", "no licensee"}, true},
+		{"at end", "results: none", []string{"none"}, true},
+		{"absent", "<table><tr><td>Smith</td></tr></table>", []string{"no results", "no licensee"}, false},
+		{"partial at end", "no resul", []string{"no results"}, false},
+		{"empty body", "", []string{"no results"}, false},
+		{"no markers", "no results", nil, false},
+		{"empty marker ignored", "anything", []string{""}, false},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := containsAnyFold([]byte(tt.body), tt.markers...); got != tt.want {
+				t.Errorf("containsAnyFold(%q, %q) = %v, want %v", tt.body, tt.markers, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestIndexFold(t *testing.T) {
+	tests := []struct {
+		body  string
+		lower string
+		want  int
+	}{
+		{"<TABLE id=x>", "<table", 0},
+		{"abc<Table>", "<table", 3},
+		{"<tab", "<table", -1},
+		{"a<tr>b<TR>", "<tr", 1},
+		{"xxYy", "yy", 2},
+		{"", "a", -1},
+		{"abc", "", 0},
+	}
+	for _, tt := range tests {
+		if got := indexFold([]byte(tt.body), tt.lower); got != tt.want {
+			t.Errorf("indexFold([]byte(%q), %q) = %d, want %d", tt.body, tt.lower, got, tt.want)
+		}
+		if got := indexFold(tt.body, tt.lower); got != tt.want {
+			t.Errorf("indexFold(%q, %q) = %d, want %d", tt.body, tt.lower, got, tt.want)
+		}
+	}
+}
+
+func TestLastIndexFold(t *testing.T) {
+	tests := []struct {
+		body  string
+		lower string
+		want  int
+	}{
+		{"<table></TABLE>", "</table>", 7},
+		{"</table>x</Table>", "</table>", 9},
+		{"</tab", "</table>", -1},
+		{"", "</table>", -1},
+		{"abc", "", 3},
+	}
+	for _, tt := range tests {
+		if got := lastIndexFold([]byte(tt.body), tt.lower); got != tt.want {
+			t.Errorf("lastIndexFold(%q, %q) = %d, want %d", tt.body, tt.lower, got, tt.want)
+		}
+	}
+}
@@ -1,10 +1,10 @@
 package scrapers
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
-	"io"
 	"log"
 	"net/url"
 	"strings"
@@ -13,7 +13,7 @@ import (
 	tls_client "github.com/bogdanfinn/tls-client"
 )
 
-// SessionFactory creates a new TLS client session with isolated cookies.
+// SessionFactory returns a TLS client session (fresh or shared, depending on the caller).
 type SessionFactory func() (tls_client.HttpClient, error)
 
 // naicAPIResponse matches the JSON structure from the NAIC SBS API.
@@ -111,8 +111,9 @@ func (s *NAICScraper) query(ctx context.Context, params url.Values) ([]LicenseRe
 		"Accept":            {"application/json"},
 		"Origin":            {"https://sbs.naic.org"},
 		"Referer":           {"https://sbs.naic.org/"},
-		"Accept-Language":   {"en-US,en;q=0.9"},
-		http.HeaderOrderKey: {"Accept", "Origin", "Referer", "Accept-Language"},
+		"Accept-Language":   {acceptLanguage},
+		"Accept-Encoding":   {acceptEncoding},
+		http.HeaderOrderKey: {"Accept", "Origin", "Referer", "Accept-Language", "Accept-Encoding"},
 	}
 
 	resp, err := session.Do(req)
@@ -121,7 +122,7 @@ func (s *NAICScraper) query(ctx context.Context, params url.Values) ([]LicenseRe
 	}
 	defer resp.Body.Close()
 
-	body, err := io.ReadAll(resp.Body)
+	body, err := readBody(resp)
 	if err != nil {
 		return nil, fmt.Errorf("naic: read body failed: %w", err)
 	}
@@ -130,15 +131,23 @@ func (s *NAICScraper) query(ctx context.Context, params url.Values) ([]LicenseRe
 		return nil, fmt.Errorf("naic: HTTP %d: %s", resp.StatusCode, string(body))
 	}
 
-	// Check for error response
-	var errResp naicErrorResponse
-	if json.Unmarshal(body, &errResp) == nil && errResp.UnexpectedError != "" {
-		return nil, fmt.Errorf("naic: API error: %s", errResp.UnexpectedError)
+	// Results come back as a JSON array and errors as an object, so look at the first
+	// byte before decoding. A miss is a bare "[]" and skips json.Unmarshal entirely.
+	trimmed := bytes.TrimSpace(body)
+	if bytes.Equal(trimmed, []byte("[]")) {
+		return []LicenseResult{{Found: false, State: s.stateCode}}, nil
+	}
+	if len(trimmed) > 0 && trimmed[0] == '{' {
+		// Check for error response
+		var errResp naicErrorResponse
+		if json.Unmarshal(trimmed, &errResp) == nil && errResp.UnexpectedError != "" {
+			return nil, fmt.Errorf("naic: API error: %s", errResp.UnexpectedError)
+		}
 	}
 
 	// Parse as array of results
 	var apiResults []naicAPIResponse
-	if err := json.Unmarshal(body, &apiResults); err != nil {
+	if err := json.Unmarshal(trimmed, &apiResults); err != nil {
 		// Might be empty or unexpected format
 		return []LicenseResult{{Found: false, State: s.stateCode}}, nil
 	}
@@ -147,7 +156,7 @@ func (s *NAICScraper) query(ctx context.Context, params url.Values) ([]LicenseRe
 		return []LicenseResult{{Found: false, State: s.stateCode}}, nil
 	}
 
-	var results []LicenseResult
+	results := make([]LicenseResult, 0, len(apiResults))
 	for _, r := range apiResults {
 		// Parse active status from license type string
 		active := strings.Contains(strings.ToLower(r.LicenseType), "active")
@@ -3,7 +3,9 @@ package scrapers
 import (
 	"context"
 	"fmt"
+	"log"
 	"strings"
+	"sync"
 
 	"license-bot-go/scrapers/captcha"
 	"license-bot-go/tlsclient"
@@ -65,20 +67,50 @@ var stateFullNames = map[string]string{
 type Registry struct {
 	tlsClient *tlsclient.Client
 	capSolver *captcha.CapSolver
+
+	// scrapers holds one instance per known state code. It is filled in NewRegistry and
+	// never written afterwards, so concurrent lookups read it without locking.
+	scrapers map[string]Scraper
 }
 
 // NewRegistry creates a new scraper registry.
 func NewRegistry(tlsClient *tlsclient.Client, capSolver *captcha.CapSolver) *Registry {
-	return &Registry{
+	r := &Registry{
 		tlsClient: tlsClient,
 		capSolver: capSolver,
+		scrapers:  make(map[string]Scraper, 3+len(NAICStates)+len(ManualLookupURLs)),
+	}
+	for _, st := range []string{"FL", "CA", "TX"} {
+		r.scrapers[st] = r.newScraper(st)
+	}
+	for st := range NAICStates {
+		r.scrapers[st] = r.newScraper(st)
+	}
+	for st := range ManualLookupURLs {
+		r.scrapers[st] = r.newScraper(st)
 	}
+	return r
 }
 
 // GetScraper returns the appropriate scraper for a state code.
+// Scrapers are safe for concurrent use, so one instance per state is built up front and
+// shared by every lookup. Some keep state across lookups on purpose: FL pools warm
+// sessions on its instance, so scrapers must be shared, not cloned or copied per lookup.
 func (r *Registry) GetScraper(stateCode string) Scraper {
+	// Callers almost always pass a canonical code ("FL"), so try it as given first.
+	if s, ok := r.scrapers[stateCode]; ok {
+		return s
+	}
 	stateCode = strings.ToUpper(strings.TrimSpace(stateCode))
+	if s, ok := r.scrapers[stateCode]; ok {
+		return s
+	}
+	// Unknown code -- not cached, so junk input can't grow the map.
+	return r.newScraper(stateCode)
+}
 
+// newScraper builds the scraper implementation for a normalized state code.
+func (r *Registry) newScraper(stateCode string) Scraper {
 	switch stateCode {
 	case "FL":
 		return NewFloridaScraper(r.tlsClient.NewSession)
@@ -88,7 +120,8 @@ func (r *Registry) GetScraper(stateCode string) Scraper {
 		return NewTexasScraper(r.tlsClient.NewSession, r.capSolver)
 	default:
 		if NAICStates[stateCode] {
-			return NewNAICScraper(r.tlsClient.NewSession, stateCode)
+			// NAIC is a stateless JSON API, so every state shares one pooled session.
+			return NewNAICScraper(r.tlsClient.SharedSession, stateCode)
 		}
 		if url, ok := ManualLookupURLs[stateCode]; ok {
 			return NewManualScraper(stateCode, url)
@@ -98,6 +131,54 @@ func (r *Registry) GetScraper(stateCode string) Scraper {
 	}
 }
 
+// LookupByNameInStates runs the same name search in every given state concurrently, at
+// most concurrency at a time, and returns the results keyed by state code. A lookup that
+// fails is logged and reported as a single not-found result carrying the error, so one
+// slow or broken DOI doesn't hold up or hide the others.
+func (r *Registry) LookupByNameInStates(ctx context.Context, states []string, firstName, lastName string, concurrency int) map[string][]LicenseResult {
+	if concurrency <= 0 {
+		concurrency = len(states)
+	}
+	sem := make(chan struct{}, concurrency)
+
+	var mu sync.Mutex
+	var wg sync.WaitGroup
+	out := make(map[string][]LicenseResult, len(states))
+
+	for _, st := range states {
+		wg.Add(1)
+		go func(stateCode string) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			results, err := r.lookupByNameSafe(ctx, stateCode, firstName, lastName)
+			if err != nil {
+				log.Printf("%s lookup error: %v", stateCode, err)
+				results = []LicenseResult{{Found: false, State: stateCode, Error: err.Error()}}
+			}
+
+			mu.Lock()
+			out[stateCode] = results
+			mu.Unlock()
+		}(st)
+	}
+
+	wg.Wait()
+	return out
+}
+
+// lookupByNameSafe is LookupByName on the state's scraper, with a panic turned into an
+// error so it can't take down the other lookups in a fan-out.
+func (r *Registry) lookupByNameSafe(ctx context.Context, stateCode, firstName, lastName string) (results []LicenseResult, err error) {
+	defer func() {
+		if p := recover(); p != nil {
+			err = fmt.Errorf("panic: %v", p)
+		}
+	}()
+	return r.GetScraper(stateCode).LookupByName(ctx, firstName, lastName)
+}
+
 // ManualScraper returns a result directing users to manually look up their license.
 type ManualScraper struct {
 	stateCode string
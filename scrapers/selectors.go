@@ -0,0 +1,21 @@
+package scrapers
+
+import "github.com/andybalholm/cascadia"
+
+// Precompiled selectors for the HTML scrapers. goquery's Find(string) compiles its
+// selector on every call, and the per-row ones ("td", "a") run once per result row.
+var (
+	selResultRows = cascadia.MustCompile("table tbody tr") // CA/TX results grid
+	selTableTable = cascadia.MustCompile("table.table")    // FL results grid
+	selTable      = cascadia.MustCompile("table")
+	selTbody      = cascadia.MustCompile("tbody")
+	selTr         = cascadia.MustCompile("tr")
+	selTd         = cascadia.MustCompile("td")
+	selAnchor     = cascadia.MustCompile("a")
+
+	// FL detail page
+	selFormGroup    = cascadia.MustCompile("div.form-group")
+	selLabel        = cascadia.MustCompile("label")
+	selPanel        = cascadia.MustCompile("div.panel")
+	selPanelHeading = cascadia.MustCompile("div.panel-heading")
+)
@@ -1,6 +1,7 @@
 package scrapers
 
 import (
+	"bytes"
 	"context"
 	"fmt"
 	"log"
@@ -41,6 +42,7 @@ func (s *TexasScraper) LookupByName(ctx context.Context, firstName, lastName str
 	if err != nil {
 		return nil, fmt.Errorf("tx: session error: %w", err)
 	}
+	defer releaseSession(session)
 
 	// Step 1: GET search page
 	getReq, err := http.NewRequestWithContext(ctx, http.MethodGet, txBaseURL, nil)
@@ -48,10 +50,11 @@ func (s *TexasScraper) LookupByName(ctx context.Context, firstName, lastName str
 		return nil, fmt.Errorf("tx: get request error: %w", err)
 	}
 	getReq.Header = http.Header{
-		"Accept":            {"text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"},
-		"Accept-Language":   {"en-US,en;q=0.9"},
-		"User-Agent":        {"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"},
-		http.HeaderOrderKey: {"Accept", "Accept-Language", "User-Agent"},
+		"Accept":            {acceptBrowserHTML},
+		"Accept-Language":   {acceptLanguage},
+		"Accept-Encoding":   {acceptEncoding},
+		"User-Agent":        {browserUserAgent},
+		http.HeaderOrderKey: {"Accept", "Accept-Language", "Accept-Encoding", "User-Agent"},
 	}
 
 	resp, err := session.Do(getReq)
@@ -60,14 +63,12 @@ func (s *TexasScraper) LookupByName(ctx context.Context, firstName, lastName str
 	}
 	defer resp.Body.Close()
 
-	doc, err := goquery.NewDocumentFromReader(resp.Body)
+	// Extract captchaToken
+	captchaToken, err := inputValue(resp.Body, "captchaToken")
 	if err != nil {
 		return nil, fmt.Errorf("tx: parse page failed: %w", err)
 	}
 
-	// Extract captchaToken
-	captchaToken, _ := doc.Find("input[name='captchaToken']").Attr("value")
-
 	// Step 2: Solve captcha (using Turnstile solver as fallback -- TX may use reCAPTCHA)
 	// For TX, we try solving whatever captcha is present
 	var solvedToken string
@@ -94,10 +95,11 @@ func (s *TexasScraper) LookupByName(ctx context.Context, firstName, lastName str
 	postReq.Header = http.Header{
 		"Content-Type":      {"application/x-www-form-urlencoded"},
 		"Referer":           {txBaseURL},
-		"Accept":            {"text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"},
-		"Accept-Language":   {"en-US,en;q=0.9"},
-		"User-Agent":        {"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"},
-		http.HeaderOrderKey: {"Content-Type", "Referer", "Accept", "Accept-Language", "User-Agent"},
+		"Accept":            {acceptBrowserHTML},
+		"Accept-Language":   {acceptLanguage},
+		"Accept-Encoding":   {acceptEncoding},
+		"User-Agent":        {browserUserAgent},
+		http.HeaderOrderKey: {"Content-Type", "Referer", "Accept", "Accept-Language", "Accept-Encoding", "User-Agent"},
 	}
 
 	postResp, err := session.Do(postReq)
@@ -106,31 +108,34 @@ func (s *TexasScraper) LookupByName(ctx context.Context, firstName, lastName str
 	}
 	defer postResp.Body.Close()
 
-	resultDoc, err := goquery.NewDocumentFromReader(postResp.Body)
+	bodyBytes, err := readBody(postResp)
+	if err != nil {
+		return nil, fmt.Errorf("tx: read results failed: %w", err)
+	}
+
+	// Most sweep lookups come back empty -- skip building the DOM when no table has a cell.
+	if !hasDataCells(bodyBytes) {
+		log.Println("TX: No results found")
+		return []LicenseResult{{Found: false, State: "TX"}}, nil
+	}
+
+	resultDoc, err := goquery.NewDocumentFromReader(bytes.NewReader(tablesSpan(bodyBytes)))
 	if err != nil {
 		return nil, fmt.Errorf("tx: parse results failed: %w", err)
 	}
 
 	// Step 4: Parse results
-	var results []LicenseResult
-	resultDoc.Find("table tbody tr").Each(func(i int, row *goquery.Selection) {
-		if i >= 5 {
-			return
-		}
-		cells := row.Find("td")
-		if cells.Length() < 2 {
-			return
-		}
-		name := strings.TrimSpace(cells.Eq(0).Text())
-		licNum := strings.TrimSpace(cells.Eq(1).Text())
-		status := ""
-		if cells.Length() > 2 {
-			status = strings.TrimSpace(cells.Eq(2).Text())
+	results := make([]LicenseResult, 0, maxNameResults)
+	resultDoc.FindMatcher(selResultRows).EachWithBreak(func(i int, row *goquery.Selection) bool {
+		if i >= maxNameResults {
+			return false
 		}
-		licType := ""
-		if cells.Length() > 3 {
-			licType = strings.TrimSpace(cells.Eq(3).Text())
+		// Name | License # | Status | Type
+		var cols [4]string
+		if cellTexts(row, cols[:]) < 2 {
+			return true
 		}
+		name, licNum, status, licType := cols[0], cols[1], cols[2], cols[3]
 
 		active := strings.Contains(strings.ToLower(status), "active")
 
@@ -143,6 +148,7 @@ func (s *TexasScraper) LookupByName(ctx context.Context, firstName, lastName str
 			LicenseType:   licType,
 			Status:        status,
 		})
+		return true
 	})
 
 	if len(results) == 0 {
@@ -1,9 +1,6 @@
 package scrapers
 
-import (
-	"context"
-	"strings"
-)
+import "context"
 
 // LicenseResult holds the standardized result from any state DOI lookup.
 type LicenseResult struct {
@@ -26,15 +23,49 @@ type LicenseResult struct {
 	Error           string
 }
 
+// maxNameResults caps how many rows a DOI name search returns, so result slices can be
+// sized up front.
+const maxNameResults = 5
+
 // IsLifeLicensed returns true if the license is active and covers life insurance.
 // Note: "life" substring matching is sufficient for insurance license types.
 // False positives from words like "nightlife" don't occur in DOI/NAIC license fields.
-func (r LicenseResult) IsLifeLicensed() bool {
+func (r *LicenseResult) IsLifeLicensed() bool {
 	if !r.Active {
 		return false
 	}
-	lower := strings.ToLower(r.LicenseType) + " " + strings.ToLower(r.LOAs)
-	return strings.Contains(lower, "life")
+	return containsLife(r.LicenseType) || containsLife(r.LOAs)
+}
+
+// containsLife reports whether s contains "life" in any ASCII case. It scans in place
+// rather than lowercasing, since sweeps call IsLifeLicensed for every result.
+func containsLife(s string) bool {
+	for i := 0; i+4 <= len(s); i++ {
+		if s[i]|0x20 == 'l' && s[i+1]|0x20 == 'i' && s[i+2]|0x20 == 'f' && s[i+3]|0x20 == 'e' {
+			return true
+		}
+	}
+	return false
+}
+
+// BestMatch returns the preferred result from a lookup: the first active, life-licensed
+// result if there is one, otherwise the first active result, or nil. It makes a single
+// pass, remembering the first active fallback while it looks for a life license.
+func BestMatch(results []LicenseResult) *LicenseResult {
+	var fallback *LicenseResult
+	for idx := range results {
+		r := &results[idx]
+		if !r.Found || !r.Active {
+			continue
+		}
+		if r.IsLifeLicensed() {
+			return r
+		}
+		if fallback == nil {
+			fallback = r
+		}
+	}
+	return fallback
 }
 
 // Scraper is the interface every state scraper must implement.
@@ -0,0 +1,85 @@
+package scrapers
+
+import "testing"
+
+func TestBestMatch(t *testing.T) {
+	inactiveLife := LicenseResult{Found: true, LicenseType: "Life"}
+	activeHealth := LicenseResult{Found: true, Active: true, LicenseType: "Health", LicenseNumber: "H1"}
+	activeLife := LicenseResult{Found: true, Active: true, LicenseType: "Life & Health", LicenseNumber: "L1"}
+	activeLifeLOA := LicenseResult{Found: true, Active: true, LicenseType: "Producer", LOAs: "Casualty\nLIFE", LicenseNumber: "L2"}
+	notFoundActive := LicenseResult{Active: true, LicenseType: "Life", LicenseNumber: "X"}
+
+	tests := []struct {
+		name    string
+		results []LicenseResult
+		want    string // LicenseNumber of the match, "" for nil
+	}{
+		{"empty", nil, ""},
+		{"no active results", []LicenseResult{inactiveLife}, ""},
+		{"not-found rows are ignored", []LicenseResult{notFoundActive}, ""},
+		{"active fallback", []LicenseResult{inactiveLife, activeHealth}, "H1"},
+		{"life beats earlier active", []LicenseResult{activeHealth, activeLife}, "L1"},
+		{"first life wins", []LicenseResult{activeLife, activeLifeLOA}, "L1"},
+		{"life via LOAs", []LicenseResult{activeHealth, activeLifeLOA}, "L2"},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := BestMatch(tt.results)
+			switch {
+			case tt.want == "" && got != nil:
+				t.Fatalf("BestMatch = %+v, want nil", *got)
+			case tt.want != "" && got == nil:
+				t.Fatalf("BestMatch = nil, want %s", tt.want)
+			case got != nil && got.LicenseNumber != tt.want:
+				t.Fatalf("BestMatch = %s, want %s", got.LicenseNumber, tt.want)
+			}
+		})
+	}
+}
+
+func TestBestMatchPointsIntoSlice(t *testing.T) {
+	results := []LicenseResult{{Found: true, Active: true, LicenseType: "Life"}}
+	if got := BestMatch(results); got != &results[0] {
+		t.Fatalf("BestMatch returned a copy, want a pointer into results")
+	}
+}
+
+func TestContainsLife(t *testing.T) {
+	tests := []struct {
+		in   string
+		want bool
+	}{
+		{"", false},
+		{"lif", false},
+		{"Life", true},
+		{"LIFE AND HEALTH", true},
+		{"Accident & Health; life", true},
+		{"LiFe", true},
+		{"Health", false},
+		{"L i f e", false},
+		{"Annuity-Life", true},
+	}
+	for _, tt := range tests {
+		if got := containsLife(tt.in); got != tt.want {
+			t.Errorf("containsLife(%q) = %v, want %v", tt.in, got, tt.want)
+		}
+	}
+}
+
+func TestIsLifeLicensed(t *testing.T) {
+	tests := []struct {
+		name string
+		r    LicenseResult
+		want bool
+	}{
+		{"active life type", LicenseResult{Active: true, LicenseType: "Life"}, true},
+		{"active life LOA", LicenseResult{Active: true, LicenseType: "Producer", LOAs: "Property\nLife"}, true},
+		{"inactive life", LicenseResult{LicenseType: "Life"}, false},
+		{"active without life", LicenseResult{Active: true, LicenseType: "Property", LOAs: "Casualty"}, false},
+	}
+	for _, tt := range tests {
+		if got := tt.r.IsLifeLicensed(); got != tt.want {
+			t.Errorf("%s: IsLifeLicensed() = %v, want %v", tt.name, got, tt.want)
+		}
+	}
+}
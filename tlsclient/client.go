@@ -1,26 +1,53 @@
 package tlsclient
 
 import (
+	"net"
+	"sync"
+	"time"
+
 	tls_client "github.com/bogdanfinn/tls-client"
 	tls_client_profiles "github.com/bogdanfinn/tls-client/profiles"
 )
 
 // Client is a factory for creating TLS client sessions with Chrome fingerprints.
-type Client struct{}
+type Client struct {
+	sharedOnce sync.Once
+	shared     tls_client.HttpClient
+	sharedErr  error
+}
 
 // New creates a new TLS client factory.
 func New() *Client {
 	return &Client{}
 }
 
+// Connection pool tuning for every session. The DOI flows make several requests to one
+// host in a row (FL: search page, POST, then up to five detail pages), so keep a few
+// idle connections per host warm and bound the connect phase separately from the
+// overall 90s request timeout.
+const (
+	maxIdleConns        = 32
+	maxIdleConnsPerHost = 8
+	idleConnTimeout     = 75 * time.Second
+	dialTimeout         = 10 * time.Second
+	tcpKeepAlive        = 30 * time.Second
+)
+
 // NewSession creates a fresh HTTP client with an isolated cookie jar and Chrome_124 fingerprint.
 // Each scraper call should get a fresh session for cookie isolation.
 func (c *Client) NewSession() (tls_client.HttpClient, error) {
 	jar := tls_client.NewCookieJar()
+	idleTimeout := idleConnTimeout
 	options := []tls_client.HttpClientOption{
 		tls_client.WithTimeoutSeconds(90),
 		tls_client.WithClientProfile(tls_client_profiles.Chrome_124),
 		tls_client.WithCookieJar(jar),
+		tls_client.WithDialer(net.Dialer{Timeout: dialTimeout, KeepAlive: tcpKeepAlive}),
+		tls_client.WithTransportOptions(&tls_client.TransportOptions{
+			MaxIdleConns:        maxIdleConns,
+			MaxIdleConnsPerHost: maxIdleConnsPerHost,
+			IdleConnTimeout:     &idleTimeout,
+		}),
 	}
 
 	client, err := tls_client.NewHttpClient(nil, options...)
@@ -30,3 +57,20 @@ func (c *Client) NewSession() (tls_client.HttpClient, error) {
 
 	return client, nil
 }
+
+// SharedSession returns a single long-lived client for stateless endpoints (no cookies
+// carried between requests), so keep-alive connections are reused across lookups
+// instead of paying a TCP + TLS handshake on every call.
+func (c *Client) SharedSession() (tls_client.HttpClient, error) {
+	c.sharedOnce.Do(func() {
+		c.shared, c.sharedErr = c.NewSession()
+	})
+	return c.shared, c.sharedErr
+}
+
+// Close releases idle connections held by the shared session.
+func (c *Client) Close() {
+	if c.shared != nil {
+		c.shared.CloseIdleConnections()
+	}
+}